@@ -7,10 +7,13 @@ from unittest import mock
 import jwt
 import pytest
 
+from asgiref.sync import async_to_sync
+from asgiref.testing import ApplicationCommunicator
 from django.urls import resolve, reverse
 from django.contrib.auth.models import User
 from rest_framework.test import APIRequestFactory, force_authenticate
 
+from pinakes.common.asgi import ASGIHandler
 from pinakes.common.auth.keycloak.models import (
     AuthzResource,
     AuthzPermission,
@@ -24,6 +27,13 @@ from pinakes.common.auth.keycloak_django.utils import (
 )
 
 AUTHZ_CLIENT_CLASS = "pinakes.common.auth.keycloak_django.clients.AuthzClient"
+ASYNC_AUTHZ_CLIENT_CLASS = (
+    "pinakes.common.auth.keycloak_django.clients.AsyncAuthzClient"
+)
+SESSION_AUTHENTICATION_CLASS = (
+    "pinakes.common.auth.keycloak_django.authentication"
+    ".KeycloakSessionAuthentication"
+)
 DUMMY_ACCESS_TOKEN = {
     "name": "Fred Sample",
     "preferred_username": "fred",
@@ -75,11 +85,12 @@ def api_request(admin):
         format="json",
         authenticated=True,
         rbac_enabled=False,
+        headers=None,
     ):
         url = reverse(pattern, args=((id,) if id else None))
         view, view_args, view_kwargs = resolve(urllib.parse.urlparse(url)[2])
         request = getattr(APIRequestFactory(), verb)(
-            url, data=data, format=format
+            url, data=data, format=format, **(headers or {})
         )
         request.session = mock.Mock()
         if user and authenticated:
@@ -93,13 +104,52 @@ def api_request(admin):
 
         with authz_client_mock:
             response = view(request, *view_args, **view_kwargs)
-            response.render()
+            if not response.streaming:
+                response.render()
 
         return response
 
     return rf
 
 
+@pytest.fixture
+def asgi_request(admin):
+    """Send a GET request through the ASGI application, return the status,
+    the headers and the body of the response"""
+
+    def rf(pattern, id=None, data=None, user=admin):
+        url = reverse(pattern, args=((id,) if id else None))
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": url,
+            "query_string": urllib.parse.urlencode(data or {}).encode(),
+            "headers": [],
+        }
+        access_token = jwt.encode(DUMMY_ACCESS_TOKEN, "", algorithm="none")
+
+        async def communicate():
+            communicator = ApplicationCommunicator(ASGIHandler(), scope)
+            await communicator.send_input({"type": "http.request"})
+            start = await communicator.receive_output(timeout=5)
+            body = b""
+            while True:
+                message = await communicator.receive_output(timeout=5)
+                body += message.get("body", b"")
+                if not message.get("more_body"):
+                    break
+            await communicator.wait()
+            return start["status"], dict(start["headers"]), body
+
+        with mock.patch(
+            SESSION_AUTHENTICATION_CLASS + ".authenticate",
+            return_value=(user, access_token),
+        ), patch_authz_client():
+            return async_to_sync(communicate)()
+
+    return rf
+
+
 @pytest.fixture
 def media_dir():
     base_dir = os.path.dirname(__file__)
@@ -156,5 +206,19 @@ class AuthzClientMock:
         return True
 
 
+class AsyncAuthzClientMock(AuthzClientMock):
+    async def get_permissions(self, permissions=None):
+        return super().get_permissions(permissions)
+
+    async def check_permissions(self, permissions=None) -> bool:
+        return super().check_permissions(permissions)
+
+
+@contextlib.contextmanager
 def patch_authz_client():
-    return mock.patch(AUTHZ_CLIENT_CLASS, return_value=AuthzClientMock())
+    with mock.patch(
+        AUTHZ_CLIENT_CLASS, return_value=AuthzClientMock()
+    ), mock.patch(
+        ASYNC_AUTHZ_CLIENT_CLASS, return_value=AsyncAuthzClientMock()
+    ):
+        yield
@@ -0,0 +1,107 @@
+"""ASGI handler serving streaming responses from threads."""
+import asyncio
+import threading
+
+import django
+from asgiref.sync import sync_to_async
+from django.core.handlers import asgi
+from django.db import connections
+from django.http import FileResponse
+
+_END = object()
+
+
+class ASGIRequest(asgi.ASGIRequest):
+    """Request served by the ASGIHandler, which streams responses without
+    holding a worker thread of the application"""
+
+
+class ASGIHandler(asgi.ASGIHandler):
+    """ASGI handler iterating streaming responses in a thread.
+
+    Django 4.0 iterates a streaming response in the event loop, where the
+    iterator can neither query the database nor wait for a Redis message
+    without stalling every request of the worker. The content of a
+    streaming response is produced in a thread of its own instead, and
+    sent from the event loop as it comes. File responses only read a file
+    and are left to Django.
+    """
+
+    request_class = ASGIRequest
+
+    async def send_response(self, response, send):
+        if not response.streaming or isinstance(response, FileResponse):
+            await super().send_response(response, send)
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": self._get_headers(response),
+            }
+        )
+
+        loop = asyncio.get_running_loop()
+        parts = asyncio.Queue()
+        stopped = threading.Event()
+        errors = []
+
+        def produce():
+            try:
+                for part in response:
+                    loop.call_soon_threadsafe(parts.put_nowait, part)
+                    if stopped.is_set():
+                        break
+            except Exception as error:
+                errors.append(error)
+            finally:
+                # The database connections of the thread are not reused
+                connections.close_all()
+                loop.call_soon_threadsafe(parts.put_nowait, _END)
+
+        # A new thread starts with an empty context, and so with database
+        # connections of its own
+        threading.Thread(target=produce, daemon=True).start()
+        try:
+            while (part := await parts.get()) is not _END:
+                for chunk, _ in self.chunk_bytes(part):
+                    await send(
+                        {
+                            "type": "http.response.body",
+                            "body": chunk,
+                            "more_body": True,
+                        }
+                    )
+        finally:
+            stopped.set()
+        if errors:
+            raise errors[0]
+
+        await send({"type": "http.response.body"})
+        await sync_to_async(response.close, thread_sensitive=True)()
+
+    @staticmethod
+    def _get_headers(response):
+        headers = []
+        for header, value in response.items():
+            if isinstance(header, str):
+                header = header.encode("ascii")
+            if isinstance(value, str):
+                value = value.encode("latin1")
+            headers.append((bytes(header), bytes(value)))
+        for cookie in response.cookies.values():
+            headers.append(
+                (
+                    b"Set-Cookie",
+                    cookie.output(header="").encode("ascii").strip(),
+                )
+            )
+        return headers
+
+
+def get_asgi_application():
+    """Same as django.core.asgi.get_asgi_application, with the handler
+    serving streaming responses from threads"""
+    django.setup(set_prefix=False)
+    return ASGIHandler()
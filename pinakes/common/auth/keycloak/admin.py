@@ -1,4 +1,5 @@
-from typing import Optional, List, Iterator, Union
+from collections import deque
+from typing import Optional, List, Iterator, Tuple, Union
 
 from . import constants
 from . import models
@@ -24,14 +25,82 @@ class AdminClient:
         self._client = ApiClient(token=token, verify_ssl=verify_ssl)
 
     def list_groups(
-        self, *, brief_representation: bool = True
+        self,
+        *,
+        brief_representation: bool = True,
+        first: Optional[int] = None,
+        max_prefetch: Optional[int] = None,
     ) -> List[models.Group]:
         path = GROUPS_PATH.format(realm=self._realm)
         params = {"briefRepresentation": brief_representation}
+        if first is not None:
+            params["first"] = first
+        if max_prefetch is not None:
+            params["max"] = max_prefetch
         url = f"{self._server_url}/{path}"
         items = self._client.request_json("GET", url, params=params)
         return [models.Group.parse_obj(item) for item in items]
 
+    def list_subgroups(
+        self,
+        group_id: str,
+        first: int,
+        max_prefetch: int,
+        *,
+        brief_representation: bool = True,
+    ) -> List[models.Group]:
+        path = constants.GROUP_CHILDREN_PATH.format(
+            realm=self._realm, id=group_id
+        )
+        params = {
+            "first": first,
+            "max": max_prefetch,
+            "briefRepresentation": brief_representation,
+        }
+        url = f"{self._server_url}/{path}"
+        items = self._client.request_json("GET", url, params=params)
+        return [models.Group.parse_obj(item) for item in items]
+
+    def iter_groups(
+        self,
+        *,
+        brief_representation: bool = True,
+        max_prefetch: int = 100,
+    ) -> Iterator[Tuple[Optional[str], models.Group]]:
+        """Iterate over the realm group hierarchy in breadth-first order.
+
+        Groups are fetched one page and one hierarchy level at a time
+        and yielded as ``(parent_id, group)`` pairs, so a parent is
+        always yielded before its subgroups. Only ids of groups that
+        have subgroups are kept between pages.
+        """
+        queue = deque([None])
+        while queue:
+            parent_id = queue.popleft()
+            first = 0
+            while True:
+                if parent_id is None:
+                    groups = self.list_groups(
+                        brief_representation=brief_representation,
+                        first=first,
+                        max_prefetch=max_prefetch,
+                    )
+                else:
+                    groups = self.list_subgroups(
+                        parent_id,
+                        first,
+                        max_prefetch,
+                        brief_representation=brief_representation,
+                    )
+                for group in groups:
+                    if group.sub_group_count != 0:
+                        queue.append(group.id)
+                    group.sub_groups = None
+                    yield parent_id, group
+                if len(groups) < max_prefetch:
+                    break
+                first += len(groups)
+
     def iter_group_members(
         self, group_id: str, max_prefetch: int = 100
     ) -> Iterator[models.User]:
@@ -1,6 +1,6 @@
 from typing import Optional, Iterable, List, Union, Any, Dict
 
-from .client import ApiClient
+from .client import ApiClient, AsyncApiClient
 from .common import (
     Uma2ConfigurationPolicyProto,
     DefaultUma2ConfigurationPolicy,
@@ -78,17 +78,92 @@ class AuthzClient:
         permissions: Optional[PermissionsQuery],
         params: Dict[str, Any],
     ) -> Any:
-        data = {
-            "grant_type": constants.UMA_TICKET_GRANT,
-            "audience": self._client_id,
-            **params,
-        }
-        if permissions:
-            if isinstance(permissions, models.AuthzPermission):
-                permissions = [permissions]
-            data["permission"] = [str(p) for p in permissions]
         return self._client.request_json(
             "POST",
             self.uma2_configuration().token_endpoint,
-            data=data,
+            data=_permissions_data(self._client_id, permissions, params),
+        )
+
+
+class AsyncAuthzClient:
+    """Non-blocking variant of AuthzClient.
+
+    The UMA2 configuration policy is called synchronously, it should not
+    make requests (e.g. ManualUma2ConfigurationPolicy).
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        realm: str,
+        client_id: str,
+        token: Optional[str] = None,
+        *,
+        uma2_policy: Uma2ConfigurationPolicyProto,
+        verify_ssl: Union[bool, str] = True,
+    ):
+        self._server_url = server_url.rstrip("/")
+        self._realm = realm
+        self._client_id = client_id
+        self._uma2_policy = uma2_policy
+        self._uma2_configuration = None
+
+        self._client = AsyncApiClient(token=token, verify_ssl=verify_ssl)
+
+    def uma2_configuration(self) -> models.Uma2Configuration:
+        if self._uma2_configuration is None:
+            self._uma2_configuration = self._uma2_policy.uma2_configuration()
+        return self._uma2_configuration
+
+    async def get_permissions(
+        self, permissions: Optional[PermissionsQuery] = None
+    ) -> List[models.AuthzResource]:
+        params = {
+            "response_mode": constants.AUTHZ_RESPONSE_MODE_PERMISSIONS,
+            "response_include_resource_name": True,
+        }
+        try:
+            response = await self._request_permissions(permissions, params)
+        except exceptions.Forbidden:
+            return []
+
+        return [models.AuthzResource.parse_obj(p) for p in response]
+
+    async def check_permissions(
+        self, permissions: Optional[PermissionsQuery] = None
+    ) -> bool:
+        params = {"response_mode": constants.AUTHZ_RESPONSE_MODE_DECISION}
+        try:
+            response = await self._request_permissions(permissions, params)
+        except exceptions.Forbidden:
+            return False
+
+        return response["result"]
+
+    async def _request_permissions(
+        self,
+        permissions: Optional[PermissionsQuery],
+        params: Dict[str, Any],
+    ) -> Any:
+        return await self._client.request_json(
+            "POST",
+            self.uma2_configuration().token_endpoint,
+            data=_permissions_data(self._client_id, permissions, params),
         )
+
+
+def _permissions_data(
+    client_id: str,
+    permissions: Optional[PermissionsQuery],
+    params: Dict[str, Any],
+) -> Dict[str, Any]:
+    data = {
+        "grant_type": constants.UMA_TICKET_GRANT,
+        "audience": client_id,
+        **params,
+    }
+    if permissions:
+        if isinstance(permissions, models.AuthzPermission):
+            permissions = [permissions]
+        data["permission"] = [str(p) for p in permissions]
+    return data
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, Optional, Union
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any, Coroutine, Mapping, Optional, TypeVar, Union
 
+import httpx
 import requests
 
+from pinakes.common import profiling
+
 from . import exceptions
 
+T = TypeVar("T")
+
+# Limits of the HTTP connection pool shared by the async clients
+ASYNC_MAX_CONNECTIONS = 100
+ASYNC_TIMEOUT = 30.0
+
 
 class ApiClient:
     def __init__(
@@ -31,14 +44,15 @@ class ApiClient:
             headers_out["Authorization"] = f"Bearer {self.token}"
         if headers:
             headers_out.update(headers)
-        response = self._session.request(
-            method,
-            url,
-            params=params,
-            data=data,
-            headers=headers_out,
-            json=json,
-        )
+        with profiling.measure(profiling.KEYCLOAK):
+            response = self._session.request(
+                method,
+                url,
+                params=params,
+                data=data,
+                headers=headers_out,
+                json=json,
+            )
 
         try:
             response.raise_for_status()
@@ -70,17 +84,155 @@ class ApiClient:
         ).json()
 
     def exception_handler(self, e: requests.HTTPError):
-        error = None
-        error_description = None
+        _raise_http_error(e)
+
+
+class AsyncApiClient:
+    """Non-blocking variant of ApiClient.
+
+    The requests of all the async clients of an event loop go through a
+    shared httpx.AsyncClient, so connections to Keycloak are pooled.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        verify_ssl: Union[bool, str] = True,
+        *,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.token = token
+        self.verify_ssl = verify_ssl
+        self._http_client = http_client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Any = None,
+        headers: Mapping[str, str] = None,
+        data: Any = None,
+        json: Any = None,
+    ) -> httpx.Response:
+        headers_out = {}
+        if self.token:
+            headers_out["Authorization"] = f"Bearer {self.token}"
+        if headers:
+            headers_out.update(headers)
+        http_client = self._http_client or get_async_http_client(
+            self.verify_ssl
+        )
+        with profiling.measure(profiling.KEYCLOAK):
+            response = await http_client.request(
+                method,
+                url,
+                params=params,
+                data=data,
+                headers=headers_out,
+                json=json,
+            )
+
         try:
-            data = e.response.json()
-        except ValueError:
-            pass
-        else:
-            if isinstance(data, dict):
-                error = data.get("error")
-                error_description = data.get("error_description")
-
-        status_code = e.response.status_code
-        exception_cls = exceptions.get_http_exception_class(status_code)
-        raise exception_cls(error, error_description, status_code) from e
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            self.exception_handler(e)
+
+        return response
+
+    async def request_json(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Any = None,
+        headers: Mapping[str, str] = None,
+        data: Any = None,
+        json: Any = None,
+    ):
+        headers_out = {"Accept": "application/json"}
+        if headers:
+            headers_out.update(headers)
+        response = await self.request(
+            method,
+            url,
+            params=params,
+            headers=headers_out,
+            data=data,
+            json=json,
+        )
+        return response.json()
+
+    def exception_handler(self, e: httpx.HTTPStatusError):
+        _raise_http_error(e)
+
+
+def _raise_http_error(e: Union[requests.HTTPError, httpx.HTTPStatusError]):
+    error = None
+    error_description = None
+    try:
+        data = e.response.json()
+    except ValueError:
+        pass
+    else:
+        if isinstance(data, dict):
+            error = data.get("error")
+            error_description = data.get("error_description")
+
+    status_code = e.response.status_code
+    exception_cls = exceptions.get_http_exception_class(status_code)
+    raise exception_cls(error, error_description, status_code) from e
+
+
+_async_http_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_http_client(verify_ssl: Union[bool, str]) -> httpx.AsyncClient:
+    """Return the pooled HTTP client of the running event loop"""
+    clients = _async_http_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(verify_ssl)
+    if client is None:
+        client = clients[verify_ssl] = httpx.AsyncClient(
+            verify=verify_ssl,
+            limits=httpx.Limits(max_connections=ASYNC_MAX_CONNECTIONS),
+            timeout=ASYNC_TIMEOUT,
+        )
+    return client
+
+
+_loop = None
+_loop_pid = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _loop_pid
+    with _loop_lock:
+        # The thread running the loop does not survive a fork
+        if _loop is None or _loop_pid != os.getpid():
+            _loop = asyncio.new_event_loop()
+            _loop_pid = os.getpid()
+            threading.Thread(
+                target=_loop.run_forever, name="keycloak-client", daemon=True
+            ).start()
+        return _loop
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Wait for the result of async client calls from sync code.
+
+    The calls run on an event loop of the process shared by all threads,
+    so concurrent calls are multiplexed over its pooled connections.
+    Must not be called from a coroutine, which should await instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coroutine.close()
+        raise RuntimeError("run_sync() called from a running event loop")
+
+    return asyncio.run_coroutine_threadsafe(
+        coroutine, _background_loop()
+    ).result()
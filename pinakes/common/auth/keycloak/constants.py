@@ -18,6 +18,7 @@ CLIENT_CREDENTIALS_GRANT = "client_credentials"
 REFRESH_TOKEN_GRANT = "refresh_token"
 SESSION_LOGOUT_PATH = "realms/{realm}/protocol/openid-connect/logout"
 GROUP_MEMBERS_PATH = "admin/realms/{realm}/groups/{id}/members"
+GROUP_CHILDREN_PATH = "admin/realms/{realm}/groups/{id}/children"
 
 UMA_TICKET_GRANT = "urn:ietf:params:oauth:grant-type:uma-ticket"
 
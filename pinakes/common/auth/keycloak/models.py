@@ -34,6 +34,7 @@ class Group(ApiModelBase):
     name: Optional[str] = None
     path: Optional[str] = None
     sub_groups: Optional[List[Group]] = None
+    sub_group_count: Optional[int] = None
     realm_roles: Optional[List[str]] = None
     client_roles: Optional[Dict[str, List[str]]] = None
 
@@ -98,6 +98,86 @@ def test_list_groups(api_client):
     ]
 
 
+def test_list_groups_paginated(api_client):
+    client = AdminClient(SERVER_URL, REALM, TOKEN)
+    api_client.request_json.return_value = []
+
+    client.list_groups(first=10, max_prefetch=5)
+
+    params = {"briefRepresentation": True, "first": 10, "max": 5}
+    api_client.request_json.assert_called_with(
+        "GET",
+        f"{SERVER_URL}/admin/realms/{REALM}/groups",
+        params=params,
+    )
+
+
+def test_list_subgroups(api_client):
+    client = AdminClient(SERVER_URL, REALM, TOKEN)
+    group_id = "87bd0889-2ae0-45c5-9d27-a58b7cb728f7"
+    api_client.request_json.return_value = [
+        {
+            "id": "5d618a85-0fe6-479a-895e-6612de58b967",
+            "name": "test-group-03",
+            "path": "/test-group-02/test-group-03",
+            "subGroupCount": 0,
+        }
+    ]
+
+    groups = client.list_subgroups(group_id, 0, 10, brief_representation=False)
+
+    params = {"first": 0, "max": 10, "briefRepresentation": False}
+    api_client.request_json.assert_called_with(
+        "GET",
+        f"{SERVER_URL}/admin/realms/{REALM}/groups/{group_id}/children",
+        params=params,
+    )
+    assert groups == [
+        models.Group(
+            id="5d618a85-0fe6-479a-895e-6612de58b967",
+            name="test-group-03",
+            path="/test-group-02/test-group-03",
+            sub_group_count=0,
+        )
+    ]
+
+
+def test_iter_groups(api_client):
+    client = AdminClient(SERVER_URL, REALM, TOKEN)
+
+    api_client.request_json.side_effect = [
+        # Top level, first page
+        [
+            {"id": "g1", "name": "g1", "path": "/g1", "subGroupCount": 1},
+            {"id": "g2", "name": "g2", "path": "/g2", "subGroupCount": 0},
+        ],
+        # Top level, second page
+        [],
+        # Subgroups of g1
+        [
+            {
+                "id": "g3",
+                "name": "g3",
+                "path": "/g1/g3",
+                "subGroupCount": 0,
+            },
+        ],
+    ]
+
+    groups = [
+        (parent_id, group.id)
+        for parent_id, group in client.iter_groups(max_prefetch=2)
+    ]
+
+    assert groups == [(None, "g1"), (None, "g2"), ("g1", "g3")]
+    calls = api_client.request_json.call_args_list
+    assert len(calls) == 3
+    assert calls[1].kwargs["params"]["first"] == 2
+    assert calls[2].args[1] == (
+        f"{SERVER_URL}/admin/realms/{REALM}/groups/g1/children"
+    )
+
+
 def test_iter_group_members_invalid_id(api_client):
     client = AdminClient(SERVER_URL, REALM, TOKEN)
     group_id = "does-not-exist"
@@ -3,7 +3,8 @@ from unittest import mock
 import pytest
 
 from pinakes.common.auth.keycloak import models, exceptions
-from pinakes.common.auth.keycloak.authz import AuthzClient
+from pinakes.common.auth.keycloak.authz import AsyncAuthzClient, AuthzClient
+from pinakes.common.auth.keycloak.client import run_sync
 from pinakes.common.auth.keycloak.common import (
     ManualUma2ConfigurationPolicy,
 )
@@ -198,3 +199,54 @@ def test_check_permissions_forbidden(api_client, authz_client):
             "permission": ["resource-a#scope-a"],
         },
     )
+
+
+@pytest.fixture
+def async_api_client(mocker):
+    client_mock = mock.Mock()
+    client_mock.request_json = mock.AsyncMock()
+    mocker.patch(
+        "pinakes.common.auth.keycloak.authz.AsyncApiClient",
+        return_value=client_mock,
+    )
+    return client_mock
+
+
+@pytest.fixture
+def async_authz_client(async_api_client):
+    uma2_policy = ManualUma2ConfigurationPolicy(SERVER_URL, REALM)
+    return AsyncAuthzClient(
+        SERVER_URL,
+        REALM,
+        CLIENT_ID,
+        TOKEN,
+        uma2_policy=uma2_policy,
+    )
+
+
+def test_async_check_permissions(async_api_client, async_authz_client):
+    async_api_client.request_json.return_value = {"result": True}
+
+    result = run_sync(
+        async_authz_client.check_permissions(
+            models.AuthzPermission("resource-a", "scope-a")
+        )
+    )
+
+    assert result is True
+    async_api_client.request_json.assert_awaited_once_with(
+        "POST",
+        f"{SERVER_URL}/realms/{REALM}/protocol/openid-connect/token",
+        data={
+            "grant_type": "urn:ietf:params:oauth:grant-type:uma-ticket",
+            "audience": CLIENT_ID,
+            "response_mode": "decision",
+            "permission": ["resource-a#scope-a"],
+        },
+    )
+
+
+def test_async_get_permissions_forbidden(async_api_client, async_authz_client):
+    async_api_client.request_json.side_effect = exceptions.Forbidden()
+
+    assert run_sync(async_authz_client.get_permissions()) == []
@@ -1,10 +1,17 @@
+import asyncio
 from unittest import mock
 
+import httpx
 import pytest
 import requests
 
 from pinakes.common.auth.keycloak import exceptions
-from pinakes.common.auth.keycloak.client import ApiClient
+from pinakes.common.auth.keycloak.client import (
+    ApiClient,
+    AsyncApiClient,
+    get_async_http_client,
+    run_sync,
+)
 
 
 @pytest.fixture
@@ -185,3 +192,63 @@ def test_api_client_exception_with_error_description(session):
     with pytest.raises(exceptions.HttpError) as excinfo:
         client.request_json("GET", "https://example-9.com")
     assert str(excinfo.value) == "invalid request: unknown error (status: 400)"
+
+
+def _async_client(handler, **kwargs):
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncApiClient(http_client=http_client, **kwargs)
+
+
+def test_async_api_client_request_json():
+    def handler(request):
+        assert request.headers["Authorization"] == "Bearer TOKENVALUE"
+        assert request.headers["Accept"] == "application/json"
+        assert request.content == b"grant_type=test"
+        return httpx.Response(200, json={"result": True})
+
+    client = _async_client(handler, token="TOKENVALUE")
+    result = run_sync(
+        client.request_json(
+            "POST", "https://example.com/", data={"grant_type": "test"}
+        )
+    )
+
+    assert result == {"result": True}
+
+
+def test_async_api_client_exception_with_error():
+    def handler(request):
+        return httpx.Response(
+            403,
+            json={"error": "access_denied", "error_description": "Denied"},
+        )
+
+    client = _async_client(handler)
+    with pytest.raises(exceptions.Forbidden) as exc_info:
+        run_sync(client.request("GET", "https://example.com/"))
+
+    assert exc_info.value.error == "access_denied"
+    assert exc_info.value.error_description == "Denied"
+
+
+def test_async_http_client_shared_per_loop():
+    async def get_clients():
+        return (
+            get_async_http_client(True),
+            get_async_http_client(True),
+            get_async_http_client(False),
+        )
+
+    first, second, other = run_sync(get_clients())
+
+    assert first is second
+    assert first is not other
+    assert run_sync(get_clients())[0] is first
+
+
+def test_run_sync_in_event_loop():
+    async def nested():
+        run_sync(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(nested())
@@ -4,7 +4,7 @@ from pinakes.common.auth.keycloak.admin import (
     create_admin_client,
     AdminClient,
 )
-from pinakes.common.auth.keycloak.authz import AuthzClient
+from pinakes.common.auth.keycloak.authz import AsyncAuthzClient, AuthzClient
 from pinakes.common.auth.keycloak.openid import OpenIdConnect
 from pinakes.common.auth.keycloak.uma import (
     create_uma_client,
@@ -19,6 +19,7 @@ __all__ = (
     "get_admin_client",
     "get_uma_client",
     "get_authz_client",
+    "get_async_authz_client",
     "get_oidc_client",
 )
 
@@ -59,6 +60,19 @@ def get_authz_client(access_token: str) -> AuthzClient:
     )
 
 
+def get_async_authz_client(access_token: str) -> AsyncAuthzClient:
+    server_url = settings.KEYCLOAK_URL
+    realm = settings.KEYCLOAK_REALM
+    return AsyncAuthzClient(
+        server_url=server_url,
+        realm=realm,
+        client_id=settings.KEYCLOAK_CLIENT_ID,
+        token=access_token,
+        uma2_policy=ManualUma2ConfigurationPolicy(server_url, realm),
+        verify_ssl=settings.KEYCLOAK_VERIFY_SSL,
+    )
+
+
 def get_oidc_client() -> OpenIdConnect:
     oidc_client = OpenIdConnect(
         settings.KEYCLOAK_URL,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import enum
 from dataclasses import dataclass
 from typing import (
@@ -14,6 +15,7 @@ from typing import (
     Tuple,
 )
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.db import models
 
@@ -25,8 +27,12 @@ from rest_framework.permissions import (
 )
 
 from pinakes.common.auth.keycloak import models as keycloak_models
+from pinakes.common.auth.keycloak.client import run_sync
 from pinakes.common.auth.keycloak_django import AbstractKeycloakResource
-from pinakes.common.auth.keycloak_django.clients import get_authz_client
+from pinakes.common.auth.keycloak_django.clients import (
+    get_async_authz_client,
+    get_authz_client,
+)
 from pinakes.common.auth.keycloak_django.utils import (
     make_scope_name,
     make_resource_name,
@@ -70,6 +76,10 @@ class BaseKeycloakPermission(_BasePermission):
       - `perform_check_object_permission`
       - `perform_scope_queryset`
 
+    Overriding `aperform_check_object_permission` as well and setting
+    `async_object_checks` lets `get_user_capabilities` run the object
+    permission checks concurrently with the async Keycloak client.
+
     These methods are called from the `has_permission`,
     `has_object_permission` and `scope_queryset` methods of
     the permission class respectively, that implement common logic for
@@ -80,6 +90,9 @@ class BaseKeycloakPermission(_BasePermission):
     """
 
     access_policies: ClassVar[KeycloakPoliciesMap] = {}
+    # Whether `get_objects_user_capabilities` checks the objects with
+    # `aperform_check_object_permission`
+    async_object_checks: ClassVar[bool] = False
 
     def get_access_policies(
         self, request: Request, view: Any
@@ -123,30 +136,54 @@ class BaseKeycloakPermission(_BasePermission):
         Returns a mapping of actions and respective permission
         evaluation results.
         """
-        permissions = {}
-        action_permissions = {}
-
-        policies = (
-            item
-            for item in _iter_access_policies(
-                self.get_access_policies(request, view)
-            )
-            if item[1].type == KeycloakPolicy.Type.OBJECT
-        )
+        return self.get_objects_user_capabilities(request, view, [obj])[0]
 
-        for action, policy in policies:
-            permissions[policy.permission] = None
-            action_permissions[action] = policy.permission
+    def get_objects_user_capabilities(
+        self, request: Request, view: Any, objs: Sequence[Any]
+    ) -> List[Dict[str, bool]]:
+        """Evaluates `get_user_capabilities` for many objects.
 
-        for permission in permissions:
-            permissions[permission] = self.perform_check_object_permission(
-                permission, request, view, obj
+        With `async_object_checks` set, the checks of all objects run
+        concurrently.
+        """
+        action_permissions = {
+            action: policy.permission
+            for action, policy in _iter_access_policies(
+                self.get_access_policies(request, view)
             )
-
-        return {
-            action: permissions[permission]
-            for action, permission in action_permissions.items()
+            if policy.type == KeycloakPolicy.Type.OBJECT
         }
+        permissions = list(dict.fromkeys(action_permissions.values()))
+
+        if self.async_object_checks:
+            results = run_sync(
+                self._acheck_object_permissions(
+                    permissions,
+                    request,
+                    view,
+                    [self.get_permission_object(obj) for obj in objs],
+                )
+            )
+        else:
+            results = [
+                self.perform_check_object_permission(
+                    permission, request, view, obj
+                )
+                for obj in objs
+                for permission in permissions
+            ]
+
+        granted = iter(results)
+        capabilities = []
+        for _obj in objs:
+            checked = {permission: next(granted) for permission in permissions}
+            capabilities.append(
+                {
+                    action: checked[permission]
+                    for action, permission in action_permissions.items()
+                }
+            )
+        return capabilities
 
     def has_permission(self, request: Request, view: Any) -> bool:
         if is_drf_renderer_request(request, view):
@@ -208,6 +245,45 @@ class BaseKeycloakPermission(_BasePermission):
         Called for requests that match `QUERYSET` policy type."""
         return qs
 
+    def get_permission_object(self, obj: Any) -> Any:
+        """Returns the object the async object permission checks apply to.
+
+        Called before `aperform_check_object_permission`, which must not
+        query the database, e.g. to load a related object."""
+        return obj
+
+    async def aperform_check_object_permission(
+        self,
+        permission: str,
+        request: Request,
+        view: Any,
+        obj: Any,
+    ) -> bool:
+        """Async variant of `perform_check_object_permission`.
+
+        Receives the object returned by `get_permission_object`. Runs
+        `perform_check_object_permission` in a thread by default."""
+        return await sync_to_async(self.perform_check_object_permission)(
+            permission, request, view, obj
+        )
+
+    async def _acheck_object_permissions(
+        self,
+        permissions: Sequence[str],
+        request: Request,
+        view: Any,
+        objs: Sequence[Any],
+    ) -> List[bool]:
+        return await asyncio.gather(
+            *(
+                self.aperform_check_object_permission(
+                    permission, request, view, obj
+                )
+                for obj in objs
+                for permission in permissions
+            )
+        )
+
 
 def is_drf_renderer_request(request: Request, view: Any):
     """Checks if a request is intended for the DRF Browsable Renderer.
@@ -224,14 +300,18 @@ def is_drf_renderer_request(request: Request, view: Any):
 def check_wildcard_permission(
     resource_type: str, permission: str, request: Request
 ) -> bool:
-    scope = make_scope_name(resource_type, permission)
-    resource = make_resource_name(resource_type, WILDCARD_RESOURCE_ID)
     client = get_authz_client(request.auth)
     return client.check_permissions(
-        keycloak_models.AuthzPermission(
-            resource=resource,
-            scope=scope,
-        )
+        _wildcard_permission(resource_type, permission)
+    )
+
+
+async def acheck_wildcard_permission(
+    resource_type: str, permission: str, request: Request
+) -> bool:
+    client = get_async_authz_client(request.auth)
+    return await client.check_permissions(
+        _wildcard_permission(resource_type, permission)
     )
 
 
@@ -241,17 +321,43 @@ def check_resource_permission(
     permission: str,
     request: Request,
 ) -> bool:
-    scope = make_scope_name(resource_type, permission)
-    wildcard_permission = keycloak_models.AuthzPermission(
-        resource=make_resource_name(resource_type, WILDCARD_RESOURCE_ID),
-        scope=scope,
+    client = get_authz_client(request.auth)
+    return client.check_permissions(
+        _resource_permissions(resource_type, resource_name, permission)
     )
-    object_permission = keycloak_models.AuthzPermission(
-        resource=resource_name,
-        scope=scope,
+
+
+async def acheck_resource_permission(
+    resource_type: str,
+    resource_name: str,
+    permission: str,
+    request: Request,
+) -> bool:
+    client = get_async_authz_client(request.auth)
+    return await client.check_permissions(
+        _resource_permissions(resource_type, resource_name, permission)
     )
-    client = get_authz_client(request.auth)
-    return client.check_permissions([wildcard_permission, object_permission])
+
+
+def _wildcard_permission(
+    resource_type: str, permission: str
+) -> keycloak_models.AuthzPermission:
+    return keycloak_models.AuthzPermission(
+        resource=make_resource_name(resource_type, WILDCARD_RESOURCE_ID),
+        scope=make_scope_name(resource_type, permission),
+    )
+
+
+def _resource_permissions(
+    resource_type: str, resource_name: str, permission: str
+) -> List[keycloak_models.AuthzPermission]:
+    return [
+        _wildcard_permission(resource_type, permission),
+        keycloak_models.AuthzPermission(
+            resource=resource_name,
+            scope=make_scope_name(resource_type, permission),
+        ),
+    ]
 
 
 def check_object_permission(
@@ -269,6 +375,21 @@ def check_object_permission(
         )
 
 
+async def acheck_object_permission(
+    obj: AbstractKeycloakResource,
+    permission: str,
+    request: Request,
+):
+    if obj.keycloak_id:
+        return await acheck_resource_permission(
+            obj.keycloak_type(), obj.keycloak_name(), permission, request
+        )
+    else:
+        return await acheck_wildcard_permission(
+            obj.keycloak_type(), permission, request
+        )
+
+
 @dataclass(frozen=True)
 class PermittedResourcesResult:
     items: List[str]
@@ -284,7 +405,24 @@ def get_permitted_resources(
             scope=make_scope_name(resource_type, permission)
         )
     )
+    return _permitted_resources(resource_type, permissions)
+
 
+async def aget_permitted_resources(
+    resource_type: str, permission: str, request: Request
+) -> PermittedResourcesResult:
+    client = get_async_authz_client(request.auth)
+    permissions = await client.get_permissions(
+        keycloak_models.AuthzPermission(
+            scope=make_scope_name(resource_type, permission)
+        )
+    )
+    return _permitted_resources(resource_type, permissions)
+
+
+def _permitted_resources(
+    resource_type: str, permissions: List[keycloak_models.AuthzResource]
+) -> PermittedResourcesResult:
     is_wildcard = False
     resource_ids = []
     for item in permissions:
@@ -1,3 +1,4 @@
+import asyncio
 from unittest import mock
 
 import pytest
@@ -120,3 +121,71 @@ def _test_user_capabilities(perform_check_object_permission, expected_result):
         ],
         any_order=True,
     )
+
+
+class AsyncUserCapabilitiesPermission(UserCapabilitiesPermission):
+    async_object_checks = True
+
+    def get_permission_object(self, obj):
+        return obj.portfolio
+
+    async def aperform_check_object_permission(
+        self, permission, request, view, obj
+    ):
+        # All the checks are started before any of them completes
+        self.started += 1
+        await asyncio.sleep(0.01)
+        self.concurrent = max(self.concurrent, self.started)
+        return permission in obj.granted
+
+
+def test_objects_user_capabilities_async():
+    request = mock.Mock(name="request")
+    request.method = "GET"
+    view = mock.Mock(name="view", action="list")
+    objs = [
+        mock.Mock(portfolio=mock.Mock(granted={"read"})),
+        mock.Mock(portfolio=mock.Mock(granted={"read", "update", "delete"})),
+    ]
+
+    permission = AsyncUserCapabilitiesPermission()
+    permission.started = permission.concurrent = 0
+    result = permission.get_objects_user_capabilities(request, view, objs)
+
+    assert result == [
+        {
+            "retrieve": True,
+            "update": False,
+            "partial_update": False,
+            "remove": False,
+        },
+        {
+            "retrieve": True,
+            "update": True,
+            "partial_update": True,
+            "remove": True,
+        },
+    ]
+    assert permission.concurrent == 6
+
+
+@mock.patch.object(
+    UserCapabilitiesPermission, "perform_check_object_permission"
+)
+def test_aperform_check_object_permission_default(
+    perform_check_object_permission,
+):
+    perform_check_object_permission.return_value = True
+    request = mock.Mock(name="request")
+    view = mock.Mock(name="view")
+    obj = mock.Mock(name="obj")
+
+    permission = UserCapabilitiesPermission()
+    result = asyncio.run(
+        permission.aperform_check_object_permission("read", request, view, obj)
+    )
+
+    assert result is True
+    perform_check_object_permission.assert_called_once_with(
+        "read", request, view, obj
+    )
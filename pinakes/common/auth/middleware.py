@@ -1,7 +1,10 @@
+import time
 from typing import Optional
 
+from django.conf import settings
 from django.contrib import auth as django_auth
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.http import HttpRequest
 
@@ -16,6 +19,10 @@ import logging
 logger = logging.getLogger(__name__)
 
 KEYCLOAK_PROVIDER = "keycloak-oidc"
+# Session key of the cached keycloak UserSocialAuth row
+SESSION_KEY = "_keycloak_auth"
+REFRESH_LOCK_KEY = "keycloak-refresh:{}"
+REFRESH_LOCK_POLL_INTERVAL = 0.05
 
 
 class TokenRefreshError(Exception):
@@ -23,6 +30,15 @@ class TokenRefreshError(Exception):
 
 
 class KeycloakAuthMiddleware:
+    """Attach the keycloak social auth of the user to the request.
+
+    The social auth row is cached in the session, so a request with an
+    unexpired access token needs neither a query nor a call to Keycloak.
+    An expired token is refreshed under a per-user lock in the cache: the
+    concurrent requests of the user wait for the first one to refresh it
+    and then reuse the new token.
+    """
+
     __slots__ = ("get_response",)
 
     def __init__(self, get_response):
@@ -30,7 +46,7 @@ class KeycloakAuthMiddleware:
 
     def __call__(self, request: HttpRequest):
         try:
-            request.keycloak_user = self._process_keycloak_user(request.user)
+            request.keycloak_user = self._process_keycloak_user(request)
         except TokenRefreshError:
             logger.debug(
                 "Keycloak refresh token for user '{name}' is expired.".format(
@@ -41,25 +57,95 @@ class KeycloakAuthMiddleware:
         return self.get_response(request)
 
     def _process_keycloak_user(
-        self, user: AbstractUser
+        self, request: HttpRequest
     ) -> Optional[UserSocialAuth]:
-        social_auth = getattr(user, "social_auth", None)
-        if social_auth is None:
+        user = request.user
+        if getattr(user, "social_auth", None) is None:
             return None
 
+        keycloak_user = self._cached_keycloak_user(request, user)
+        if keycloak_user is None:
+            keycloak_user = self._load_keycloak_user(user)
+            if keycloak_user is None:
+                return None
+
+        if keycloak_user.access_token_expired():
+            keycloak_user = self._refresh_keycloak_user(user, keycloak_user)
+
+        if keycloak_user.access_token is None:
+            raise TokenRefreshError("Access token is missing")
+
+        self._cache_keycloak_user(request, keycloak_user)
+        return keycloak_user
+
+    @staticmethod
+    def _load_keycloak_user(
+        user: AbstractUser,
+    ) -> Optional[UserSocialAuth]:
         try:
-            keycloak_user = social_auth.get(provider=KEYCLOAK_PROVIDER)
+            return user.social_auth.get(provider=KEYCLOAK_PROVIDER)
         except ObjectDoesNotExist:
             return None
 
+    def _refresh_keycloak_user(
+        self, user: AbstractUser, keycloak_user: UserSocialAuth
+    ) -> UserSocialAuth:
+        lock_key = REFRESH_LOCK_KEY.format(user.pk)
+        locked = self._acquire_refresh_lock(lock_key)
         try:
-            token = keycloak_user.get_access_token(load_strategy())
-        except requests.HTTPError as e:
-            if e.response.status_code == status.HTTP_400_BAD_REQUEST:
-                raise TokenRefreshError("Access token expired")
-            raise
-
-        if token is None:
-            raise TokenRefreshError("Access token is missing")
+            # Another request may have refreshed the token meanwhile
+            keycloak_user = self._load_keycloak_user(user) or keycloak_user
+            if not keycloak_user.access_token_expired():
+                return keycloak_user
+
+            try:
+                keycloak_user.get_access_token(load_strategy())
+            except requests.HTTPError as e:
+                if e.response.status_code == status.HTTP_400_BAD_REQUEST:
+                    raise TokenRefreshError("Access token expired")
+                raise
+            return keycloak_user
+        finally:
+            if locked:
+                cache.delete(lock_key)
+
+    @staticmethod
+    def _acquire_refresh_lock(lock_key: str) -> bool:
+        timeout = settings.PINAKES_KEYCLOAK_REFRESH_LOCK_TIMEOUT
+        deadline = time.monotonic() + timeout
+        while not cache.add(lock_key, True, timeout):
+            if time.monotonic() >= deadline:
+                # The holder is stuck, refresh without the lock
+                logger.warning("Timed out waiting for %s", lock_key)
+                return False
+            time.sleep(REFRESH_LOCK_POLL_INTERVAL)
+        return True
+
+    @staticmethod
+    def _cached_keycloak_user(
+        request: HttpRequest, user: AbstractUser
+    ) -> Optional[UserSocialAuth]:
+        data = request.session.get(SESSION_KEY)
+        if not data or data.get("user_id") != user.pk:
+            return None
 
-        return keycloak_user
+        return UserSocialAuth(
+            id=data["id"],
+            user=user,
+            provider=KEYCLOAK_PROVIDER,
+            uid=data["uid"],
+            extra_data=data["extra_data"],
+        )
+
+    @staticmethod
+    def _cache_keycloak_user(
+        request: HttpRequest, keycloak_user: UserSocialAuth
+    ):
+        data = {
+            "id": keycloak_user.id,
+            "user_id": keycloak_user.user_id,
+            "uid": keycloak_user.uid,
+            "extra_data": keycloak_user.extra_data,
+        }
+        if request.session.get(SESSION_KEY) != data:
+            request.session[SESSION_KEY] = data
@@ -0,0 +1,109 @@
+"""Provides conditional GET for the list and retrieve actions of a viewset."""
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils import translation
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+
+from pinakes.common.fields import MetadataField
+
+
+class ConditionalGetMixin:
+    """A Mixin class answering conditional GET requests of a ViewSet.
+
+    The ETag of an object is derived from its updated_at and from the
+    capabilities of the user on it, the ETag of a list from the latest
+    updated_at and the number of the filtered objects. Both also depend
+    on the query parameters, the user, the language and the media type
+    of the response. A request whose If-None-Match matches the ETag gets
+    a 304 Not Modified, and the objects are never serialized.
+
+    Changes outside of the rows of the model, such as group permissions
+    edited in Keycloak, are not seen until the objects are updated.
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        stats = queryset.order_by().aggregate(
+            last_updated=Max("updated_at"), count=Count("pk")
+        )
+        etag = self.get_etag(stats["last_updated"], stats["count"])
+
+        response = self._get_not_modified_response(etag)
+        if response is None:
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                response = self.get_paginated_response(serializer.data)
+            else:
+                serializer = self.get_serializer(queryset, many=True)
+                response = Response(serializer.data)
+        return self._set_validators(response, etag)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_retrieve(self.get_object())
+
+    def conditional_retrieve(self, instance):
+        """Respond with the serialized instance unless it is not modified"""
+        serializer = self.get_serializer(instance)
+        etag = self.get_etag(
+            instance.updated_at, self._get_user_capabilities(serializer)
+        )
+        last_modified = int(instance.updated_at.timestamp())
+
+        response = self._get_not_modified_response(etag, last_modified)
+        if response is None:
+            response = Response(serializer.data)
+        return self._set_validators(response, etag, last_modified)
+
+    def get_etag(self, *values):
+        """Strong ETag of the response for the given values"""
+        request = self.request
+        key = repr(
+            (
+                request.path,
+                sorted(request.query_params.lists()),
+                request.user.pk,
+                translation.get_language(),
+                request.accepted_media_type,
+                *values,
+            )
+        )
+        return quote_etag(hashlib.sha256(key.encode()).hexdigest())
+
+    @staticmethod
+    def _get_user_capabilities(serializer):
+        # Evaluated by the field of the serializer, which keeps them in
+        # the context of the serializer for the serialization
+        for field in serializer.fields.values():
+            if (
+                isinstance(field, MetadataField)
+                and field.user_capabilities_field
+            ):
+                return sorted(
+                    field.user_capabilities_field.to_representation(
+                        serializer.instance
+                    ).items()
+                )
+        return None
+
+    def _get_not_modified_response(self, etag, last_modified=None):
+        response = get_conditional_response(
+            self.request._request, etag=etag, last_modified=last_modified
+        )
+        # 304 Not Modified, or 412 Precondition Failed for If-Match
+        if response is not None:
+            return Response(status=response.status_code)
+        return None
+
+    @staticmethod
+    def _set_validators(response, etag, last_modified=None):
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        # Cached responses are private and revalidated on every use
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
@@ -0,0 +1,207 @@
+"""PostgreSQL backend with connection health checks and an optional pool.
+
+Persistent connections (``CONN_MAX_AGE``) are checked with a cheap query
+before their first use in a request or job when ``CONN_HEALTH_CHECKS`` is
+set, so a connection dropped by the server or a proxy is replaced instead
+of failing the request.
+
+With ``POOL_SIZE`` set, closing a connection hands it back to a process
+wide pool shared by the threads of a worker, and opening one reuses an
+idle pooled connection. At most ``POOL_SIZE`` connections are handed out
+at a time, a thread waits up to ``POOL_TIMEOUT`` seconds for one to be
+returned. The pool is meant for threaded or async workers running with
+``CONN_MAX_AGE = 0``; it is recreated in a forked child process, the
+connections of the parent are never used by the child.
+
+The time spent opening a connection, including the wait for the pool, is
+recorded in the active profile as ``db_connect``.
+"""
+import logging
+import os
+import threading
+
+import psycopg2
+from django.db.backends.postgresql import base, creation
+from django.utils.asyncio import async_unsafe
+from psycopg2 import extensions
+
+from pinakes.common import profiling
+
+logger = logging.getLogger("pinakes")
+
+_pools = {}
+# Pools inherited from a parent process. They are kept referenced so
+# their connections are never closed by the child, which would terminate
+# the sessions the parent still uses.
+_inherited_pools = []
+_pools_lock = threading.Lock()
+
+
+class PoolTimeout(psycopg2.OperationalError):
+    """No pooled connection was returned in time"""
+
+
+class ConnectionPool:
+    """Bounded set of idle connections of one database alias"""
+
+    def __init__(self, size, timeout):
+        self.size = size
+        self.timeout = timeout
+        self.pid = os.getpid()
+        self._idle = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def get(self, connect, check=False):
+        """Return an idle connection, or a new one made by connect"""
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeout(
+                f"No database connection available in {self.timeout}s,"
+                f" all {self.size} pooled connections are in use"
+            )
+
+        try:
+            while True:
+                with self._lock:
+                    connection = self._idle.pop() if self._idle else None
+                if connection is None:
+                    return connect()
+                if not connection.closed and (
+                    not check or self._is_usable(connection)
+                ):
+                    return connection
+                connection.close()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def put(self, connection):
+        """Give back a connection handed out by get"""
+        try:
+            status = connection.info.transaction_status
+            if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                connection.close()
+            elif status != extensions.TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+        except psycopg2.Error:
+            connection.close()
+
+        if not connection.closed:
+            with self._lock:
+                self._idle.append(connection)
+        self._slots.release()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    @staticmethod
+    def _is_usable(connection):
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            if not connection.autocommit:
+                connection.rollback()
+        except psycopg2.Error:
+            return False
+        return True
+
+
+def get_pool(alias, settings_dict):
+    """Return the pool of a database alias in this process, if enabled"""
+    size = settings_dict.get("POOL_SIZE") or 0
+    if size <= 0:
+        return None
+
+    with _pools_lock:
+        pool = _pools.get(alias)
+        if pool is not None and pool.pid != os.getpid():
+            _inherited_pools.append(pool)
+            pool = None
+        if pool is None:
+            pool = ConnectionPool(
+                size, settings_dict.get("POOL_TIMEOUT") or None
+            )
+            _pools[alias] = pool
+        return pool
+
+
+def close_pools():
+    """Close the idle pooled connections of this process"""
+    with _pools_lock:
+        pools = [pool for pool in _pools.values() if pool.pid == os.getpid()]
+    for pool in pools:
+        pool.close()
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # Idle pooled connections would keep the test database in use
+        close_pools()
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    creation_class = DatabaseCreation
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.health_check_enabled = self.settings_dict.get(
+            "CONN_HEALTH_CHECKS", False
+        )
+        self.health_check_done = False
+
+    @property
+    def pool(self):
+        return get_pool(self.alias, self.settings_dict)
+
+    def get_new_connection(self, conn_params):
+        def connect():
+            return super(DatabaseWrapper, self).get_new_connection(conn_params)
+
+        with profiling.measure(profiling.DB_CONNECT):
+            pool = self.pool
+            if pool is None:
+                return connect()
+            return pool.get(connect, check=self.health_check_enabled)
+
+    def connect(self):
+        # A new connection does not need to be checked before use
+        self.health_check_done = True
+        super().connect()
+
+    def _close(self):
+        pool = self.pool
+        if pool is None or self.connection is None:
+            return super()._close()
+
+        with self.wrap_database_errors:
+            pool.put(self.connection)
+
+    @async_unsafe
+    def ensure_connection(self):
+        self._check_health()
+        super().ensure_connection()
+
+    def close_if_unusable_or_obsolete(self):
+        super().close_if_unusable_or_obsolete()
+        # Check a reused connection again in the next request or job
+        self.health_check_done = False
+
+    def _check_health(self):
+        if (
+            self.connection is None
+            or not self.health_check_enabled
+            or self.health_check_done
+            or self.in_atomic_block
+        ):
+            return
+
+        self.health_check_done = True
+        if not self.is_usable():
+            logger.info(
+                "Replacing unusable database connection %s", self.alias
+            )
+            self.close()
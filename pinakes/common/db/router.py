@@ -0,0 +1,208 @@
+"""Route reads to a read replica of the default database.
+
+Reads go to the ``replica`` database, when one is configured, only inside
+a ``use_replica()`` block. The ReplicaMiddleware opens one for the safe
+API requests and the analytics collectors open one for their exports;
+everything else, including the background tasks processing orders,
+keeps reading from the primary.
+
+Inside the block, reads stay on the primary when:
+
+* a transaction is open on the primary;
+* something was already written in the block, so it reads its own
+  writes;
+* the replica lags behind the primary by more than
+  ``PINAKES_REPLICA_MAX_LAG`` seconds, or cannot be reached. The lag is
+  checked at most once every ``PINAKES_REPLICA_LAG_CHECK_INTERVAL``
+  seconds per process.
+
+After an unsafe request a client reads from the primary for
+``PINAKES_REPLICA_PIN_SECONDS`` seconds, so it sees its own changes in
+the requests that follow, e.g. polling an order it just submitted. A
+browser is pinned with a cookie, a client authenticated with a bearer
+token, which usually keeps no cookies, in the cache by the Keycloak
+user of the token.
+"""
+import contextlib
+import contextvars
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from jose import jwt
+
+logger = logging.getLogger("pinakes")
+
+REPLICA = "replica"
+PIN_COOKIE = "pinakes_primary"
+PIN_CACHE_KEY = "replica-pin:{}"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Replication lag in seconds, 0 when the replica replayed everything it
+# received and NULL when the database is not a standby
+LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN NULL
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
+
+_use_replica = contextvars.ContextVar("use_replica", default=False)
+_lag_lock = threading.Lock()
+_lag_state = {"checked_at": None, "fresh": True}
+
+
+def is_configured():
+    return REPLICA in connections.databases
+
+
+@contextlib.contextmanager
+def use_replica():
+    """Read from the replica in the block, unless it is stale"""
+    token = _use_replica.set(is_configured())
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+def read_alias():
+    """Return the database the reads of the current block go to"""
+    if (
+        not _use_replica.get()
+        or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        or not replica_is_fresh()
+    ):
+        return DEFAULT_DB_ALIAS
+    return REPLICA
+
+
+def replica_is_fresh():
+    """Whether the replica lag is acceptable, checked periodically"""
+    now = time.monotonic()
+    with _lag_lock:
+        checked_at = _lag_state["checked_at"]
+        if (
+            checked_at is not None
+            and now - checked_at < settings.PINAKES_REPLICA_LAG_CHECK_INTERVAL
+        ):
+            return _lag_state["fresh"]
+        # Other threads keep the previous answer while this one checks
+        _lag_state["checked_at"] = now
+
+    fresh = _check_lag()
+    with _lag_lock:
+        _lag_state["fresh"] = fresh
+    return fresh
+
+
+def reset_lag_check():
+    with _lag_lock:
+        _lag_state.update(checked_at=None, fresh=True)
+
+
+def _check_lag():
+    connection = connections[REPLICA]
+    if connection.vendor != "postgresql":
+        return True
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(LAG_QUERY)
+            (lag,) = cursor.fetchone()
+    except DatabaseError:
+        logger.warning("Read replica unavailable, reading from the primary")
+        return False
+
+    if lag is not None and lag > settings.PINAKES_REPLICA_MAX_LAG:
+        logger.warning(
+            "Read replica lags by %.1fs, reading from the primary", lag
+        )
+        return False
+    return True
+
+
+class ReplicaRouter:
+    """Send the reads of use_replica() blocks to the replica"""
+
+    def db_for_read(self, model, **hints):
+        return read_alias()
+
+    def db_for_write(self, model, **hints):
+        # Read what was written from the primary for the rest of the block
+        _use_replica.set(False)
+        # Also for objects read from the replica
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, REPLICA}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == REPLICA:
+            return False
+        return None
+
+
+class ReplicaMiddleware:
+    """Serve the safe requests from the replica.
+
+    Should come after the authentication middlewares, which may write the
+    user of the request.
+    """
+
+    __slots__ = ("get_response",)
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not is_configured():
+            return self.get_response(request)
+
+        subject = _token_subject(request)
+        if request.method in SAFE_METHODS:
+            if PIN_COOKIE in request.COOKIES or (
+                subject is not None
+                and cache.get(PIN_CACHE_KEY.format(subject))
+            ):
+                return self.get_response(request)
+            with use_replica():
+                return self.get_response(request)
+
+        response = self.get_response(request)
+        response.set_cookie(
+            PIN_COOKIE,
+            "1",
+            max_age=settings.PINAKES_REPLICA_PIN_SECONDS,
+            httponly=True,
+            samesite="Lax",
+        )
+        if subject is not None:
+            cache.set(
+                PIN_CACHE_KEY.format(subject),
+                True,
+                settings.PINAKES_REPLICA_PIN_SECONDS,
+            )
+        return response
+
+
+def _token_subject(request):
+    """Keycloak user of the bearer token of the request, if any.
+
+    The token is authenticated later by the view. It is only read here to
+    pin its user, a forged token can only make reads go to the primary.
+    """
+    auth = request.headers.get("Authorization", "").split()
+    if len(auth) != 2 or auth[0].lower() != "bearer":
+        return None
+    try:
+        return jwt.get_unverified_claims(auth[1]).get("sub")
+    except jwt.JWTError:
+        return None
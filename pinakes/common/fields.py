@@ -1,5 +1,5 @@
 import copy
-from typing import Dict
+from typing import Any, Dict, List
 
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
@@ -7,19 +7,42 @@ from rest_framework import serializers
 
 
 class UserCapabilitiesField(serializers.ReadOnlyField):
+    """User capabilities of an object.
+
+    When the object belongs to a page of objects being serialized, the
+    capabilities of the whole page are evaluated at once.
+    """
+
+    CONTEXT_KEY = "_user_capabilities"
+
     def __init__(self, **kwargs):
         kwargs["source"] = "*"
         super().__init__(**kwargs)
 
     def to_representation(self, value) -> Dict[str, bool]:
-        request = self.context["request"]
-        view = self.context["view"]
+        evaluated = self.context.setdefault(self.CONTEXT_KEY, {})
+        if id(value) not in evaluated:
+            request = self.context["request"]
+            view = self.context["view"]
+            objs = self._page_objects(value)
 
-        keycloak_permission = view.get_keycloak_permission()
-        permissions = keycloak_permission.get_user_capabilities(
-            request, view, value
-        )
-        return permissions
+            keycloak_permission = view.get_keycloak_permission()
+            capabilities = keycloak_permission.get_objects_user_capabilities(
+                request, view, objs
+            )
+            evaluated.update(zip(map(id, objs), capabilities))
+        return evaluated[id(value)]
+
+    def _page_objects(self, value) -> List[Any]:
+        root = self.root
+        if isinstance(root, serializers.ListSerializer) and isinstance(
+            root.instance, list
+        ):
+            if any(obj is value for obj in root.instance):
+                return [
+                    obj for obj in root.instance if type(obj) is type(value)
+                ]
+        return [value]
 
 
 @extend_schema_field(OpenApiTypes.OBJECT)
@@ -56,6 +79,10 @@ class MetadataField(serializers.ReadOnlyField):
         if self._user_capabilities_field:
             self._user_capabilities_field.bind("", self)
 
+    @property
+    def user_capabilities_field(self):
+        return self._user_capabilities_field
+
     def to_representation(self, instance):
         if not instance:
             return {}
@@ -126,4 +126,6 @@ class ImageMixin:
             )
 
         instance.icon.delete()
+        instance.icon = None
+        instance.save(update_fields=["icon", "updated_at"])
         return Response(status=status.HTTP_204_NO_CONTENT)
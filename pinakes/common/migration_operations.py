@@ -0,0 +1,123 @@
+"""Migration operations that build indexes without locking writes.
+
+On PostgreSQL indexes are created with CREATE INDEX CONCURRENTLY, other
+databases fall back to the regular Django operations. Migrations using
+these operations must set ``atomic = False``.
+"""
+from django.contrib.postgres import operations as postgres_operations
+from django.db import migrations
+
+
+def _is_postgresql(schema_editor):
+    return schema_editor.connection.vendor == "postgresql"
+
+
+class AddIndexConcurrently(postgres_operations.AddIndexConcurrently):
+    """Add an index concurrently on PostgreSQL"""
+
+    def database_forwards(
+        self, app_label, schema_editor, from_state, to_state
+    ):
+        if _is_postgresql(schema_editor):
+            super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+        else:
+            migrations.AddIndex.database_forwards(
+                self, app_label, schema_editor, from_state, to_state
+            )
+
+    def database_backwards(
+        self, app_label, schema_editor, from_state, to_state
+    ):
+        if _is_postgresql(schema_editor):
+            super().database_backwards(
+                app_label, schema_editor, from_state, to_state
+            )
+        else:
+            migrations.AddIndex.database_backwards(
+                self, app_label, schema_editor, from_state, to_state
+            )
+
+
+class AddPostgresIndexConcurrently(postgres_operations.AddIndexConcurrently):
+    """Add a PostgreSQL only index concurrently, e.g. a trigram index.
+
+    Other databases are left without the index.
+    """
+
+    def database_forwards(
+        self, app_label, schema_editor, from_state, to_state
+    ):
+        if _is_postgresql(schema_editor):
+            super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+    def database_backwards(
+        self, app_label, schema_editor, from_state, to_state
+    ):
+        if _is_postgresql(schema_editor):
+            super().database_backwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+
+class AddUniqueConstraintConcurrently(migrations.AddConstraint):
+    """Add a unique constraint backed by a concurrently built index.
+
+    On PostgreSQL the unique index is built with CREATE UNIQUE INDEX
+    CONCURRENTLY and then attached to the table as a constraint, which
+    only takes a short lock. The rows must already be unique.
+
+    An interrupted build leaves an invalid index behind, which is dropped
+    and built again when the migration is run again.
+    """
+
+    atomic = False
+
+    def database_forwards(
+        self, app_label, schema_editor, from_state, to_state
+    ):
+        if not _is_postgresql(schema_editor):
+            return super().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+
+        quote_name = schema_editor.quote_name
+        table = quote_name(model._meta.db_table)
+        name = quote_name(self.constraint.name)
+        columns = ", ".join(
+            quote_name(model._meta.get_field(field).column)
+            for field in self.constraint.fields
+        )
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_constraint WHERE conname = %s"
+                " AND conrelid = %s::regclass",
+                [self.constraint.name, model._meta.db_table],
+            )
+            if cursor.fetchone():
+                return
+            cursor.execute(
+                "SELECT 1 FROM pg_index JOIN pg_class"
+                " ON pg_class.oid = pg_index.indexrelid"
+                " WHERE pg_class.relname = %s AND NOT pg_index.indisvalid",
+                [self.constraint.name],
+            )
+            invalid = cursor.fetchone() is not None
+
+        if invalid:
+            schema_editor.execute(f"DROP INDEX CONCURRENTLY {name}")
+        schema_editor.execute(
+            f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f"ON {table} ({columns})"
+        )
+        schema_editor.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE USING INDEX "
+            f"{name}"
+        )
@@ -0,0 +1,19 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import models
+from django.db.models.functions import Cast, Upper
+
+
+def trigram_index(field_name, name):
+    """GIN trigram index serving the icontains lookups of a text field.
+
+    Indexes the expression of the lookup on PostgreSQL, so it also serves
+    istartswith lookups. It needs the pg_trgm extension and must be added
+    with AddPostgresIndexConcurrently.
+    """
+    return GinIndex(
+        OpClass(
+            Upper(Cast(field_name, output_field=models.TextField())),
+            name="gin_trgm_ops",
+        ),
+        name=name,
+    )
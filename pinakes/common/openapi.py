@@ -0,0 +1,121 @@
+"""OpenAPI schema generated once per version of the code.
+
+Generating the schema introspects every view and serializer of the API.
+The schema is rendered once, written to OPENAPI_SCHEMA_ROOT in a file
+named after the version in about.yml, and kept in memory by each
+process. A new file is only generated when the version changes.
+"""
+import functools
+import hashlib
+import importlib.resources
+import logging
+import os
+
+import yaml
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils import translation
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from drf_spectacular.renderers import OpenApiJsonRenderer
+from drf_spectacular.settings import spectacular_settings
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SCHEMA_KWARGS, SpectacularJSONAPIView
+
+logger = logging.getLogger(__name__)
+
+
+class CachedSchema:
+    """Rendered schema and its ETag"""
+
+    __slots__ = ("content", "etag")
+
+    def __init__(self, content: bytes):
+        self.content = content
+        self.etag = quote_etag(hashlib.sha256(content).hexdigest())
+
+
+def get_code_version() -> str:
+    about = importlib.resources.files("pinakes").joinpath("about.yml")
+    return str(yaml.safe_load(about.read_text())["version"])
+
+
+def get_schema_path(version: str) -> str:
+    return os.path.join(
+        settings.OPENAPI_SCHEMA_ROOT, f"openapi-{version}.json"
+    )
+
+
+def generate_schema() -> bytes:
+    """Render the public schema of the API as JSON"""
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    with translation.override(settings.LANGUAGE_CODE):
+        schema = generator.get_schema(request=None, public=True)
+        return OpenApiJsonRenderer().render(schema, renderer_context={})
+
+
+def write_schema(version: str) -> bytes:
+    """Generate the schema and write it to the file of the version"""
+    content = generate_schema()
+    path = get_schema_path(version)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Readers never see a partly written file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return content
+
+
+@functools.lru_cache(maxsize=None)
+def get_schema() -> CachedSchema:
+    """Schema of the running version of the code"""
+    version = get_code_version()
+    try:
+        with open(get_schema_path(version), "rb") as f:
+            return CachedSchema(f.read())
+    except FileNotFoundError:
+        pass
+
+    logger.info("Generating the OpenAPI schema of version %s", version)
+    try:
+        content = write_schema(version)
+    except OSError as e:
+        logger.warning("Failed to write the OpenAPI schema: %s", e)
+        content = generate_schema()
+    return CachedSchema(content)
+
+
+def _is_default_language(language):
+    # The messages of the regional variants of a language are the same
+    return language.split("-")[0] == settings.LANGUAGE_CODE.split("-")[0]
+
+
+class CachedSpectacularJSONAPIView(SpectacularJSONAPIView):
+    """Serve the cached schema, unless another language or API version
+    is requested"""
+
+    @extend_schema(**SCHEMA_KWARGS)
+    def get(self, request, *args, **kwargs):
+        language = request.GET.get("lang") or translation.get_language()
+        if (
+            not settings.OPENAPI_SCHEMA_CACHE
+            or request.GET.get("version")
+            or not _is_default_language(language or settings.LANGUAGE_CODE)
+        ):
+            return super().get(request, *args, **kwargs)
+
+        schema = get_schema()
+        response = get_conditional_response(request._request, etag=schema.etag)
+        if response is None:
+            filename = "{}.json".format(spectacular_settings.TITLE or "schema")
+            response = HttpResponse(
+                schema.content,
+                content_type=request.accepted_renderer.media_type,
+                headers={
+                    "Content-Disposition": f'inline; filename="{filename}"'
+                },
+            )
+        response["ETag"] = schema.etag
+        patch_cache_control(response, no_cache=True)
+        return response
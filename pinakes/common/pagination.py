@@ -8,3 +8,74 @@ class CatalogPageNumberPagination(pagination.PageNumberPagination):
 
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class CatalogCursorPagination(pagination.CursorPagination):
+    """Keyset pagination without a total count.
+
+    Pages are located by the position of the last seen row instead of an
+    offset, so deep pages are as fast as the first one and no COUNT query
+    is issued.
+    """
+
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-id"
+
+
+class CatalogSwitchablePagination(CatalogPageNumberPagination):
+    """Page number pagination which switches to cursor pagination on demand.
+
+    Clients request the first cursor page with ``?pagination=cursor`` and
+    follow the ``next`` and ``previous`` links from there. Requests
+    without these parameters keep the page number API.
+    """
+
+    pagination_query_param = "pagination"
+    cursor_pagination_class = CatalogCursorPagination
+
+    def __init__(self):
+        self.cursor_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self._use_cursor(request):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(
+                queryset, request, view
+            )
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        return [
+            *parameters,
+            {
+                "name": self.pagination_query_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    "Set to cursor to page through the results by a cursor"
+                    " without a total count"
+                ),
+                "schema": {"type": "string", "enum": ["cursor"]},
+            },
+            {
+                "name": self.cursor_pagination_class.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value",
+                "schema": {"type": "string"},
+            },
+        ]
+
+    def _use_cursor(self, request):
+        return (
+            request.query_params.get(self.pagination_query_param) == "cursor"
+            or self.cursor_pagination_class.cursor_query_param
+            in request.query_params
+        )
@@ -0,0 +1,31 @@
+"""Custom parsers"""
+import codecs
+
+import orjson
+from django.conf import settings
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from pinakes.common.renderers import ORJSONRenderer
+
+
+class ORJSONParser(parsers.JSONParser):
+    """Parse JSON request bodies with orjson.
+
+    Bodies in another encoding than UTF-8 are parsed by the JSONParser,
+    as well as all bodies when STRICT_JSON is disabled, since orjson
+    rejects NaN and infinite numbers.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if not self.strict or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
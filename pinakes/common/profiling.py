@@ -0,0 +1,224 @@
+"""Per-request and per-job profiling.
+
+A profile counts the SQL queries, outbound HTTP calls (split by target),
+serialization and response rendering time spent while handling a single API
+request or background job. Serialization is the time the serializers spend
+representing objects, including the queries they make, rendering the time
+spent encoding the response data. Profiling is sampled: only the fraction of
+requests configured by ``PINAKES_PROFILING_SAMPLE_RATE`` is profiled, so it
+can stay enabled in production. Sampled API responses carry the results in a
+``Server-Timing`` header and every profile is written to the
+``pinakes.profiling`` logger.
+"""
+import contextlib
+import contextvars
+import json
+import logging
+import random
+import time
+from collections import Counter
+from typing import Optional
+
+from django.conf import settings
+from django.db import connections
+
+from pinakes.common.renderers import ORJSONRenderer
+
+logger = logging.getLogger("pinakes.profiling")
+
+DB = "db"
+DB_CONNECT = "db_connect"
+KEYCLOAK = "keycloak"
+CONTROLLER = "controller"
+SERIALIZE = "serialize"
+RENDER = "render"
+
+REPEATED_QUERIES_LOGGED = 5
+
+_current_profile = contextvars.ContextVar("profile", default=None)
+
+
+class Profile:
+    """Counts and timings collected while a profile is active"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.duration = None
+        self.calls = Counter()
+        self.durations = Counter()
+        self.duplicate_queries = 0
+        self._queries = Counter()
+        self._query_templates = Counter()
+
+    def record(self, name: str, duration: float):
+        self.calls[name] += 1
+        self.durations[name] += duration
+
+    def record_query(self, sql: str, params, duration: float):
+        self.record(DB, duration)
+        self._query_templates[sql] += 1
+        key = (sql, repr(params))
+        if self._queries[key]:
+            self.duplicate_queries += 1
+        self._queries[key] += 1
+
+    def stop(self):
+        self.duration = time.perf_counter() - self.started
+
+    def repeated_queries(self):
+        """Most frequent SQL statements executed more than once"""
+        return [
+            {"sql": sql, "count": count}
+            for sql, count in self._query_templates.most_common(
+                REPEATED_QUERIES_LOGGED
+            )
+            if count > 1
+        ]
+
+    def as_dict(self):
+        return {
+            "duration_ms": _ms(self.duration),
+            "db_queries": self.calls[DB],
+            "db_duplicate_queries": self.duplicate_queries,
+            "db_ms": _ms(self.durations[DB]),
+            "db_connects": self.calls[DB_CONNECT],
+            "db_connect_ms": _ms(self.durations[DB_CONNECT]),
+            "keycloak_calls": self.calls[KEYCLOAK],
+            "keycloak_ms": _ms(self.durations[KEYCLOAK]),
+            "controller_calls": self.calls[CONTROLLER],
+            "controller_ms": _ms(self.durations[CONTROLLER]),
+            "serialize_ms": _ms(self.durations[SERIALIZE]),
+            "render_ms": _ms(self.durations[RENDER]),
+            "repeated_queries": self.repeated_queries(),
+        }
+
+    def server_timing(self) -> str:
+        """Value of the Server-Timing header"""
+        metrics = [
+            (
+                DB,
+                self.durations[DB],
+                f"{self.calls[DB]} queries, "
+                f"{self.duplicate_queries} duplicates",
+            ),
+            (
+                DB_CONNECT,
+                self.durations[DB_CONNECT],
+                f"{self.calls[DB_CONNECT]} connects",
+            ),
+            (
+                KEYCLOAK,
+                self.durations[KEYCLOAK],
+                f"{self.calls[KEYCLOAK]} calls",
+            ),
+            (
+                CONTROLLER,
+                self.durations[CONTROLLER],
+                f"{self.calls[CONTROLLER]} calls",
+            ),
+            (SERIALIZE, self.durations[SERIALIZE], None),
+            (RENDER, self.durations[RENDER], None),
+            ("total", self.duration, None),
+        ]
+        entries = []
+        for name, duration, description in metrics:
+            entry = f"{name};dur={_ms(duration)}"
+            if description:
+                entry += f';desc="{description}"'
+            entries.append(entry)
+        return ", ".join(entries)
+
+    def log(self, **context):
+        data = {**context, **self.as_dict()}
+        logger.info("Profile: %s", json.dumps(data), extra={"profile": data})
+
+
+def _ms(duration: Optional[float]) -> float:
+    return round((duration or 0.0) * 1000, 2)
+
+
+def current() -> Optional[Profile]:
+    """Return the active profile, if any"""
+    return _current_profile.get()
+
+
+def is_sampled() -> bool:
+    """Decide whether the current request or job should be profiled"""
+    rate = settings.PINAKES_PROFILING_SAMPLE_RATE
+    return rate > 0 and random.random() < rate
+
+
+@contextlib.contextmanager
+def measure(name: str):
+    """Add the time spent in the block to the active profile"""
+    profile = current()
+    if profile is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.record(name, time.perf_counter() - started)
+
+
+@contextlib.contextmanager
+def profile():
+    """Activate a new profile for the duration of the block"""
+    new_profile = Profile()
+
+    def query_wrapper(execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            new_profile.record_query(
+                sql, params, time.perf_counter() - started
+            )
+
+    token = _current_profile.set(new_profile)
+    try:
+        with contextlib.ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(query_wrapper))
+            yield new_profile
+    finally:
+        _current_profile.reset(token)
+        new_profile.stop()
+
+
+class ProfilingMiddleware:
+    """Profile a sample of requests.
+
+    Should be the first middleware, so that the queries issued by the
+    other middlewares are accounted for.
+    """
+
+    __slots__ = ("get_response",)
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not is_sampled():
+            return self.get_response(request)
+
+        with profile() as request_profile:
+            response = self.get_response(request)
+
+        response["Server-Timing"] = request_profile.server_timing()
+        request_profile.log(
+            method=request.method,
+            path=request.path,
+            status=response.status_code,
+        )
+        return response
+
+
+class JSONRenderer(ORJSONRenderer):
+    """JSON renderer accounting the time spent encoding the response"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with measure(RENDER):
+            return super().render(data, accepted_media_type, renderer_context)
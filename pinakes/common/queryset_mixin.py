@@ -2,6 +2,7 @@
 
 from django.http import Http404
 
+from pinakes.common.serializers import is_field_rendered
 from pinakes.main.models import Tenant
 
 
@@ -34,4 +35,22 @@ class QuerySetMixin:
                     raise Http404
         if queryset_order_by is not None:
             queryset = queryset.order_by(queryset_order_by)
+        deferred_fields = self.get_deferred_fields(serializer_class)
+        if deferred_fields:
+            queryset = queryset.defer(*deferred_fields)
         return queryset
+
+    def get_deferred_fields(self, serializer_class):
+        """Large columns that none of the fields returned in a list reads"""
+        if getattr(self, "action", None) != "list":
+            return []
+
+        deferred_fields = getattr(serializer_class.Meta, "deferred_fields", {})
+        return [
+            column
+            for column, field_names in deferred_fields.items()
+            if not any(
+                is_field_rendered(serializer_class, name, self.request, True)
+                for name in field_names
+            )
+        ]
@@ -0,0 +1,117 @@
+"""Routing of background tasks to named RQ queues."""
+import datetime
+import uuid
+from typing import Callable, List, Optional, Union
+
+import django_rq
+from django.conf import settings
+from django.db import models
+from django.utils import timezone as django_tz
+from django.utils.module_loading import import_string
+from rq import Queue
+from rq.job import Job
+
+INTERACTIVE = "interactive"
+PROVISIONING = "provisioning"
+DEFAULT = "default"
+SYNC = "sync"
+ANALYTICS = "analytics"
+
+QUEUE_ATTRIBUTE = "rq_queue"
+
+TaskFunc = Union[Callable, str]
+
+
+def task_queue(name: str):
+    """Declare the queue a background task function is routed to."""
+
+    def decorator(func):
+        setattr(func, QUEUE_ATTRIBUTE, name)
+        return func
+
+    return decorator
+
+
+def get_queue_name(func: TaskFunc) -> str:
+    """Return the queue name of a task function or its dotted path."""
+    if isinstance(func, str):
+        func = import_string(func)
+    return getattr(func, QUEUE_ATTRIBUTE, DEFAULT)
+
+
+def get_queue(func: TaskFunc) -> Queue:
+    """Return the queue a task function is routed to."""
+    return django_rq.get_queue(get_queue_name(func))
+
+
+def get_func_name(func: TaskFunc) -> str:
+    """Return the dotted path of a task function."""
+    if isinstance(func, str):
+        return func
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def enqueue(
+    func: TaskFunc,
+    *args,
+    owner: Optional[models.Model] = None,
+    user: Optional[models.Model] = None,
+    **kwargs,
+) -> Job:
+    """Enqueue a task function into the queue it is routed to.
+
+    The task is recorded in the task index before it is enqueued.
+    ``owner`` is the model instance the task works on, it allows to
+    look up the tasks of an object. ``user`` is the user who started
+    the task, by default the user of the owner. Only this user can see
+    the task in the task index.
+    """
+    from pinakes.main.common.models import Task
+    from pinakes.main.models import Tenant
+
+    queue = get_queue(func)
+    job_id = kwargs.pop("job_id", None) or str(uuid.uuid4())
+    Task.objects.create(
+        id=job_id,
+        func_name=get_func_name(func),
+        queue=queue.name,
+        owner_type=owner.__class__.__name__ if owner else "",
+        owner_id=owner.id if owner else None,
+        tenant_id=getattr(owner, "tenant_id", None) or Tenant.current().id,
+        user_id=user.pk if user else getattr(owner, "user_id", None),
+    )
+    return queue.enqueue(func, *args, job_id=job_id, **kwargs)
+
+
+def get_queue_stats() -> List[dict]:
+    """Return depth and latency of every configured queue.
+
+    Latency is the time in seconds the oldest queued job has been
+    waiting, or 0 for an empty queue.
+    """
+    now = django_tz.now()
+    stats = []
+    for name in settings.RQ_QUEUES:
+        queue = django_rq.get_queue(name)
+        latency = 0.0
+        job_ids = queue.get_job_ids(0, 1)
+        if job_ids:
+            job = queue.fetch_job(job_ids[0])
+            if job and job.enqueued_at:
+                enqueued_at = job.enqueued_at
+                if django_tz.is_naive(enqueued_at):
+                    enqueued_at = django_tz.make_aware(
+                        enqueued_at, datetime.timezone.utc
+                    )
+                latency = max((now - enqueued_at).total_seconds(), 0.0)
+
+        stats.append(
+            {
+                "name": name,
+                "queued": queue.count,
+                "started": queue.started_job_registry.count,
+                "failed": queue.failed_job_registry.count,
+                "latency": latency,
+            }
+        )
+    return stats
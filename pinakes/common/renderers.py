@@ -0,0 +1,52 @@
+"""Custom renderers"""
+import orjson
+from rest_framework import renderers
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+# U+2028 and U+2029 encoded in UTF-8
+LINE_SEPARATOR = b"\xe2\x80\xa8"
+PARAGRAPH_SEPARATOR = b"\xe2\x80\xa9"
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """Render JSON with orjson.
+
+    Produces the same bytes as the JSONRenderer of DRF: the types orjson
+    does not encode natively, including dates and times, go through the
+    DRF encoder. Pretty printed output, ASCII-only output and data orjson
+    rejects, e.g. integers over 64 bits, are rendered by the JSONRenderer.
+    NaN and infinite floats are rendered as null instead of raising.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is None and self.compact and not self.ensure_ascii:
+            try:
+                ret = orjson.dumps(
+                    data,
+                    default=self.encoder_class().default,
+                    option=ORJSON_OPTIONS,
+                )
+            except orjson.JSONEncodeError:
+                pass
+            else:
+                # Escaped by the JSONRenderer to output a javascript subset
+                return ret.replace(LINE_SEPARATOR, b"\\u2028").replace(
+                    PARAGRAPH_SEPARATOR, b"\\u2029"
+                )
+
+        return super().render(data, accepted_media_type, renderer_context)
+
+
+class EventStreamRenderer(renderers.JSONRenderer):
+    """Negotiate server-sent event streams.
+
+    Streams are returned as StreamingHttpResponse, only error responses
+    of the view are rendered, as JSON.
+    """
+
+    media_type = "text/event-stream"
+    format = "event-stream"
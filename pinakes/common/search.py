@@ -0,0 +1,131 @@
+"""Indexed and ranked search for the API.
+
+The SearchFilter of DRF turns a search into case-insensitive substring
+matches, i.e. ``UPPER(column::text) LIKE UPPER('%term%')`` on
+PostgreSQL, which scans the whole table. The trigram indexes built by
+``pinakes.common.models.indexes.trigram_index`` serve these matches, and
+TrigramSearchFilter ranks the results by similarity with the search
+terms.
+"""
+import operator
+from functools import reduce
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, models
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Coalesce, Greatest
+from rest_framework import filters
+from rest_framework.compat import distinct
+from rest_framework.settings import api_settings
+
+RANK = "search_rank"
+
+
+def _get_field(model, path):
+    """Model field at the end of a lookup path, None for annotations"""
+    opts = model._meta
+    field = None
+    for part in path.split(LOOKUP_SEP):
+        try:
+            field = opts.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        if hasattr(field, "get_path_info"):
+            opts = field.get_path_info()[-1].to_opts
+    return field
+
+
+class TrigramSearchFilter(filters.SearchFilter):
+    """Search filter with indexed matches and ranked results.
+
+    Matches the same objects as SearchFilter: every search term must be
+    contained in one of the search fields. Terms are compared with the
+    values of choice fields in Python, so searching them needs no index,
+    and the text fields are looked up through their trigram indexes.
+
+    On PostgreSQL the best matches come first, unless the client orders
+    the results.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+
+        if not search_fields or not search_terms:
+            return queryset
+
+        choice_fields = {}
+        text_fields = []
+        for search_field in map(str, search_fields):
+            field = (
+                None
+                if search_field[0] in self.lookup_prefixes
+                else _get_field(queryset.model, search_field)
+            )
+            if field is not None and field.choices:
+                choice_fields[search_field] = [
+                    str(value) for value, _label in field.flatchoices
+                ]
+            else:
+                text_fields.append(search_field)
+
+        base = queryset
+        conditions = []
+        for search_term in search_terms:
+            queries = [
+                models.Q(**{self.construct_search(field): search_term})
+                for field in text_fields
+            ]
+            term = search_term.lower()
+            for field, values in choice_fields.items():
+                matches = [value for value in values if term in value.lower()]
+                if matches:
+                    queries.append(models.Q(**{f"{field}__in": matches}))
+            if not queries:
+                return queryset.none()
+            conditions.append(reduce(operator.or_, queries))
+        queryset = queryset.filter(reduce(operator.and_, conditions))
+
+        if self.must_call_distinct(queryset, search_fields):
+            queryset = distinct(queryset, base)
+
+        if self._should_rank(request, queryset):
+            queryset = self.rank(queryset, text_fields, search_terms)
+        return queryset
+
+    def rank(self, queryset, text_fields, search_terms):
+        """Order by the similarity of the text fields with the terms"""
+        fields = [
+            field
+            for field in text_fields
+            if field[0] not in self.lookup_prefixes
+        ]
+        if not fields:
+            return queryset
+
+        scores = []
+        for search_term in search_terms:
+            similarities = [
+                TrigramWordSimilarity(search_term, field) for field in fields
+            ]
+            scores.append(
+                Coalesce(
+                    Greatest(*similarities)
+                    if len(similarities) > 1
+                    else similarities[0],
+                    0.0,
+                    output_field=models.FloatField(),
+                )
+            )
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return queryset.annotate(
+            **{RANK: reduce(operator.add, scores)}
+        ).order_by(f"-{RANK}", *ordering)
+
+    @staticmethod
+    def _should_rank(request, queryset):
+        return (
+            connections[queryset.db].vendor == "postgresql"
+            and api_settings.ORDERING_PARAM not in request.query_params
+        )
@@ -1,14 +1,57 @@
-"""Serializers for Tags"""
+"""Common serializers"""
+from typing import Optional
+
+from drf_spectacular.utils import OpenApiParameter
 from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+from pinakes.common import profiling
+
+FIELDS_PARAM = "fields"
+
+FIELDS_PARAMETER = OpenApiParameter(
+    FIELDS_PARAM,
+    required=False,
+    description=(
+        "Comma separated list of the fields to return, e.g. id,name."
+        " All the fields are returned by default"
+    ),
+)
+
+
+# Accounts the representation of the top-level objects as serialization in
+# the active profile. Nested serializers and fields are part of the time of
+# their top-level object, including the queries and Keycloak calls they
+# make. Documented in comments only: serializers without a docstring
+# inherit the schema description of the classes of the project.
+class ProfilingMixin:
+    def to_representation(self, instance):
+        if self.parent is not None and not (
+            isinstance(self.parent, serializers.ListSerializer)
+            and self.parent.parent is None
+        ):
+            return super().to_representation(instance)
 
+        with profiling.measure(profiling.SERIALIZE):
+            return super().to_representation(instance)
 
-class TagSerializer(serializers.Serializer):
+
+# Base classes of the serializers
+class Serializer(ProfilingMixin, serializers.Serializer):
+    pass
+
+
+class ModelSerializer(ProfilingMixin, serializers.ModelSerializer):
+    pass
+
+
+class TagSerializer(Serializer):
     """Tag definition"""
 
     name = serializers.CharField(max_length=100, help_text="Tag name")
 
 
-class TaskSerializer(serializers.Serializer):
+class TaskSerializer(Serializer):
     """Background task"""
 
     id = serializers.CharField(
@@ -25,3 +68,61 @@ class TaskSerializer(serializers.Serializer):
 
     def get_status(self, background_job) -> str:
         return background_job.get_status()
+
+
+def is_extra_requested(request) -> bool:
+    extra = request.GET.get("extra")
+    return bool(extra) and extra.lower() == "true"
+
+
+def selected_fields(request) -> Optional[set]:
+    """Names of the fields requested with the fields query parameter"""
+    value = request.GET.get(FIELDS_PARAM)
+    if not value:
+        return None
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+def is_field_rendered(serializer_class, name, request, many) -> bool:
+    """Whether a field of a DynamicFieldsMixin serializer is returned"""
+    selected = selected_fields(request)
+    if selected is not None:
+        return name in selected
+    heavy_fields = getattr(serializer_class.Meta, "heavy_fields", ())
+    return not many or name not in heavy_fields or is_extra_requested(request)
+
+
+class DynamicFieldsMixin:
+    """Leave fields out of the GET responses.
+
+    The ``heavy_fields`` of the Meta class are returned in lists only when
+    requested with ``extra=true``, and the ``fields`` query parameter
+    restricts the response to the given fields. Only the top-level objects
+    of the response are affected.
+
+    ``Meta.deferred_fields`` maps the large model columns to the fields
+    reading them. The QuerySetMixin defers the columns none of the fields
+    returned in a list reads.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is None or request.method not in SAFE_METHODS:
+            return fields
+
+        if self.parent is None:
+            many = False
+        elif (
+            isinstance(self.parent, serializers.ListSerializer)
+            and self.parent.parent is None
+        ):
+            many = True
+        else:
+            return fields
+
+        return {
+            name: field
+            for name, field in fields.items()
+            if is_field_rendered(type(self), name, request, many)
+        }
@@ -47,6 +47,7 @@ class TagMixin:
         tag_serializer = TagSerializer(data=request.data)
         if tag_serializer.is_valid():
             instance.tags.add(request.data["name"])
+            instance.save(update_fields=["updated_at"])
             return Response(
                 tag_serializer.data, status=status.HTTP_201_CREATED
             )
@@ -71,6 +72,7 @@ class TagMixin:
         tag_serializer = TagSerializer(data=request.data)
         if tag_serializer.is_valid():
             instance.tags.remove(request.data["name"])
+            instance.save(update_fields=["updated_at"])
             return Response(None, status=status.HTTP_204_NO_CONTENT)
 
         return Response(
@@ -0,0 +1,147 @@
+import time
+from importlib import import_module
+from unittest import mock
+
+import pytest
+import requests
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+from social_django.models import UserSocialAuth
+
+from pinakes.common.auth import middleware
+
+User = get_user_model()
+
+
+def _expired():
+    return {"expires": 60, "auth_time": int(time.time()) - 120}
+
+
+def _fresh():
+    return {"expires": int(time.time()) + 3600}
+
+
+@pytest.fixture
+def keycloak_user():
+    user = User.objects.create_user(username="fred")
+    return user.social_auth.create(
+        provider=middleware.KEYCLOAK_PROVIDER,
+        uid="fred-uid",
+        extra_data={"access_token": "access", "refresh_token": "refresh"},
+    )
+
+
+def _request(user, session=None):
+    request = RequestFactory().get("/api/pinakes/v1/portfolios/")
+    request.user = user
+    request.session = (
+        session or import_module(settings.SESSION_ENGINE).SessionStore()
+    )
+    return request
+
+
+def _process(request):
+    auth_middleware = middleware.KeycloakAuthMiddleware(
+        lambda request: HttpResponse()
+    )
+    auth_middleware(request)
+    return request
+
+
+@pytest.mark.django_db
+def test_keycloak_user_cached_in_session(
+    keycloak_user, django_assert_num_queries
+):
+    user = User.objects.get(id=keycloak_user.user_id)
+    first = _process(_request(user))
+
+    assert first.keycloak_user == keycloak_user
+
+    with django_assert_num_queries(0):
+        second = _process(_request(user, first.session))
+
+    assert second.keycloak_user.id == keycloak_user.id
+    assert second.keycloak_user.access_token == "access"
+
+
+@pytest.mark.django_db
+def test_expired_token_refreshed_once(mocker, keycloak_user):
+    keycloak_user.extra_data.update(_expired())
+    keycloak_user.save()
+
+    def refresh_token(self, strategy):
+        self.extra_data.update(access_token="new", **_fresh())
+        self.save()
+
+    refresh = mocker.patch.object(
+        UserSocialAuth, "refresh_token", autospec=True
+    )
+    refresh.side_effect = refresh_token
+    mocker.patch.object(middleware, "load_strategy")
+    user = keycloak_user.user
+
+    first = _process(_request(user))
+    second = _process(_request(user, first.session))
+
+    assert refresh.call_count == 1
+    assert first.keycloak_user.access_token == "new"
+    assert second.keycloak_user.access_token == "new"
+    assert cache.get(middleware.REFRESH_LOCK_KEY.format(user.pk)) is None
+
+
+@pytest.mark.django_db
+def test_token_refreshed_by_other_request(mocker, keycloak_user):
+    user = keycloak_user.user
+    request = _request(user)
+    request.session[middleware.SESSION_KEY] = {
+        "id": keycloak_user.id,
+        "user_id": user.pk,
+        "uid": keycloak_user.uid,
+        "extra_data": {"access_token": "old", **_expired()},
+    }
+    keycloak_user.extra_data.update(_fresh())
+    keycloak_user.save()
+    refresh = mocker.patch.object(UserSocialAuth, "refresh_token")
+
+    _process(request)
+
+    refresh.assert_not_called()
+    assert request.keycloak_user.access_token == "access"
+    assert (
+        request.session[middleware.SESSION_KEY]["extra_data"]["access_token"]
+        == "access"
+    )
+
+
+@pytest.mark.django_db
+def test_refresh_token_expired(mocker, keycloak_user):
+    keycloak_user.extra_data.update(_expired())
+    keycloak_user.save()
+    error = requests.HTTPError(response=mock.Mock(status_code=400))
+    mocker.patch.object(UserSocialAuth, "refresh_token", side_effect=error)
+    mocker.patch.object(middleware, "load_strategy")
+    logout = mocker.patch.object(middleware.django_auth, "logout")
+
+    request = _process(_request(keycloak_user.user))
+
+    logout.assert_called_once_with(request)
+    assert not hasattr(request, "keycloak_user")
+
+
+@pytest.mark.django_db
+def test_refresh_lock_timeout(mocker, settings, keycloak_user):
+    settings.PINAKES_KEYCLOAK_REFRESH_LOCK_TIMEOUT = 0
+    keycloak_user.extra_data.update(_expired())
+    keycloak_user.save()
+    user = keycloak_user.user
+    cache.add(middleware.REFRESH_LOCK_KEY.format(user.pk), True, 60)
+    refresh = mocker.patch.object(UserSocialAuth, "refresh_token")
+    mocker.patch.object(middleware, "load_strategy")
+
+    _process(_request(user))
+
+    refresh.assert_called_once()
+    assert cache.get(middleware.REFRESH_LOCK_KEY.format(user.pk))
@@ -0,0 +1,101 @@
+import io
+import os
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from pinakes.common import openapi
+
+
+@pytest.fixture
+def schema_root(settings, tmp_path):
+    settings.OPENAPI_SCHEMA_CACHE = True
+    settings.OPENAPI_SCHEMA_ROOT = str(tmp_path)
+    openapi.get_schema.cache_clear()
+    yield tmp_path
+    openapi.get_schema.cache_clear()
+
+
+@pytest.fixture
+def generate_schema(mocker):
+    return mocker.patch.object(
+        openapi, "generate_schema", return_value=b'{"openapi": "3.0.3"}'
+    )
+
+
+def _schema_file(schema_root):
+    return schema_root / f"openapi-{openapi.get_code_version()}.json"
+
+
+def test_schema_generated_once(schema_root, generate_schema):
+    first = openapi.get_schema()
+    second = openapi.get_schema()
+
+    assert first is second
+    assert first.content == b'{"openapi": "3.0.3"}'
+    assert first.etag.startswith('"')
+    assert _schema_file(schema_root).read_bytes() == first.content
+    generate_schema.assert_called_once()
+
+
+def test_schema_read_from_file(schema_root, generate_schema):
+    _schema_file(schema_root).write_bytes(b"{}")
+
+    assert openapi.get_schema().content == b"{}"
+    generate_schema.assert_not_called()
+
+
+def test_schema_of_other_version_ignored(schema_root, generate_schema):
+    (schema_root / "openapi-0.0.1.json").write_bytes(b"{}")
+
+    assert openapi.get_schema().content == b'{"openapi": "3.0.3"}'
+    generate_schema.assert_called_once()
+
+
+def test_schema_view_not_modified(client, schema_root, generate_schema):
+    url = reverse("schema")
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert response.content == b'{"openapi": "3.0.3"}'
+    assert response["Content-Type"] == "application/vnd.oai.openapi+json"
+    etag = response["ETag"]
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    generate_schema.assert_called_once()
+
+
+def test_schema_view_other_language(client, schema_root, generate_schema):
+    response = client.get(reverse("schema"), {"lang": "fr"})
+
+    assert response.status_code == 200
+    assert "ETag" not in response
+    generate_schema.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_cached_schema_matches_generated(client, settings, schema_root):
+    url = reverse("schema")
+    cached = client.get(url)
+    settings.OPENAPI_SCHEMA_CACHE = False
+    generated = client.get(url)
+
+    assert cached.content == generated.content
+
+
+def test_openapi_schema_command(schema_root, generate_schema):
+    out = io.StringIO()
+
+    call_command("openapi_schema", stdout=out)
+    call_command("openapi_schema", stdout=out)
+
+    assert os.path.exists(_schema_file(schema_root))
+    generate_schema.assert_called_once()
+
+    call_command("openapi_schema", "--force", stdout=out)
+
+    assert generate_schema.call_count == 2
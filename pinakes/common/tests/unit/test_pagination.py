@@ -0,0 +1,42 @@
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+import pytest
+
+from pinakes.common.pagination import CatalogSwitchablePagination
+from pinakes.main.common.models import Role
+
+
+def _request(**params):
+    return Request(APIRequestFactory().get("/api/roles/", params))
+
+
+@pytest.mark.django_db
+def test_switchable_pagination_page_number():
+    Role.objects.bulk_create(Role(name=f"role-{i}") for i in range(3))
+    paginator = CatalogSwitchablePagination()
+
+    page = paginator.paginate_queryset(
+        Role.objects.order_by("-id"), _request(page_size=2)
+    )
+    response = paginator.get_paginated_response([role.id for role in page])
+
+    assert paginator.cursor_paginator is None
+    assert response.data["count"] == 3
+    assert len(response.data["results"]) == 2
+
+
+@pytest.mark.django_db
+def test_switchable_pagination_cursor(django_assert_num_queries):
+    roles = Role.objects.bulk_create(Role(name=f"role-{i}") for i in range(3))
+    paginator = CatalogSwitchablePagination()
+
+    with django_assert_num_queries(1):
+        page = paginator.paginate_queryset(
+            Role.objects.all(), _request(pagination="cursor", page_size=2)
+        )
+    response = paginator.get_paginated_response([role.id for role in page])
+
+    assert paginator.cursor_paginator is not None
+    assert "count" not in response.data
+    assert response.data["results"] == [roles[2].id, roles[1].id]
+    assert "cursor=" in response.data["next"]
@@ -0,0 +1,157 @@
+from unittest import mock
+
+import pytest
+from psycopg2 import extensions
+
+from pinakes.common.db.postgresql import base
+
+
+def _connection(status=extensions.TRANSACTION_STATUS_IDLE):
+    connection = mock.Mock(closed=0, autocommit=True)
+    connection.info.transaction_status = status
+
+    def close():
+        connection.closed = 1
+
+    connection.close.side_effect = close
+    return connection
+
+
+def test_pool_reuses_returned_connection():
+    pool = base.ConnectionPool(2, 1)
+    first = _connection()
+
+    assert pool.get(lambda: first) is first
+    pool.put(first)
+
+    assert pool.get(lambda: _connection()) is first
+
+
+def test_pool_rolls_back_open_transaction():
+    pool = base.ConnectionPool(1, 1)
+    connection = _connection(extensions.TRANSACTION_STATUS_INTRANS)
+
+    pool.get(lambda: connection)
+    pool.put(connection)
+
+    connection.rollback.assert_called_once()
+    assert pool.get(lambda: _connection()) is connection
+
+
+def test_pool_drops_broken_connection():
+    pool = base.ConnectionPool(1, 1)
+    broken = _connection(extensions.TRANSACTION_STATUS_UNKNOWN)
+    pool.get(lambda: broken)
+    pool.put(broken)
+
+    new = _connection()
+    assert pool.get(lambda: new) is new
+    assert broken.closed
+
+
+def test_pool_replaces_unusable_connection():
+    pool = base.ConnectionPool(1, 1)
+    stale = _connection()
+    pool.get(lambda: stale)
+    pool.put(stale)
+    stale.cursor.side_effect = base.psycopg2.OperationalError
+
+    new = _connection()
+    assert pool.get(lambda: new, check=True) is new
+    assert stale.closed
+
+
+def test_pool_timeout():
+    pool = base.ConnectionPool(1, 0.01)
+    pool.get(lambda: _connection())
+
+    with pytest.raises(base.PoolTimeout):
+        pool.get(lambda: _connection())
+
+
+def test_pool_released_on_connect_error():
+    pool = base.ConnectionPool(1, 0.01)
+
+    with pytest.raises(base.psycopg2.OperationalError):
+        pool.get(mock.Mock(side_effect=base.psycopg2.OperationalError))
+
+    connection = _connection()
+    assert pool.get(lambda: connection) is connection
+
+
+def test_get_pool_recreated_after_fork(mocker):
+    mocker.patch.dict(base._pools, clear=True)
+    mocker.patch.object(base, "_inherited_pools", [])
+    settings_dict = {"POOL_SIZE": 2, "POOL_TIMEOUT": 1}
+
+    assert base.get_pool("default", {"POOL_SIZE": 0}) is None
+    pool = base.get_pool("default", settings_dict)
+    assert base.get_pool("default", settings_dict) is pool
+
+    mocker.patch("os.getpid", return_value=pool.pid + 1)
+    child_pool = base.get_pool("default", settings_dict)
+
+    assert child_pool is not pool
+    assert base._inherited_pools == [pool]
+
+
+def _wrapper(**settings):
+    return base.DatabaseWrapper(
+        {"CONN_HEALTH_CHECKS": True, "CONN_MAX_AGE": 60, **settings},
+        "default",
+    )
+
+
+def test_health_check_replaces_unusable_connection(mocker):
+    wrapper = _wrapper()
+    wrapper.connection = mock.Mock()
+    mocker.patch.object(wrapper, "is_usable", return_value=False)
+    close = mocker.patch.object(wrapper, "close")
+
+    wrapper._check_health()
+    wrapper._check_health()
+
+    close.assert_called_once()
+    assert wrapper.health_check_done
+
+
+def test_health_check_once_per_request(mocker):
+    wrapper = _wrapper()
+    wrapper.connection = mock.Mock()
+    is_usable = mocker.patch.object(wrapper, "is_usable", return_value=True)
+    mocker.patch.object(wrapper, "close")
+
+    wrapper._check_health()
+    wrapper._check_health()
+    assert is_usable.call_count == 1
+
+    mocker.patch(
+        "django.db.backends.base.base.BaseDatabaseWrapper"
+        ".close_if_unusable_or_obsolete"
+    )
+    wrapper.close_if_unusable_or_obsolete()
+    wrapper._check_health()
+    assert is_usable.call_count == 2
+
+
+def test_health_check_disabled(mocker):
+    wrapper = _wrapper(CONN_HEALTH_CHECKS=False)
+    wrapper.connection = mock.Mock()
+    is_usable = mocker.patch.object(wrapper, "is_usable")
+
+    wrapper._check_health()
+
+    is_usable.assert_not_called()
+
+
+def test_close_returns_connection_to_pool(mocker):
+    mocker.patch.dict(base._pools, clear=True)
+    wrapper = _wrapper(POOL_SIZE=1, POOL_TIMEOUT=1)
+    connection = _connection()
+    wrapper.pool.get(lambda: connection)
+    wrapper.connection = connection
+
+    wrapper._close()
+
+    assert not connection.closed
+    assert wrapper.pool.get(lambda: _connection()) is connection
@@ -0,0 +1,91 @@
+from django.http import HttpResponse
+from django.test import RequestFactory
+import pytest
+
+from pinakes.common import profiling
+from pinakes.main.catalog.tests.factories import PortfolioFactory
+from pinakes.main.common.models import Role
+
+
+@pytest.mark.django_db
+def test_profile_counts_queries():
+    with profiling.profile() as profile:
+        Role.objects.filter(name="a").count()
+        Role.objects.filter(name="a").count()
+        Role.objects.filter(name="b").count()
+
+    assert profile.calls[profiling.DB] == 3
+    assert profile.duplicate_queries == 1
+    assert profile.repeated_queries()[0]["count"] == 3
+    assert profile.duration is not None
+    assert profiling.current() is None
+
+
+def test_measure():
+    with profiling.measure(profiling.KEYCLOAK):
+        pass
+
+    with profiling.profile() as profile:
+        with profiling.measure(profiling.KEYCLOAK):
+            pass
+        with profiling.measure(profiling.CONTROLLER):
+            pass
+        with profiling.measure(profiling.CONTROLLER):
+            pass
+
+    assert profile.calls[profiling.KEYCLOAK] == 1
+    assert profile.calls[profiling.CONTROLLER] == 2
+
+
+def test_is_sampled(settings):
+    settings.PINAKES_PROFILING_SAMPLE_RATE = 0.0
+    assert not profiling.is_sampled()
+    settings.PINAKES_PROFILING_SAMPLE_RATE = 1.0
+    assert profiling.is_sampled()
+
+
+@pytest.mark.django_db
+def test_middleware(settings, caplog):
+    settings.PINAKES_PROFILING_SAMPLE_RATE = 1.0
+
+    def get_response(request):
+        Role.objects.count()
+        return HttpResponse(profiling.JSONRenderer().render({"a": 1}))
+
+    middleware = profiling.ProfilingMiddleware(get_response)
+    with caplog.at_level("INFO", logger="pinakes.profiling"):
+        response = middleware(RequestFactory().get("/api/v1/portfolios/"))
+
+    timing = response["Server-Timing"]
+    assert "db;dur=" in timing
+    assert '"1 queries, 0 duplicates"' in timing
+    assert "serialize;dur=" in timing
+    assert "render;dur=" in timing
+    assert "total;dur=" in timing
+    record = caplog.records[-1]
+    assert record.profile["path"] == "/api/v1/portfolios/"
+    assert record.profile["db_queries"] == 1
+    assert record.profile["status"] == 200
+
+
+@pytest.mark.django_db
+def test_profile_serialization(api_request):
+    """The top-level objects of a list are serialized in the profile"""
+    PortfolioFactory.create_batch(3)
+
+    with profiling.profile() as profile:
+        response = api_request("get", "catalog:portfolio-list")
+
+    assert response.status_code == 200
+    assert profile.calls[profiling.SERIALIZE] == 3
+    assert profile.durations[profiling.SERIALIZE] > 0
+    assert profile.calls[profiling.RENDER] == 1
+
+
+def test_middleware_not_sampled(settings):
+    settings.PINAKES_PROFILING_SAMPLE_RATE = 0.0
+    middleware = profiling.ProfilingMiddleware(lambda request: HttpResponse())
+
+    response = middleware(RequestFactory().get("/"))
+
+    assert not response.has_header("Server-Timing")
@@ -0,0 +1,92 @@
+import datetime
+from unittest import mock
+
+import pytest
+
+from pinakes.common import queues
+from pinakes.main.approval.tasks import email_task
+from pinakes.main.common.models import Task
+from pinakes.main.models import Source
+from pinakes.main.inventory.tasks import launch_tower_task, refresh_task
+from pinakes.main.tests.factories import UserFactory, default_tenant
+
+
+def test_get_queue_name():
+    assert queues.get_queue_name(email_task) == queues.INTERACTIVE
+    assert queues.get_queue_name(launch_tower_task) == queues.PROVISIONING
+    assert queues.get_queue_name(refresh_task) == queues.SYNC
+    assert (
+        queues.get_queue_name("pinakes.main.analytics.tasks.gather_analytics")
+        == queues.ANALYTICS
+    )
+    assert (
+        queues.get_queue_name("pinakes.main.common.tasks.clear_sessions")
+        == queues.DEFAULT
+    )
+
+
+@pytest.mark.django_db
+def test_enqueue(mocker):
+    get_queue = mocker.patch("django_rq.get_queue")
+    get_queue.return_value.name = queues.SYNC
+    tenant = default_tenant()
+    user = UserFactory()
+    owner = mock.Mock(id=5, tenant_id=tenant.id)
+    owner.__class__ = Source
+
+    queues.enqueue(refresh_task, 1, 2, owner=owner, user=user)
+
+    get_queue.assert_called_once_with(queues.SYNC)
+    enqueue = get_queue.return_value.enqueue
+    enqueue.assert_called_once_with(
+        refresh_task, 1, 2, job_id=enqueue.call_args.kwargs["job_id"]
+    )
+    task = Task.objects.get(id=enqueue.call_args.kwargs["job_id"])
+    assert task.func_name == "pinakes.main.inventory.tasks.refresh_task"
+    assert task.queue == queues.SYNC
+    assert task.status == Task.Status.QUEUED
+    assert task.owner_type == "Source"
+    assert task.owner_id == 5
+    assert task.tenant == tenant
+    assert task.user == user
+
+
+@pytest.mark.django_db
+def test_enqueue_without_owner(mocker):
+    get_queue = mocker.patch("django_rq.get_queue")
+    get_queue.return_value.name = queues.INTERACTIVE
+
+    queues.enqueue(email_task, 1, job_id="abc")
+
+    task = Task.objects.get(id="abc")
+    assert task.owner_type == ""
+    assert task.tenant == default_tenant()
+    assert task.user is None
+
+
+def test_get_queue_stats(mocker, settings):
+    settings.RQ_QUEUES = {"interactive": {}, "sync": {}}
+    enqueued_at = datetime.datetime.utcnow() - datetime.timedelta(minutes=1)
+
+    busy_queue = mock.Mock(count=3)
+    busy_queue.get_job_ids.return_value = ["abc"]
+    busy_queue.fetch_job.return_value = mock.Mock(enqueued_at=enqueued_at)
+    busy_queue.started_job_registry.count = 1
+    busy_queue.failed_job_registry.count = 0
+
+    empty_queue = mock.Mock(count=0)
+    empty_queue.get_job_ids.return_value = []
+    empty_queue.started_job_registry.count = 0
+    empty_queue.failed_job_registry.count = 2
+
+    mocker.patch("django_rq.get_queue", side_effect=[busy_queue, empty_queue])
+
+    stats = queues.get_queue_stats()
+
+    assert [item["name"] for item in stats] == ["interactive", "sync"]
+    assert stats[0]["queued"] == 3
+    assert stats[0]["started"] == 1
+    assert stats[0]["latency"] >= 60
+    assert stats[1]["queued"] == 0
+    assert stats[1]["failed"] == 2
+    assert stats[1]["latency"] == 0
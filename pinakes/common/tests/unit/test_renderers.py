@@ -0,0 +1,80 @@
+import datetime
+import decimal
+import io
+import uuid
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework import parsers, renderers
+from rest_framework.exceptions import ParseError
+
+from pinakes.common.parsers import ORJSONParser
+from pinakes.common.renderers import ORJSONRenderer
+
+DATA = {
+    "id": 1,
+    "name": "Portfolio ü",
+    "state": gettext_lazy("Completed"),
+    "created_at": datetime.datetime(
+        2022, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc
+    ),
+    "naive": datetime.datetime(2022, 1, 2, 3, 4, 5),
+    "date": datetime.date(2022, 1, 2),
+    "time": datetime.time(3, 4, 5, 6),
+    "duration": datetime.timedelta(minutes=1),
+    "price": decimal.Decimal("1.50"),
+    "uuid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "bytes": b"raw",
+    "separators": "\u2028\u2029",
+    "tuple": (1, "a", None, True, 1.5),
+    "nested": [{"schema": {"fields": [{"name": "x", "type": "text"}]}}],
+    1: "int key",
+}
+
+
+def test_renders_same_bytes_as_drf():
+    assert ORJSONRenderer().render(DATA) == renderers.JSONRenderer().render(
+        DATA
+    )
+
+
+def test_renders_none():
+    assert ORJSONRenderer().render(None) == b""
+
+
+@pytest.mark.parametrize(
+    "data, media_type, context",
+    [
+        ({"big": 2**70}, None, None),
+        (DATA, "application/json; indent=4", None),
+        (DATA, None, {"indent": 2}),
+    ],
+)
+def test_falls_back_to_drf(data, media_type, context):
+    assert ORJSONRenderer().render(
+        data, media_type, context
+    ) == renderers.JSONRenderer().render(data, media_type, context)
+
+
+def test_parses_same_data_as_drf():
+    content = renderers.JSONRenderer().render(DATA)
+
+    assert ORJSONParser().parse(
+        io.BytesIO(content)
+    ) == parsers.JSONParser().parse(io.BytesIO(content))
+
+
+@pytest.mark.parametrize("content", [b"{", b'{"a": NaN}'])
+def test_parse_error(content):
+    with pytest.raises(ParseError, match="JSON parse error"):
+        ORJSONParser().parse(io.BytesIO(content))
+
+
+def test_parses_other_encoding():
+    content = '{"name": "ü"}'.encode("utf-16")
+
+    data = ORJSONParser().parse(
+        io.BytesIO(content), parser_context={"encoding": "utf-16"}
+    )
+
+    assert data == {"name": "ü"}
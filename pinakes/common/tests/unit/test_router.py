@@ -0,0 +1,176 @@
+from unittest import mock
+
+import jwt
+import pytest
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from pinakes.common.db import router
+from pinakes.main.catalog.models import Portfolio
+
+
+@pytest.fixture
+def replica(mocker, settings):
+    settings.PINAKES_REPLICA_LAG_CHECK_INTERVAL = 60
+    settings.PINAKES_REPLICA_MAX_LAG = 5
+    mocker.patch.object(router, "is_configured", return_value=True)
+    lag = mocker.patch.object(router, "_check_lag", return_value=True)
+    router.reset_lag_check()
+    yield lag
+    router.reset_lag_check()
+
+
+def test_reads_from_primary_outside_block(replica):
+    assert router.ReplicaRouter().db_for_read(Portfolio) == DEFAULT_DB_ALIAS
+
+
+def test_reads_from_replica_in_block(replica):
+    with router.use_replica():
+        assert router.ReplicaRouter().db_for_read(Portfolio) == router.REPLICA
+
+    assert router.read_alias() == DEFAULT_DB_ALIAS
+
+
+def test_reads_from_primary_without_replica(replica):
+    router.is_configured.return_value = False
+
+    with router.use_replica():
+        assert router.read_alias() == DEFAULT_DB_ALIAS
+
+
+@pytest.mark.django_db
+def test_reads_from_primary_in_transaction(replica):
+    with router.use_replica(), transaction.atomic():
+        assert router.read_alias() == DEFAULT_DB_ALIAS
+
+
+def test_reads_from_primary_after_write(replica):
+    db_router = router.ReplicaRouter()
+    with router.use_replica():
+        assert db_router.db_for_write(Portfolio) == DEFAULT_DB_ALIAS
+        assert db_router.db_for_read(Portfolio) == DEFAULT_DB_ALIAS
+
+    with router.use_replica():
+        assert db_router.db_for_read(Portfolio) == router.REPLICA
+
+
+def test_reads_from_primary_when_replica_stale(replica):
+    replica.return_value = False
+
+    with router.use_replica():
+        assert router.read_alias() == DEFAULT_DB_ALIAS
+        assert router.read_alias() == DEFAULT_DB_ALIAS
+
+    replica.assert_called_once()
+
+
+def test_lag_checked_periodically(replica, settings):
+    settings.PINAKES_REPLICA_LAG_CHECK_INTERVAL = 0
+
+    with router.use_replica():
+        router.read_alias()
+        router.read_alias()
+
+    assert replica.call_count == 2
+
+
+def _replica_connection(mocker, lag=None, error=None):
+    connection = mock.MagicMock(vendor="postgresql")
+    cursor = connection.cursor.return_value.__enter__.return_value
+    cursor.fetchone.return_value = (lag,)
+    cursor.execute.side_effect = error
+    mocker.patch.object(router, "connections", {router.REPLICA: connection})
+
+
+@pytest.mark.parametrize(
+    "lag, error, fresh",
+    [
+        (None, None, True),
+        (0, None, True),
+        (4.5, None, True),
+        (30, None, False),
+        (None, DatabaseError, False),
+    ],
+)
+def test_check_lag(mocker, settings, lag, error, fresh):
+    settings.PINAKES_REPLICA_MAX_LAG = 5
+    _replica_connection(mocker, lag, error)
+
+    assert router._check_lag() is fresh
+
+
+def test_allow_migrate():
+    db_router = router.ReplicaRouter()
+
+    assert db_router.allow_migrate(router.REPLICA, "main") is False
+    assert db_router.allow_migrate(DEFAULT_DB_ALIAS, "main") is None
+
+
+def _middleware(seen):
+    def get_response(request):
+        seen.append(router.read_alias())
+        return HttpResponse()
+
+    return router.ReplicaMiddleware(get_response)
+
+
+def test_middleware_safe_request(replica):
+    seen = []
+
+    response = _middleware(seen)(RequestFactory().get("/api/v1/orders/"))
+
+    assert seen == [router.REPLICA]
+    assert router.PIN_COOKIE not in response.cookies
+
+
+def test_middleware_unsafe_request_pins_client(replica, settings):
+    settings.PINAKES_REPLICA_PIN_SECONDS = 10
+    seen = []
+    middleware = _middleware(seen)
+
+    response = middleware(RequestFactory().post("/api/v1/orders/1/submit/"))
+    assert response.cookies[router.PIN_COOKIE]["max-age"] == 10
+
+    request = RequestFactory().get("/api/v1/orders/1/")
+    request.COOKIES[router.PIN_COOKIE] = "1"
+    middleware(request)
+
+    assert seen == [DEFAULT_DB_ALIAS, DEFAULT_DB_ALIAS]
+
+
+def test_middleware_unsafe_request_pins_token_user(replica, settings):
+    settings.PINAKES_REPLICA_PIN_SECONDS = 10
+    token = jwt.encode({"sub": "fred"}, "", algorithm="none")
+    headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+    other_token = jwt.encode({"sub": "barney"}, "", algorithm="none")
+    seen = []
+    middleware = _middleware(seen)
+
+    try:
+        middleware(RequestFactory().post("/api/v1/orders/bulk/", **headers))
+        # Bearer clients keep no cookies
+        middleware(RequestFactory().get("/api/v1/orders/1/", **headers))
+        middleware(
+            RequestFactory().get(
+                "/api/v1/orders/1/",
+                HTTP_AUTHORIZATION=f"Bearer {other_token}",
+            )
+        )
+    finally:
+        cache.delete(router.PIN_CACHE_KEY.format("fred"))
+
+    assert seen == [DEFAULT_DB_ALIAS, DEFAULT_DB_ALIAS, router.REPLICA]
+
+
+def test_middleware_invalid_token(replica):
+    seen = []
+
+    _middleware(seen)(
+        RequestFactory().get(
+            "/api/v1/orders/", HTTP_AUTHORIZATION="Bearer invalid"
+        )
+    )
+
+    assert seen == [router.REPLICA]
@@ -0,0 +1,70 @@
+from unittest import mock
+
+import pytest
+from django.db import connection
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from pinakes.common.search import RANK, TrigramSearchFilter
+from pinakes.main.catalog.models import Order, Portfolio
+from pinakes.main.catalog.tests.factories import OrderFactory, PortfolioFactory
+
+
+def _search(model, search_fields, **params):
+    request = Request(APIRequestFactory().get("/", params))
+    view = mock.Mock(search_fields=search_fields)
+    return TrigramSearchFilter().filter_queryset(
+        request, model.objects.order_by("id"), view
+    )
+
+
+@pytest.mark.django_db
+def test_search_choice_field():
+    completed = OrderFactory(state=Order.State.COMPLETED)
+    OrderFactory(state=Order.State.PENDING)
+
+    assert list(_search(Order, ("state",), search="PLET")) == [completed]
+    assert list(_search(Order, ("state",), search="nothing")) == []
+
+
+@pytest.mark.django_db
+def test_search_text_and_choice_fields():
+    order = OrderFactory(state=Order.State.COMPLETED)
+    OrderFactory(state=Order.State.PENDING)
+
+    assert list(
+        _search(Order, ("state", "user__username"), search="comp")
+    ) == [order]
+    assert list(
+        _search(Order, ("state", "user__username"), search=order.user.username)
+    ) == [order]
+
+
+@pytest.mark.django_db
+def test_search_every_term():
+    web = PortfolioFactory(name="web servers", description="")
+    PortfolioFactory(name="web", description="")
+
+    queryset = _search(Portfolio, ("name", "description"), search="web serv")
+
+    assert list(queryset) == [web]
+
+
+@pytest.mark.django_db
+def test_search_ranked_on_postgresql():
+    best = PortfolioFactory(name="database", description="")
+    other = PortfolioFactory(name="other", description="a database backup")
+
+    queryset = _search(Portfolio, ("name", "description"), search="database")
+
+    if connection.vendor == "postgresql":
+        assert RANK in queryset.query.annotations
+        assert list(queryset) == [best, other]
+    else:
+        assert RANK not in queryset.query.annotations
+    assert (
+        RANK
+        not in _search(
+            Portfolio, ("name",), search="database", ordering="name"
+        ).query.annotations
+    )
@@ -0,0 +1,35 @@
+"""Test cached translation of message templates"""
+from django.utils import translation as django_translation
+
+from pinakes.common import translation
+
+
+def test_render():
+    translation._render.cache_clear()
+
+    assert translation.render("Order %(id)d", {"id": 1}) == "Order 1"
+    assert translation.render("Order %(id)d", {"id": 1}) == "Order 1"
+    assert translation.render("Order %(id)d", {"id": 2}) == "Order 2"
+    assert translation.render("Created") == "Created"
+    assert translation.render("") == ""
+
+    info = translation._render.cache_info()
+    assert info.hits == 1
+    assert info.misses == 3
+
+
+def test_render_by_language():
+    with django_translation.override("es"):
+        assert translation.render("Nothing to update") == (
+            "Nada que actualizar"
+        )
+    assert translation.render("Nothing to update") == "Nothing to update"
+
+
+def test_language_codes():
+    codes = translation.language_codes()
+
+    assert codes[0] == "en"
+    assert "zh-hans" in codes
+    assert "fr" in codes
+    assert len(codes) == len(set(codes))
@@ -0,0 +1,62 @@
+"""Cached translation of message templates.
+
+Progress messages and source refresh summaries are stored as untranslated
+templates with their parameters. Rendering the same template with the
+same parameters in the same language gives the same text, so rendered
+messages are cached in a bounded LRU cache keyed by the language, the
+template and the serialized parameters.
+"""
+import functools
+import json
+import os
+
+from django.conf import settings
+from django.utils import translation
+
+CACHE_SIZE = 4096
+
+
+def render(message: str, params: dict = None) -> str:
+    """Translate a message template in the active language and format it"""
+    if not message:
+        return message
+    params_key = (
+        json.dumps(params, sort_keys=True, default=str) if params else ""
+    )
+    return _render(translation.get_language(), message, params_key)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _render(language, message, params_key):
+    text = translation.gettext(message)
+    if params_key:
+        text = text % json.loads(params_key)
+    return text
+
+
+def language_codes() -> list:
+    """The languages that requests can activate, as LocaleMiddleware does.
+
+    These are the default language and the languages having a message
+    catalog in LOCALE_PATHS.
+    """
+    locales = [settings.LANGUAGE_CODE]
+    for path in settings.LOCALE_PATHS:
+        if os.path.isdir(path):
+            locales.extend(
+                locale
+                for locale in sorted(os.listdir(path))
+                if os.path.isdir(os.path.join(path, locale, "LC_MESSAGES"))
+            )
+
+    codes = []
+    for locale in locales:
+        try:
+            code = translation.get_supported_language_variant(
+                translation.to_language(locale)
+            )
+        except LookupError:
+            continue
+        if code not in codes:
+            codes.append(code)
+    return codes
@@ -5,10 +5,11 @@ import distro
 from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
+from django.db import connections
 
 from insights_analytics_collector import CsvFileSplitter, register
 
-from pinakes.main.analytics.collector import AnalyticsCollector
+from pinakes.common.db import router
 from pinakes.main.analytics.package import Package
 from pinakes.main.approval.models import Request
 from pinakes.main.catalog import models
@@ -583,7 +584,7 @@ def product_counts(since, **kwargs):
 def tag_counts_by_portfolio(since, **kwargs):
     counts = {}
 
-    portfolios = models.Portfolio.objects.all()
+    portfolios = models.Portfolio.objects.prefetch_related("tags")
 
     for portfolio in portfolios:
         tag_resource_list = []
@@ -617,7 +618,7 @@ def tag_counts_by_portfolio(since, **kwargs):
 def tag_counts_by_product(since, **kwargs):
     counts = {}
 
-    products = models.PortfolioItem.objects.all()
+    products = models.PortfolioItem.objects.prefetch_related("tags")
 
     for product in products:
         tag_resource_list = []
@@ -651,7 +652,7 @@ def tag_counts_by_product(since, **kwargs):
 def tag_counts_by_service_intentory(since, **kwargs):
     counts = {}
 
-    service_intentories = ServiceInventory.objects.all()
+    service_intentories = ServiceInventory.objects.prefetch_related("tags")
 
     for service_intentory in service_intentories:
         tag_resource_list = []
@@ -860,7 +861,7 @@ def _simple_csv(
     file_path = _get_file_path(full_path, file_name)
     file = CsvFileSplitter(filespec=file_path, max_file_size=max_data_size)
 
-    with AnalyticsCollector.db_connection().cursor() as cursor:
+    with connections[router.read_alias()].cursor() as cursor:
         cursor.copy_expert(query, file)
 
     return file.file_list()
@@ -1,19 +1,20 @@
 """Tasks for metrics collection"""
 import logging
-import django_rq
-from rq import Queue
 from rq.job import Job
 from rq import get_current_job
 from rq import exceptions
 
 from django.utils.timezone import make_aware
 
+from pinakes.common import queues
+from pinakes.common.db import router
 from pinakes.main.analytics.collector import AnalyticsCollector
 from pinakes.main.analytics import analytics_collectors
 
 logger = logging.getLogger("analytics")
 
 
+@queues.task_queue(queues.ANALYTICS)
 def gather_analytics():
     collector = AnalyticsCollector(
         collector_module=analytics_collectors,
@@ -29,12 +30,14 @@ def gather_analytics():
     job.meta["last_gather"] = saved_last_gather
     job.save_meta()
 
-    collector.gather(since=saved_last_gather)
+    # The exports only read, they are served by the read replica if any
+    with router.use_replica():
+        collector.gather(since=saved_last_gather)
 
 
 def get_last_gather():
-    connection = django_rq.get_connection()
-    queue = Queue(connection=connection)
+    queue = queues.get_queue(gather_analytics)
+    connection = queue.connection
 
     last_finished_job = get_last_successful_gather_job(
         queue.finished_job_registry, connection
@@ -1,11 +1,13 @@
 """Models for Approval"""
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.db.models.functions import Length
 from django.contrib.auth import get_user_model
 from django.core.signing import Signer
 
 from pinakes.common.models.fields import EncryptedJsonField
-from pinakes.main.models import BaseModel, ImageableModel
+from pinakes.common.models.indexes import trigram_index
+from pinakes.main.models import BaseModel, ImageableModel, Tenant
 from pinakes.common.auth.keycloak_django.models import KeycloakMixin
 from pinakes.common.auth.keycloak_django import AbstractKeycloakResource
 
@@ -145,7 +147,11 @@ class Workflow(KeycloakMixin, BaseModel):
     """Workflow model"""
 
     KEYCLOAK_TYPE = "approval:workflow"
-    INTERNAL_INTERVAL = 1024  # an integer must be greater than 1
+    INTERNAL_INTERVAL = 2**32  # an integer must be greater than 1
+    # gaps smaller than this are rebalanced in the background
+    REBALANCE_GAP = 2**16
+
+    needs_rebalance = False
 
     name = models.CharField(max_length=255, help_text="Name of the workflow")
     description = models.TextField(
@@ -169,6 +175,7 @@ class Workflow(KeycloakMixin, BaseModel):
 
     class Meta:
         ordering = ["internal_sequence"]
+        indexes = [models.Index(fields=["tenant", "internal_sequence"])]
         constraints = [
             models.CheckConstraint(
                 name="%(app_label)s_%(class)s_name_empty",
@@ -197,102 +204,124 @@ class Workflow(KeycloakMixin, BaseModel):
         internal_sequence number much greater than the value from previous tail
         of the list. When workflow_a is moved to between workflow_b and
         workflow_c, its internal_sequence is simply adjusted to the average
-        number of b and c unless the average becomes a decimal, in which case
-        all the internal_sequence numbers will get rebalanced with a big
-        interval again.
+        number of b and c, which takes one indexed read of the two neighbours.
+        Only when b and c are adjacent numbers all the internal_sequence
+        numbers of the tenant get rebalanced with a big interval again. Gaps
+        getting small set needs_rebalance, so the caller can rebalance them
+        in the background long before they close.
         """
         if delta == 0:
             return
 
         if delta > 0:
-            self.internal_sequence = self._internal_sequence_plus(delta)
+            query = self._tenant_workflows().filter(
+                internal_sequence__gt=self.internal_sequence
+            )
         else:
-            self.internal_sequence = self._internal_sequence_minus(-delta)
-
-    def _internal_sequence_plus(self, delta):
-        query = Workflow.objects.filter(
-            internal_sequence__gt=self.internal_sequence
+            query = self._tenant_workflows().filter(
+                internal_sequence__lt=self.internal_sequence
+            )
+        sequence_range = list(
+            query.order_by(
+                "internal_sequence" if delta > 0 else "-internal_sequence"
+            ).values_list("internal_sequence", flat=True)[
+                (abs(delta) - 1) : (abs(delta) + 1)
+            ]
         )
-        sequence_range = self._internal_sequence_range(query, delta)
 
-        if len(sequence_range) == 0:
-            return self._internal_sequence_extend_from_last()
-
-        if len(sequence_range) == 1:
-            return sequence_range[0] + Workflow.INTERNAL_INTERVAL
+        if len(sequence_range) < 2:
+            if delta > 0:
+                self.move_to_bottom()
+            else:
+                self.move_to_top()
+            return
 
-        if sequence_range[1] - sequence_range[0] < 2:
+        if abs(sequence_range[1] - sequence_range[0]) < 2:
             self._rebalance_internal_sequences()
-            return self._internal_sequence_plus(delta)
-
-        return (sequence_range[0] + sequence_range[1]) // 2
+            self.move_internal_sequence(delta)
+            return
 
-    def _internal_sequence_minus(self, delta):
-        query = Workflow.objects.filter(
-            internal_sequence__lt=self.internal_sequence
-        ).order_by("-internal_sequence")
-        sequence_range = self._internal_sequence_range(query, delta)
-        if len(sequence_range) == 0:
-            return self._internal_sequence_before_first()
+        self._move_between(*sequence_range)
 
-        if len(sequence_range) == 1:
-            return self._half_first_internal_sequence(sequence_range[0])
+    def move_to_top(self):
+        """Move current record before all other records"""
+        first_sequence = self._edge_internal_sequence("internal_sequence")
+        if first_sequence is None:
+            return
 
-        if sequence_range[0] - sequence_range[1] < 2:
+        if first_sequence < 2:
             self._rebalance_internal_sequences()
-            return self._internal_sequence_minus(delta)
+            self.move_to_top()
+            return
 
-        return (sequence_range[0] + sequence_range[1]) // 2
+        self._move_between(0, first_sequence)
 
-    def _internal_sequence_range(self, query, delta):
-        return query.values_list("internal_sequence", flat=True)[
-            (delta - 1) : (delta + 1)
-        ]
+    def move_to_bottom(self):
+        """Move current record after all other records"""
+        last_sequence = self._edge_internal_sequence("-internal_sequence")
+        if last_sequence is None:
+            return
 
-    def _internal_sequence_extend_from_last(self):
-        last_sequence = (
-            Workflow.objects.filter(tenant=self.tenant)
-            .values_list("internal_sequence", flat=True)
-            .last()
+        self.internal_sequence = last_sequence + Workflow.INTERNAL_INTERVAL
+
+    def _tenant_workflows(self):
+        return Workflow.objects.filter(tenant_id=self.tenant_id).exclude(
+            id=self.id
         )
-        return last_sequence + Workflow.INTERNAL_INTERVAL
 
-    def _internal_sequence_before_first(self):
-        first_sequence = (
-            Workflow.objects.filter(tenant=self.tenant)
+    def _edge_internal_sequence(self, ordering):
+        return (
+            self._tenant_workflows()
+            .order_by(ordering)
             .values_list("internal_sequence", flat=True)
             .first()
         )
-        return self._half_first_internal_sequence(first_sequence)
 
-    def _half_first_internal_sequence(self, first_sequence):
-        if first_sequence < 2:
-            self._rebalance_internal_sequences()
-            return Workflow.INTERNAL_INTERVAL // 2
-        return first_sequence // 2
+    def _move_between(self, sequence, other_sequence):
+        self.internal_sequence = (sequence + other_sequence) // 2
+        self.needs_rebalance = (
+            abs(other_sequence - sequence) < Workflow.REBALANCE_GAP
+        )
 
     def _rebalance_internal_sequences(self):
-        workflows = Workflow.objects.filter(tenant=self.tenant)
-        new_sequence = 0
-        for workflow in workflows:
-            new_sequence = new_sequence + Workflow.INTERNAL_INTERVAL
-            workflow.internal_sequence = new_sequence
-
-        Workflow.objects.bulk_update(workflows, ["internal_sequence"])
-        self.refresh_from_db()
+        Workflow.rebalance_internal_sequences(self.tenant_id)
+        self.refresh_from_db(fields=["internal_sequence"])
+
+    @classmethod
+    def rebalance_internal_sequences(cls, tenant_id):
+        """Spread the internal_sequence numbers of a tenant evenly"""
+        with transaction.atomic():
+            Tenant.objects.select_for_update().filter(id=tenant_id).first()
+            workflows = list(
+                cls.objects.filter(tenant_id=tenant_id).only(
+                    "id", "internal_sequence"
+                )
+            )
+            # Negate the new numbers first, so no row takes the number of
+            # another row before that row has moved
+            for index, workflow in enumerate(workflows, 1):
+                workflow.internal_sequence = -index * cls.INTERNAL_INTERVAL
+            cls.objects.bulk_update(
+                workflows, ["internal_sequence"], batch_size=500
+            )
+            cls.objects.filter(tenant_id=tenant_id).update(
+                internal_sequence=-F("internal_sequence")
+            )
 
     def __str__(self):
         return self.name
 
     def save(self, *args, **kwargs):
         if self.internal_sequence is None:
-            max_obj = Workflow.objects.filter(tenant=self.tenant).last()
-            if max_obj is None:
-                self.internal_sequence = Workflow.INTERNAL_INTERVAL
-            else:
-                self.internal_sequence = (
-                    max_obj.internal_sequence + Workflow.INTERNAL_INTERVAL
-                )
+            last_sequence = (
+                Workflow.objects.filter(tenant_id=self.tenant_id)
+                .order_by("-internal_sequence")
+                .values_list("internal_sequence", flat=True)
+                .first()
+            )
+            self.internal_sequence = (
+                last_sequence or 0
+            ) + Workflow.INTERNAL_INTERVAL
         super().save(*args, **kwargs)
 
 
@@ -414,6 +443,13 @@ class Request(AbstractKeycloakResource, BaseModel):
         get_user_model(), on_delete=models.CASCADE, null=True
     )
 
+    class Meta:
+        indexes = [
+            trigram_index("name", "main_request_name_trgm"),
+            trigram_index("description", "main_request_desc_trgm"),
+            trigram_index("reason", "main_request_reason_trgm"),
+        ]
+
     @property
     def requester_name(self):
         """Full name of the requester"""
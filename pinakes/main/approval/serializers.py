@@ -3,6 +3,7 @@ from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field, OpenApiTypes
 
 from pinakes.common.fields import MetadataField, UserCapabilitiesField
+from pinakes.common.serializers import ModelSerializer, Serializer
 from pinakes.main.approval.models import (
     NotificationSetting,
     NotificationType,
@@ -19,7 +20,7 @@ from pinakes.main.approval import validations
 from pinakes.main.validators import UniqueWithinTenantValidator
 
 
-class NotificationTypeSerializer(serializers.ModelSerializer):
+class NotificationTypeSerializer(ModelSerializer):
     """Notification type that define what settings are expected"""
 
     icon_url = serializers.SerializerMethodField(
@@ -41,7 +42,7 @@ class NotificationTypeSerializer(serializers.ModelSerializer):
         )
 
 
-class NotificationSettingSerializer(serializers.ModelSerializer):
+class NotificationSettingSerializer(ModelSerializer):
     """Notification setting that stores settings for notification"""
 
     settings = serializers.JSONField(
@@ -60,7 +61,7 @@ class NotificationSettingSerializer(serializers.ModelSerializer):
         fields = ("id", "name", "notification_type", "settings")
 
 
-class TemplateSerializer(serializers.ModelSerializer):
+class TemplateSerializer(ModelSerializer):
     """The template to categorize workflows"""
 
     class Meta:
@@ -82,7 +83,7 @@ class TemplateSerializer(serializers.ModelSerializer):
         read_only_fields = ("created_at", "updated_at")
 
 
-class GroupRefSerializer(serializers.Serializer):
+class GroupRefSerializer(Serializer):
     """RBAC group reference"""
 
     name = serializers.CharField(
@@ -98,7 +99,7 @@ class GroupRefsField(serializers.JSONField):
     pass
 
 
-class WorkflowSerializer(serializers.ModelSerializer):
+class WorkflowSerializer(ModelSerializer):
     """
     The workflow to process approval requests.
     Each workflow can be linked to multiple groups of approvers.
@@ -137,7 +138,7 @@ PLACEMENT_CHOICES = (
 )
 
 
-class RepositionSerializer(serializers.Serializer):
+class RepositionSerializer(Serializer):
     """
     The desired increment relative to its current position,
     or placement to top or bottom of the list.
@@ -176,7 +177,7 @@ class RepositionSerializer(serializers.Serializer):
         )
 
 
-class TagResourceSerializer(serializers.Serializer):
+class TagResourceSerializer(Serializer):
     """Resource with tags"""
 
     app_name = serializers.CharField(
@@ -195,7 +196,7 @@ class TagResourceSerializer(serializers.Serializer):
     )
 
 
-class ActionSerializer(serializers.ModelSerializer):
+class ActionSerializer(ModelSerializer):
     """An action that changes the state of a request"""
 
     processed_by = serializers.CharField(
@@ -282,7 +283,7 @@ class RequestFields:
     )
 
 
-class SubrequestSerializer(serializers.ModelSerializer):
+class SubrequestSerializer(ModelSerializer):
     """
     Subrequest that has a parent but no no child requests.
     Actions are included.
@@ -319,7 +320,7 @@ class SubrequestSerializer(serializers.ModelSerializer):
         }
 
 
-class RequestExtraSerializer(serializers.Serializer):
+class RequestExtraSerializer(Serializer):
     """
     Extra data for a request including its subrequests and actions,
     available only when query parameter extra=true
@@ -329,7 +330,7 @@ class RequestExtraSerializer(serializers.Serializer):
     subrequests = SubrequestSerializer(many=True)
 
 
-class RequestSerializer(serializers.ModelSerializer):
+class RequestSerializer(ModelSerializer):
     """
     Approval request.
     It may have child requests.
@@ -384,7 +385,7 @@ class RequestSerializer(serializers.ModelSerializer):
         return None
 
 
-class ResourceObjectSerializer(serializers.Serializer):
+class ResourceObjectSerializer(Serializer):
     """Resource object definition"""
 
     app_name = serializers.CharField(
@@ -1,6 +1,7 @@
 """Create an approval request"""
 import logging
-import django_rq
+
+from pinakes.common import queues
 from pinakes.main.approval.models import (
     Request,
     RequestContext,
@@ -42,7 +43,7 @@ class CreateRequest:
             request_context=request_context, **self.data
         )
 
-        self.job = django_rq.enqueue(
+        self.job = queues.enqueue(
             process_root_task, self.request.id, workflow_ids
         )
         logger.info(
@@ -1,13 +1,13 @@
 """Email notification for an approval request"""
 import logging
 import string
-import django_rq
 import tempfile
 from importlib.resources import read_text
 from django.utils.translation import gettext_lazy as _
 from django.core.mail import send_mail
 from django.core.mail.backends.smtp import EmailBackend
 
+from pinakes.common import queues
 from pinakes.common.auth.keycloak_django.clients import get_admin_client
 from pinakes.main.approval.services.create_action import CreateAction
 from pinakes.main.approval.models import Action, Request
@@ -31,7 +31,7 @@ class EmailNotification:
         """process the service"""
         from pinakes.main.approval.tasks import email_task
 
-        self.job = django_rq.enqueue(email_task, self.request.id)
+        self.job = queues.enqueue(email_task, self.request.id)
         logger.info(
             "Enqueued job %s for sending email notification for request %d",
             self.job.id,
@@ -41,13 +41,12 @@ class LinkWorkflow:
                 OperateTag.Operation.REMOVE, self._tag_name()
             )
         elif operation == self.Operation.FIND:
-            tag_names = [tag.name for tag in instance.tags.all()]
-            self.workflow_ids = [
-                tag_link.workflow.id
-                for tag_link in TagLink.objects.filter(
-                    object_type=self.params["object_type"]
-                ).filter(tag_name__in=tag_names)
-            ]
+            self.workflow_ids = list(
+                TagLink.objects.filter(
+                    object_type=self.params["object_type"],
+                    tag_name__in=instance.tags.values("name"),
+                ).values_list("workflow_id", flat=True)
+            )
 
         return self
 
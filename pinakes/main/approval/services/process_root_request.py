@@ -1,7 +1,7 @@
 """Process a root request"""
 import logging
-import django_rq
 
+from pinakes.common import queues
 from pinakes.main.common import tasks
 from pinakes.main.approval.models import (
     Request,
@@ -94,7 +94,7 @@ class ProcessRootRequest:
             CreateAction(leaf, {"operation": Action.Operation.START}).process()
         else:
             for leaf in first_leaves:
-                self.job = django_rq.enqueue(start_request_task, leaf.id)
+                self.job = queues.enqueue(start_request_task, leaf.id)
                 logger.info(
                     "Enqueued job %s for sub request %d", self.job.id, leaf.id
                 )
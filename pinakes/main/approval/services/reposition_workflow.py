@@ -0,0 +1,55 @@
+"""Reposition a workflow among the workflows of its tenant"""
+import logging
+
+from django.db import transaction
+
+from pinakes.common import queues
+from pinakes.main.approval import tasks
+from pinakes.main.models import Tenant
+
+logger = logging.getLogger("approval")
+
+
+class RepositionWorkflow:
+    """Move a workflow by an increment or to the top or bottom.
+
+    Repositions in a tenant are serialized by locking the tenant row, so
+    concurrent moves never pick the same internal sequence. A move that
+    leaves a small gap schedules a background rebalance of the tenant.
+    """
+
+    def __init__(self, workflow, increment=None, placement=None):
+        self.workflow = workflow
+        self.increment = increment
+        self.placement = placement
+        self.job = None
+
+    def process(self):
+        with transaction.atomic():
+            Tenant.objects.select_for_update().filter(
+                id=self.workflow.tenant_id
+            ).first()
+            self.workflow.refresh_from_db(fields=["internal_sequence"])
+
+            if self.placement == "top":
+                self.workflow.move_to_top()
+            elif self.placement == "bottom":
+                self.workflow.move_to_bottom()
+            else:
+                self.workflow.move_internal_sequence(self.increment)
+            self.workflow.save()
+
+            if self.workflow.needs_rebalance:
+                transaction.on_commit(self._rebalance)
+
+        return self
+
+    def _rebalance(self):
+        self.job = queues.enqueue(
+            tasks.rebalance_workflows_task, self.workflow.tenant_id
+        )
+        logger.info(
+            "Enqueued job %s to rebalance workflows of tenant %d",
+            self.job.id,
+            self.workflow.tenant_id,
+        )
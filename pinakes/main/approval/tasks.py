@@ -1,6 +1,8 @@
 """Background tasks for inventory"""
 import logging
 from rq import get_current_job
+
+from pinakes.common import queues
 from pinakes.main.approval.services.create_action import (
     CreateAction,
 )
@@ -8,11 +10,12 @@ from pinakes.main.approval.services.process_root_request import (
     ProcessRootRequest,
 )
 from pinakes.main.approval.services.email_notification import EmailNotification
-from pinakes.main.approval.models import Action
+from pinakes.main.approval.models import Action, Workflow
 
 logger = logging.getLogger("approval")
 
 
+@queues.task_queue(queues.INTERACTIVE)
 def process_root_task(root_id, workflow_ids):
     """Process root request"""
     job = get_current_job()
@@ -29,6 +32,7 @@ def process_root_task(root_id, workflow_ids):
         raise
 
 
+@queues.task_queue(queues.INTERACTIVE)
 def start_request_task(request_id):
     """Start an approval request"""
     job = get_current_job()
@@ -42,6 +46,7 @@ def start_request_task(request_id):
         raise
 
 
+@queues.task_queue(queues.INTERACTIVE)
 def email_task(request_id):
     """Send emails to approvers"""
     job = get_current_job()
@@ -55,3 +60,15 @@ def email_task(request_id):
     except Exception as exc:
         logger.error("Job %s failed with exception %s", job.id, str(exc))
         raise
+
+
+@queues.task_queue(queues.DEFAULT)
+def rebalance_workflows_task(tenant_id):
+    """Spread the internal sequences of the workflows in a tenant"""
+    job = get_current_job()
+    logger.info(
+        "Job %s: Rebalancing workflow sequences of tenant %d",
+        job.id,
+        tenant_id,
+    )
+    Workflow.rebalance_internal_sequences(tenant_id)
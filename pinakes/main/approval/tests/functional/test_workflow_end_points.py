@@ -158,6 +158,25 @@ def test_workflow_retrieve(api_request, mocker):
     has_permission.assert_called_once()
 
 
+@pytest.mark.django_db
+def test_workflow_retrieve_not_modified(api_request):
+    """Retrieving a workflow leaves its ETag unchanged"""
+    workflow = WorkflowFactory()
+    response = api_request("get", "approval:workflow-detail", workflow.id)
+    updated_at = workflow.updated_at
+
+    response = api_request(
+        "get",
+        "approval:workflow-detail",
+        workflow.id,
+        headers={"HTTP_IF_NONE_MATCH": response["ETag"]},
+    )
+
+    assert response.status_code == 304
+    workflow.refresh_from_db()
+    assert workflow.updated_at == updated_at
+
+
 @pytest.mark.django_db
 def test_workflow_delete(api_request, mocker):
     """Delete a Workflow by its ID"""
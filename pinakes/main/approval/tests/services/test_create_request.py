@@ -18,7 +18,9 @@ from pinakes.main.approval.tasks import process_root_task
 def test_create_request_no_workflow(mocker):
     """Test to create a new request with no workflow"""
 
-    enqueue = mocker.patch("django_rq.enqueue", return_value=Mock(id=123))
+    enqueue = mocker.patch(
+        "pinakes.common.queues.enqueue", return_value=Mock(id=123)
+    )
     service = _prepare_service()
     request = service.process().request
     _assert_request(request)
@@ -29,7 +31,9 @@ def test_create_request_no_workflow(mocker):
 def test_create_request_with_workflow(mocker):
     """Test to create a new request with one workflow but no group"""
 
-    enqueue = mocker.patch("django_rq.enqueue", return_value=Mock(id=123))
+    enqueue = mocker.patch(
+        "pinakes.common.queues.enqueue", return_value=Mock(id=123)
+    )
     workflow = WorkflowFactory()
     mocker.patch.object(
         FindWorkflows, "process", return_value=Mock(workflows=(workflow,))
@@ -1,6 +1,7 @@
 """Test tagging on the given workflow"""
 
 import pytest
+from taggit.models import TaggedItem
 
 from pinakes.main.approval.models import TagLink
 from pinakes.main.approval.services.link_workflow import (
@@ -11,6 +12,7 @@ from pinakes.main.approval.tests.factories import (
     WorkflowFactory,
 )
 
+from pinakes.main.catalog.models import Portfolio, TaggedPortfolio
 from pinakes.main.catalog.tests.factories import (
     PortfolioFactory,
 )
@@ -31,6 +33,20 @@ def test_taglink_workflow_add_remove():
     assert TagLink.objects.count() == 1  # taglink should not be removed
 
 
+@pytest.mark.django_db
+def test_taglink_stored_in_portfolio_tags():
+    """Tags of a portfolio are kept in the table of portfolio tags"""
+    workflow, portfolio, _resource_obj = create_and_link()
+    PortfolioFactory()
+    tag_name = f"/approval/workflows={workflow.id}"
+
+    assert list(
+        TaggedPortfolio.objects.values_list("content_object", "tag__name")
+    ) == [(portfolio.id, tag_name)]
+    assert list(Portfolio.objects.filter(tags__name=tag_name)) == [portfolio]
+    assert not TaggedItem.objects.exists()
+
+
 @pytest.mark.django_db
 def test_find_workflow_by_taglink():
     """Test FIND workflows by taglinks"""
@@ -75,7 +75,9 @@ def test_process_request_one_workflow_groups(mocker):
         "pinakes.main.common.tasks.add_group_permissions",
         return_value=None,
     )
-    enqueue = mocker.patch("django_rq.enqueue", return_value=Mock(id=123))
+    enqueue = mocker.patch(
+        "pinakes.common.queues.enqueue", return_value=Mock(id=123)
+    )
 
     workflow = WorkflowFactory(
         group_refs=({"name": "n1", "uuid": "u1"}, {"name": "n2", "uuid": "u2"})
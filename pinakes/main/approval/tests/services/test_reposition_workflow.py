@@ -0,0 +1,58 @@
+"""Test repositioning workflows"""
+import pytest
+
+from pinakes.main.approval.models import Workflow
+from pinakes.main.approval.services.reposition_workflow import (
+    RepositionWorkflow,
+)
+from pinakes.main.approval.tests.factories import WorkflowFactory
+
+
+def _all_ids():
+    return list(Workflow.objects.values_list("id", flat=True))
+
+
+@pytest.mark.django_db
+def test_reposition_workflow(mocker):
+    enqueue = mocker.patch("pinakes.common.queues.enqueue")
+    first, second, third = [WorkflowFactory() for _ in range(3)]
+
+    RepositionWorkflow(third, placement="top").process()
+    RepositionWorkflow(first, increment=1).process()
+    RepositionWorkflow(third, placement="bottom").process()
+
+    assert _all_ids() == [second.id, first.id, third.id]
+    enqueue.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_reposition_workflow_small_gap(
+    mocker, django_capture_on_commit_callbacks
+):
+    enqueue = mocker.patch("pinakes.common.queues.enqueue")
+    first = WorkflowFactory(internal_sequence=1000)
+    WorkflowFactory(internal_sequence=1100)
+    third = WorkflowFactory()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        RepositionWorkflow(third, increment=-1).process()
+
+    assert _all_ids()[1] == third.id
+    enqueue.assert_called_once()
+    assert enqueue.call_args.args[1] == first.tenant_id
+
+
+@pytest.mark.django_db
+def test_reposition_workflow_closed_gap(
+    mocker, django_capture_on_commit_callbacks
+):
+    enqueue = mocker.patch("pinakes.common.queues.enqueue")
+    first = WorkflowFactory(internal_sequence=1000)
+    second = WorkflowFactory(internal_sequence=1001)
+    third = WorkflowFactory()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        RepositionWorkflow(third, increment=-1).process()
+
+    assert _all_ids() == [first.id, third.id, second.id]
+    enqueue.assert_not_called()
@@ -1,6 +1,6 @@
 import pytest
 
-from pinakes.main.tests.factories import TenantFactory
+from pinakes.main.tests.factories import TenantFactory, default_tenant
 from pinakes.main.approval.models import Workflow
 from pinakes.main.approval.tests.factories import (
     TemplateFactory,
@@ -189,3 +189,80 @@ def test_delete_middle(workflow_ids):
         workflow_ids[2],
         workflow_ids[4],
     ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("workflow_ids", [1024], indirect=True)
+def test_move_ignores_other_tenants(workflow_ids):
+    other_tenant = TenantFactory()
+    WorkflowFactory(tenant=other_tenant, internal_sequence=1500)
+    WorkflowFactory(tenant=other_tenant, internal_sequence=1)
+
+    _move_sequence(workflow_ids[0], 1)
+    _move_sequence(workflow_ids[3], -5)
+
+    assert list(
+        Workflow.objects.filter(id__in=workflow_ids).values_list(
+            "id", flat=True
+        )
+    ) == [
+        workflow_ids[3],
+        workflow_ids[1],
+        workflow_ids[0],
+        workflow_ids[2],
+        workflow_ids[4],
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "workflow_ids", [Workflow.INTERNAL_INTERVAL], indirect=True
+)
+def test_move_to_top_and_bottom(workflow_ids, django_assert_num_queries):
+    workflow = Workflow.objects.get(id=workflow_ids[2])
+    with django_assert_num_queries(1):
+        workflow.move_to_top()
+    workflow.save()
+
+    workflow = Workflow.objects.get(id=workflow_ids[1])
+    with django_assert_num_queries(1):
+        workflow.move_to_bottom()
+    workflow.save()
+
+    assert _all_ids() == [
+        workflow_ids[2],
+        workflow_ids[0],
+        workflow_ids[3],
+        workflow_ids[4],
+        workflow_ids[1],
+    ]
+    assert not workflow.needs_rebalance
+
+
+@pytest.mark.django_db
+def test_move_flags_small_gap():
+    first = WorkflowFactory(internal_sequence=1000)
+    WorkflowFactory(internal_sequence=1100)
+    last = WorkflowFactory()
+
+    last.move_internal_sequence(-1)
+
+    assert last.internal_sequence == 1050
+    assert last.needs_rebalance
+    assert not first.needs_rebalance
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("workflow_ids", [1], indirect=True)
+def test_rebalance_internal_sequences(workflow_ids):
+    other = WorkflowFactory(tenant=TenantFactory(), internal_sequence=2)
+
+    Workflow.rebalance_internal_sequences(default_tenant().id)
+
+    workflows = Workflow.objects.filter(id__in=workflow_ids)
+    assert list(workflows.values_list("id", flat=True)) == workflow_ids
+    assert list(workflows.values_list("internal_sequence", flat=True)) == [
+        Workflow.INTERNAL_INTERVAL * r for r in range(1, 6)
+    ]
+    other.refresh_from_db()
+    assert other.internal_sequence == 2
@@ -38,10 +38,10 @@ def validate_approver_groups(group_refs, raise_error=True):
 def validate_and_update_approver_groups(workflow, raise_error=True):
     """Validate group permissions in a workflow"""
 
-    workflow.group_refs = validate_approver_groups(
-        workflow.group_refs, raise_error
-    )
-    workflow.save()
+    group_refs = validate_approver_groups(workflow.group_refs, raise_error)
+    if group_refs != workflow.group_refs:
+        workflow.group_refs = group_refs
+        workflow.save()
 
 
 def runtime_validate_group(request):
@@ -6,7 +6,6 @@ from rest_framework.response import Response
 from rest_framework.filters import (
     BaseFilterBackend,
     OrderingFilter,
-    SearchFilter,
 )
 from rest_framework.permissions import IsAuthenticated
 from rest_framework_extensions.mixins import NestedViewSetMixin
@@ -20,6 +19,7 @@ from drf_spectacular.utils import (
     OpenApiTypes,
 )
 
+from pinakes.common.search import TrigramSearchFilter
 from pinakes.main.models import Tenant
 from pinakes.main.approval.models import (
     NotificationType,
@@ -37,6 +37,9 @@ from pinakes.main.approval.serializers import (
     ActionSerializer,
     ResourceObjectSerializer,
 )
+from pinakes.main.approval.services.reposition_workflow import (
+    RepositionWorkflow,
+)
 from pinakes.main.approval.services.link_workflow import (
     LinkWorkflow,
 )
@@ -44,7 +47,9 @@ from pinakes.main.approval.exceptions import (
     InsufficientParamsException,
 )
 from pinakes.main.approval import validations, permissions
+from pinakes.common.pagination import CatalogSwitchablePagination
 from pinakes.common.queryset_mixin import QuerySetMixin
+from pinakes.common.conditional_mixin import ConditionalGetMixin
 from pinakes.common.auth.keycloak_django.views import (
     KeycloakPermissionMixin,
 )
@@ -241,7 +246,10 @@ class WorkflowFilterBackend(BaseFilterBackend):
     ),
 )
 class WorkflowViewSet(
-    NestedViewSetMixin, QuerySetMixin, viewsets.ModelViewSet
+    ConditionalGetMixin,
+    NestedViewSetMixin,
+    QuerySetMixin,
+    viewsets.ModelViewSet,
 ):
     """API endpoint for listing, creating, and updating workflows."""
 
@@ -255,7 +263,7 @@ class WorkflowViewSet(
         WorkflowFilterBackend,
         DjangoFilterBackend,
         OrderingFilter,
-        SearchFilter,
+        TrigramSearchFilter,
     )
     filterset_fields = (
         "name",
@@ -271,8 +279,7 @@ class WorkflowViewSet(
     def retrieve(self, request, *args, **kwargs):
         workflow = self.get_object()
         validations.validate_and_update_approver_groups(workflow, False)
-        serializer = self.get_serializer(workflow)
-        return Response(serializer.data)
+        return self.conditional_retrieve(workflow)
 
     def destroy(self, request, *args, **kwargs):
         workflow = self.get_object()
@@ -332,16 +339,12 @@ class WorkflowViewSet(
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if "placement" in serializer.validated_data:
-            offset = Workflow.objects.count()
-            if serializer.validated_data["placement"] == "top":
-                offset = -offset
-        else:
-            offset = serializer.validated_data["increment"]
-
         workflow = get_object_or_404(Workflow, pk=pk)
-        workflow.move_internal_sequence(offset)
-        workflow.save()
+        RepositionWorkflow(
+            workflow,
+            increment=serializer.validated_data.get("increment"),
+            placement=serializer.validated_data.get("placement"),
+        ).process()
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -399,6 +402,7 @@ class RequestViewSet(
 
     serializer_class = RequestSerializer
     http_method_names = ["get"]
+    pagination_class = CatalogSwitchablePagination
     ordering = ("-id",)
     filterset_fields = ("name", "description", "state", "decision", "reason")
     search_fields = ("name", "description", "state", "decision", "reason")
@@ -455,6 +459,7 @@ class ActionViewSet(
     http_method_names = ["get", "post"]
     permission_classes = (IsAuthenticated,)
     keycloak_permission = permissions.ActionPermission
+    pagination_class = CatalogSwitchablePagination
     ordering = ("-id",)
     filterset_fields = ("operation", "comments")
     search_fields = ("operation", "comments")
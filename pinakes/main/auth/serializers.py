@@ -7,8 +7,10 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from drf_spectacular.utils import extend_schema_field
 
+from pinakes.common.serializers import ModelSerializer
 
-class CurrentUserSerializer(serializers.ModelSerializer):
+
+class CurrentUserSerializer(ModelSerializer):
     """Current user info to be sent to the caller"""
 
     roles = serializers.SerializerMethodField("get_roles")
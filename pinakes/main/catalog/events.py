@@ -0,0 +1,48 @@
+"""Publish order progress events through Redis pub/sub.
+
+Every order has its own channel. Events are published once the current
+transaction is committed, so subscribers always find the published
+changes in the database.
+"""
+import json
+import logging
+
+import django_rq
+from django.db import transaction
+from redis.exceptions import RedisError
+
+logger = logging.getLogger("catalog")
+
+ORDER_CHANNEL = "pinakes:order:{order_id}"
+
+MESSAGE = "message"
+STATE = "state"
+
+
+def get_channel(order_id: int) -> str:
+    return ORDER_CHANNEL.format(order_id=order_id)
+
+
+def publish(order_id: int, event: str, **data):
+    """Publish an event of an order after the transaction commits"""
+    payload = json.dumps({"event": event, **data})
+
+    def _publish():
+        try:
+            django_rq.get_connection().publish(get_channel(order_id), payload)
+        except RedisError:
+            logger.warning(
+                "Failed to publish %s event of order %d", event, order_id
+            )
+
+    transaction.on_commit(_publish)
+
+
+def publish_message(order_id: int, message_id: int):
+    """Notify subscribers of a new progress message"""
+    publish(order_id, MESSAGE, id=message_id)
+
+
+def publish_state(order_id: int, messageable_type: str, id: int, state: str):
+    """Notify subscribers of the new state of an order or order item"""
+    publish(order_id, STATE, type=messageable_type, id=id, state=state)
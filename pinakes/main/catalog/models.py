@@ -11,10 +11,13 @@ from pinakes.common.auth.keycloak_django import (
     AbstractKeycloakResource,
 )
 from pinakes.common.auth.keycloak_django.models import KeycloakMixin
+from pinakes.common.models.indexes import trigram_index
+from pinakes.main.catalog import events
 from pinakes.main.models import (
     BaseModel,
     Image,
     ImageableModel,
+    TaggedObject,
     UserOwnedModel,
 )
 
@@ -23,6 +26,25 @@ models.CharField.register_lookup(Length)
 logger = logging.getLogger("catalog")
 
 
+class TaggedPortfolio(TaggedObject):
+    """Tag of a portfolio"""
+
+    content_object = models.ForeignKey(
+        "Portfolio",
+        on_delete=models.CASCADE,
+        db_index=False,
+        help_text="ID of the tagged portfolio",
+    )
+
+    class Meta(TaggedObject.Meta):
+        indexes = [
+            models.Index(
+                name="main_taggedportfolio_tag",
+                fields=["tag", "content_object"],
+            )
+        ]
+
+
 class Portfolio(AbstractKeycloakResource, ImageableModel, UserOwnedModel):
     """Portfolio object to wrap products."""
 
@@ -41,7 +63,7 @@ class Portfolio(AbstractKeycloakResource, ImageableModel, UserOwnedModel):
         help_text="The number of different groups sharing this portfolio",
     )
 
-    tags = TaggableManager()
+    tags = TaggableManager(through=TaggedPortfolio)
 
     class Meta:
         constraints = [
@@ -54,6 +76,10 @@ class Portfolio(AbstractKeycloakResource, ImageableModel, UserOwnedModel):
                 fields=["name", "tenant"],
             ),
         ]
+        indexes = [
+            trigram_index("name", "main_portfolio_name_trgm"),
+            trigram_index("description", "main_portfolio_desc_trgm"),
+        ]
 
     def delete(self):
         if self.icon_id is not None:
@@ -85,6 +111,25 @@ class Portfolio(AbstractKeycloakResource, ImageableModel, UserOwnedModel):
         return self.name
 
 
+class TaggedPortfolioItem(TaggedObject):
+    """Tag of a portfolio item"""
+
+    content_object = models.ForeignKey(
+        "PortfolioItem",
+        on_delete=models.CASCADE,
+        db_index=False,
+        help_text="ID of the tagged portfolio item",
+    )
+
+    class Meta(TaggedObject.Meta):
+        indexes = [
+            models.Index(
+                name="main_taggedportfolioitem_tag",
+                fields=["tag", "content_object"],
+            )
+        ]
+
+
 class PortfolioItem(KeycloakMixin, ImageableModel, UserOwnedModel):
     """Portfolio Item represent a Job Template or a Workflow."""
 
@@ -141,7 +186,7 @@ class PortfolioItem(KeycloakMixin, ImageableModel, UserOwnedModel):
         help_text="The URL for finding support for the portfolio item",
     )
 
-    tags = TaggableManager()
+    tags = TaggableManager(through=TaggedPortfolioItem)
 
     class Meta:
         constraints = [
@@ -154,6 +199,16 @@ class PortfolioItem(KeycloakMixin, ImageableModel, UserOwnedModel):
                 check=models.Q(service_offering_ref__length__gt=0),
             ),
         ]
+        indexes = [
+            trigram_index("name", "main_portfolioitem_name_trgm"),
+            trigram_index("description", "main_portfolioitem_desc_trgm"),
+        ]
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if adding:
+            self._touch_portfolio()
 
     def delete(self):
         if self.icon_id is not None:
@@ -161,6 +216,13 @@ class PortfolioItem(KeycloakMixin, ImageableModel, UserOwnedModel):
             icon.delete()
 
         super().delete()
+        self._touch_portfolio()
+
+    def _touch_portfolio(self):
+        # The statistics in the metadata of the portfolio count its items
+        Portfolio.objects.filter(id=self.portfolio_id).update(
+            updated_at=timezone.now()
+        )
 
     @property
     def tag_resources(self):
@@ -232,11 +294,56 @@ class ProgressMessage(KeycloakMixin, BaseModel):
         return self.message
 
 
+class ArchivedProgressMessage(BaseModel):
+    """Progress message of a compacted order, moved out of the progress
+    messages"""
+
+    level = models.CharField(
+        max_length=10,
+        choices=ProgressMessage.Level.choices,
+        editable=False,
+        help_text="One of the predefined levels",
+    )
+    received_at = models.DateTimeField(
+        editable=False, help_text="Message received at"
+    )
+    message = models.TextField(
+        blank=True, default="", help_text="The message content"
+    )
+    messageable_type = models.CharField(
+        max_length=64,
+        editable=False,
+        help_text="Identify order or order item that this message belongs to",
+    )
+    messageable_id = models.IntegerField(
+        editable=False,
+        help_text="ID of the order or order item",
+    )
+    message_params = models.JSONField(
+        null=True,
+        help_text="Stores message parameters used by localization",
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["tenant", "messageable_id", "messageable_type"]
+            )
+        ]
+
+    def __str__(self):
+        return self.message
+
+
 class MessageableMixin:
-    """MessageableModel"""
+    """MessageableModel
+
+    Models define event_order_id, the ID of the order whose event channel
+    receives their updates.
+    """
 
     def update_message(self, level, message, params=None):
-        ProgressMessage.objects.create(
+        progress_message = ProgressMessage.objects.create(
             level=level,
             messageable_type=self.__class__.__name__,
             messageable_id=self.id,
@@ -244,6 +351,7 @@ class MessageableMixin:
             message_params=params,
             tenant=self.tenant,
         )
+        events.publish_message(self.event_order_id, progress_message.id)
 
     def mark_approval_pending(self, message=None, params=None):
         if self.state == self.__class__.State.PENDING:
@@ -304,6 +412,54 @@ class MessageableMixin:
             state=self.__class__.State.CANCELED,
         )
 
+    @classmethod
+    def bulk_mark(
+        cls,
+        objs,
+        message=None,
+        level=ProgressMessage.Level.INFO,
+        params=None,
+        **options,
+    ):
+        """Update many objects and add their progress messages at once.
+
+        The objects are updated with one UPDATE and their messages are
+        added with one INSERT, instead of a few statements per object.
+        """
+        objs = list(objs)
+        if not objs:
+            return
+
+        if message is not None:
+            progress_messages = ProgressMessage.objects.bulk_create(
+                ProgressMessage(
+                    level=level,
+                    messageable_type=cls.__name__,
+                    messageable_id=obj.id,
+                    message=message,
+                    message_params=params,
+                    tenant_id=obj.tenant_id,
+                )
+                for obj in objs
+            )
+            for obj, progress_message in zip(objs, progress_messages):
+                events.publish_message(obj.event_order_id, progress_message.id)
+
+        cls.objects.filter(id__in=[obj.id for obj in objs]).update(**options)
+        for obj in objs:
+            for name, value in options.items():
+                setattr(obj, name, value)
+            events.publish_state(
+                obj.event_order_id, cls.__name__, obj.id, obj.state
+            )
+
+        logger.info(
+            "Updated %d %s objects with state: %s",
+            len(objs),
+            cls.__name__,
+            options["state"],
+        )
+
     def _mark_item(
         self, message, level=ProgressMessage.Level.INFO, params=None, **options
     ):
@@ -311,7 +467,11 @@ class MessageableMixin:
             self.update_message(level, message, params)
 
         self.__class__.objects.filter(id=self.id).update(**options)
-        self.refresh_from_db()
+        for name, value in options.items():
+            setattr(self, name, value)
+        events.publish_state(
+            self.event_order_id, self.__class__.__name__, self.id, self.state
+        )
 
         logger.info(
             "Updated %s: %d with state: %s",
@@ -337,6 +497,14 @@ class Order(UserOwnedModel, MessageableMixin, KeycloakMixin):
         DENIED = gettext_noop("Denied")
         FAILED = gettext_noop("Failed")
         ORDERED = gettext_noop("Ordered")
+        SUBMITTING = gettext_noop("Submitting")
+
+    FINISHED_STATES = [
+        State.COMPLETED,
+        State.CANCELED,
+        State.FAILED,
+        State.DENIED,
+    ]
 
     state = models.CharField(
         max_length=20,
@@ -362,6 +530,31 @@ class Order(UserOwnedModel, MessageableMixin, KeycloakMixin):
     class Meta:
         indexes = [models.Index(fields=["tenant", "user"])]
 
+    @property
+    def event_order_id(self):
+        """ID of the order whose event channel receives the updates"""
+        return self.id
+
+    def mark_submitting(self, message=None, params=None):
+        """Move a created order to the submitting state.
+
+        The state is changed with a conditional update, so only one of
+        concurrent submissions succeeds. Returns False, leaving the order
+        unchanged, if the order is not in the created state.
+        """
+        claimed = Order.objects.filter(
+            id=self.id, state=self.State.CREATED
+        ).update(state=self.State.SUBMITTING)
+        self.refresh_from_db()
+        if not claimed:
+            return False
+
+        if message is not None:
+            self.update_message(ProgressMessage.Level.INFO, message, params)
+        events.publish_state(self.id, Order.__name__, self.id, self.state)
+        logger.info("Updated Order: %d with state: %s", self.id, self.state)
+        return True
+
     @property
     def order_items(self):
         return OrderItem.objects.filter(order_id=self.id)
@@ -379,16 +572,20 @@ class OrderItemManager(models.Manager):
     """Override default manager with create method"""
 
     def create(self, *args, **kwargs):
+        service_plan = ServicePlan.objects.filter(
+            portfolio_item=kwargs["portfolio_item"]
+        ).first()
+        kwargs = self.prepare_fields(service_plan, kwargs)
+
+        return super(OrderItemManager, self).create(*args, **kwargs)
+
+    def prepare_fields(self, service_plan, kwargs):
+        """Name the order item and sanitize its service parameters"""
         from pinakes.main.catalog.services.sanitize_parameters import (
             SanitizeParameters,
         )
 
-        portfolio_item = kwargs["portfolio_item"]
-        service_plan = ServicePlan.objects.filter(
-            portfolio_item=portfolio_item
-        ).first()
-
-        kwargs["name"] = portfolio_item.name
+        kwargs["name"] = kwargs["portfolio_item"].name
 
         if (
             service_plan
@@ -407,7 +604,7 @@ class OrderItemManager(models.Manager):
                 kwargs["service_parameters_raw"] = kwargs["service_parameters"]
                 kwargs["service_parameters"] = sanitized_parameters
 
-        return super(OrderItemManager, self).create(*args, **kwargs)
+        return kwargs
 
 
 class OrderItem(UserOwnedModel, MessageableMixin):
@@ -532,6 +729,11 @@ class OrderItem(UserOwnedModel, MessageableMixin):
             ),
         ]
 
+    @property
+    def event_order_id(self):
+        """ID of the order whose event channel receives the updates"""
+        return self.order_id
+
     def __str__(self):
         return self.name
 
@@ -606,7 +808,10 @@ class ApprovalRequest(BaseModel):
     )
 
     class Meta:
-        indexes = [models.Index(fields=["tenant", "order"])]
+        indexes = [
+            models.Index(fields=["tenant", "order"]),
+            models.Index(fields=["approval_request_ref"]),
+        ]
 
     def __str__(self):
         return str(self.id)
@@ -671,7 +876,10 @@ class ServicePlan(KeycloakMixin, BaseModel):
     )
 
     class Meta:
-        indexes = [models.Index(fields=["tenant", "portfolio_item"])]
+        indexes = [
+            models.Index(fields=["tenant", "portfolio_item"]),
+            models.Index(fields=["inventory_service_plan_ref"]),
+        ]
 
     @property
     def schema(self):
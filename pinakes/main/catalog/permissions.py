@@ -7,6 +7,8 @@ from rest_framework.request import Request
 from pinakes.common.auth.keycloak_django.permissions import (
     KeycloakPolicy,
     BaseKeycloakPermission,
+    acheck_object_permission,
+    acheck_wildcard_permission,
     check_wildcard_permission,
     check_object_permission,
     get_permitted_resources,
@@ -46,6 +48,7 @@ class PortfolioPermission(BaseKeycloakPermission):
             KeycloakPolicy("read", KeycloakPolicy.Type.OBJECT),
         ],
     }
+    async_object_checks = True
 
     def perform_check_permission(
         self, permission: str, request: Request, view: Any
@@ -67,6 +70,13 @@ class PortfolioPermission(BaseKeycloakPermission):
             request,
         )
 
+    async def aperform_check_object_permission(
+        self, permission, request: Request, view: Any, obj: Any
+    ) -> bool:
+        if not isinstance(obj, Portfolio):
+            return False
+        return await acheck_object_permission(obj, permission, request)
+
     def perform_scope_queryset(
         self,
         permission: str,
@@ -101,6 +111,7 @@ class PortfolioItemPermission(BaseKeycloakPermission):
         "copy": KeycloakPolicy("read", KeycloakPolicy.Type.OBJECT),
         "next_name": KeycloakPolicy("read", KeycloakPolicy.Type.OBJECT),
     }
+    async_object_checks = True
 
     def get_access_policies(self, request: Request, view: Any):
         if "portfolio_id" in view.kwargs:
@@ -129,6 +140,22 @@ class PortfolioItemPermission(BaseKeycloakPermission):
             request,
         )
 
+    def get_permission_object(self, obj: Any) -> Any:
+        if isinstance(obj, PortfolioItem):
+            return obj.portfolio
+        return obj
+
+    async def aperform_check_object_permission(
+        self,
+        permission: str,
+        request: Request,
+        view: Any,
+        obj: Any,
+    ) -> bool:
+        if not isinstance(obj, Portfolio):
+            return False
+        return await acheck_object_permission(obj, permission, request)
+
     def perform_scope_queryset(
         self,
         permission: str,
@@ -151,11 +178,14 @@ class OrderPermission(BaseKeycloakPermission):
     access_policies = {
         "list": KeycloakPolicy("read", KeycloakPolicy.Type.QUERYSET),
         "create": KeycloakPolicy("create", KeycloakPolicy.Type.WILDCARD),
+        "bulk": KeycloakPolicy("create", KeycloakPolicy.Type.WILDCARD),
         "retrieve": KeycloakPolicy("read", KeycloakPolicy.Type.OBJECT),
         "destroy": KeycloakPolicy("delete", KeycloakPolicy.Type.OBJECT),
         "submit": KeycloakPolicy("update", KeycloakPolicy.Type.OBJECT),
         "cancel": KeycloakPolicy("update", KeycloakPolicy.Type.OBJECT),
+        "events": KeycloakPolicy("read", KeycloakPolicy.Type.OBJECT),
     }
+    async_object_checks = True
 
     def perform_check_object_permission(
         self,
@@ -172,6 +202,19 @@ class OrderPermission(BaseKeycloakPermission):
             return True
         return obj.user == request.user
 
+    async def aperform_check_object_permission(
+        self,
+        permission: str,
+        request: Request,
+        view: Any,
+        obj: Any,
+    ) -> bool:
+        if obj.user_id == request.user.id:
+            return True
+        return await acheck_wildcard_permission(
+            obj.keycloak_type(), permission, request
+        )
+
     def perform_scope_queryset(
         self, permission: str, request: Request, view: Any, qs: models.QuerySet
     ) -> models.QuerySet:
@@ -193,6 +236,7 @@ class OrderItemPermission(BaseKeycloakPermission):
         "partial_update": KeycloakPolicy("update", KeycloakPolicy.Type.OBJECT),
         "destroy": KeycloakPolicy("update", KeycloakPolicy.Type.OBJECT),
     }
+    async_object_checks = True
 
     def perform_check_permission(
         self, permission: str, request: Request, view: Any
@@ -212,6 +256,22 @@ class OrderItemPermission(BaseKeycloakPermission):
     ) -> bool:
         return self._check_order_permission(permission, request, obj.order)
 
+    def get_permission_object(self, obj: Any) -> Any:
+        return obj.order
+
+    async def aperform_check_object_permission(
+        self,
+        permission: str,
+        request: Request,
+        view: Any,
+        obj: Any,
+    ) -> bool:
+        if obj.user_id == request.user.id:
+            return True
+        return await acheck_wildcard_permission(
+            obj.keycloak_type(), permission, request
+        )
+
     def perform_scope_queryset(
         self,
         permission: str,
@@ -4,7 +4,13 @@ from django.utils.translation import gettext_noop
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field, OpenApiTypes
 
+from pinakes.common import translation
 from pinakes.common.fields import MetadataField
+from pinakes.common.serializers import (
+    DynamicFieldsMixin,
+    ModelSerializer,
+    Serializer,
+)
 from pinakes.main.models import Tenant, Image
 from pinakes.main.validators import UniqueWithinTenantValidator
 from pinakes.main.common.models import Group
@@ -22,7 +28,7 @@ from pinakes.main.catalog.services.create_portfolio_item import (
 )
 
 
-class TenantSerializer(serializers.ModelSerializer):
+class TenantSerializer(ModelSerializer):
     """Tenant which groups login users"""
 
     class Meta:
@@ -33,7 +39,7 @@ class TenantSerializer(serializers.ModelSerializer):
         )
 
 
-class PortfolioSerializer(serializers.ModelSerializer):
+class PortfolioSerializer(ModelSerializer):
     """Portfolio which groups Portfolio Items"""
 
     icon_url = serializers.SerializerMethodField(
@@ -78,7 +84,7 @@ class PortfolioSerializer(serializers.ModelSerializer):
         )
 
 
-class PortfolioItemInSerializer(serializers.Serializer):
+class PortfolioItemInSerializer(Serializer):
     """Input parameters for creating a portfolio item"""
 
     service_offering_ref = serializers.CharField(
@@ -92,7 +98,7 @@ class PortfolioItemInSerializer(serializers.Serializer):
         return CreatePortfolioItem(validated_data).process().item
 
 
-class CopyPortfolioSerializer(serializers.Serializer):
+class CopyPortfolioSerializer(Serializer):
     """Parameters to copy a portfolio"""
 
     portfolio_name = serializers.CharField(
@@ -100,7 +106,7 @@ class CopyPortfolioSerializer(serializers.Serializer):
     )
 
 
-class PortfolioItemSerializerBase(serializers.ModelSerializer):
+class PortfolioItemSerializerBase(ModelSerializer):
     """PortfolioItem which maps to a Controller Job Template
     via the service_offering_ref"""
 
@@ -147,7 +153,7 @@ class PortfolioItemSerializer(PortfolioItemSerializerBase):
     )
 
 
-class CopyPortfolioItemSerializer(serializers.Serializer):
+class CopyPortfolioItemSerializer(Serializer):
     """Parameters to copy a portfolio item"""
 
     portfolio_item_name = serializers.CharField(
@@ -180,7 +186,7 @@ ORDER_ITEM_FIELDS = (
 )
 
 
-class OrderItemExtraSerializer(serializers.Serializer):
+class OrderItemExtraSerializer(Serializer):
     """
     Extra data for an order item including its portfolio item details,
     available only when query parameter extra=true
@@ -226,7 +232,7 @@ class UniqueWithinOrderValidator(UniqueWithinTenantValidator):
             del attrs["name"]
 
 
-class OrderItemSerializerBase(serializers.ModelSerializer):
+class OrderItemSerializerBase(DynamicFieldsMixin, ModelSerializer):
     """OrderItem which keeps track of an execution of Portfolio Item"""
 
     owner = serializers.ReadOnlyField()
@@ -253,6 +259,18 @@ class OrderItemSerializerBase(serializers.ModelSerializer):
             "extra_data",
             "metadata",
         )
+        heavy_fields = (
+            "service_parameters",
+            "provider_control_parameters",
+            "artifacts",
+        )
+        deferred_fields = {
+            "service_parameters": ("service_parameters",),
+            "service_parameters_raw": (),
+            "provider_control_parameters": ("provider_control_parameters",),
+            "context": (),
+            "artifacts": ("artifacts",),
+        }
         read_only_fields = ("created_at", "updated_at", "order", "name")
         extra_kwargs = {
             "completed_at": {"allow_null": True},
@@ -285,7 +303,7 @@ class OrderItemSerializer(OrderItemSerializerBase):
     metadata = MetadataField(help_text="Order item metadata")
 
 
-class OrderItemDocSerializer(serializers.ModelSerializer):
+class OrderItemDocSerializer(ModelSerializer):
     """Workaround for OrderItem list params in openapi spec"""
 
     class Meta:
@@ -300,7 +318,7 @@ class OrderItemDocSerializer(serializers.ModelSerializer):
         )
 
 
-class OrderExtraSerializer(serializers.Serializer):
+class OrderExtraSerializer(Serializer):
     """
     Extra data for an order including its order items,
     available only when query parameter extra=true
@@ -309,7 +327,7 @@ class OrderExtraSerializer(serializers.Serializer):
     order_items = OrderItemSerializerBase(many=True)
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(DynamicFieldsMixin, ModelSerializer):
     """Order which groups an order item and its before
     and after processes (To be added)"""
 
@@ -360,7 +378,7 @@ class OrderSerializer(serializers.ModelSerializer):
         return None
 
 
-class ImageSerializer(serializers.ModelSerializer):
+class ImageSerializer(ModelSerializer):
     """An image file used as an icon for portfolio or portfolio item"""
 
     class Meta:
@@ -371,7 +389,7 @@ class ImageSerializer(serializers.ModelSerializer):
         )
 
 
-class ApprovalRequestSerializer(serializers.ModelSerializer):
+class ApprovalRequestSerializer(ModelSerializer):
     """ApprovalRequest which keeps track of the approval
     progress of an order"""
 
@@ -399,7 +417,7 @@ class ApprovalRequestSerializer(serializers.ModelSerializer):
         return _(obj.reason)
 
 
-class ProgressMessageSerializer(serializers.ModelSerializer):
+class ProgressMessageSerializer(ModelSerializer):
     """ProgressMessage which wraps a message describing
     the progress of an order or order item"""
 
@@ -421,20 +439,16 @@ class ProgressMessageSerializer(serializers.ModelSerializer):
         )
 
     def get_level(self, obj):
-        return _(obj.level)
+        return translation.render(obj.level)
 
     def get_messageable_type(self, obj):
-        return _(obj.messageable_type)
+        return translation.render(obj.messageable_type)
 
     def get_message(self, obj):
-        return (
-            _(obj.message) % obj.message_params
-            if bool(obj.message_params)
-            else _(obj.message)
-        )
+        return translation.render(obj.message, obj.message_params)
 
 
-class ServicePlanExtraSerializer(serializers.Serializer):
+class ServicePlanExtraSerializer(Serializer):
     """
     Extra data for a service plan including its base schema,
     available only when query parameter extra=true
@@ -447,7 +461,7 @@ class ServicePlanExtraSerializer(serializers.Serializer):
     )
 
 
-class ServicePlanSerializer(serializers.ModelSerializer):
+class ServicePlanSerializer(DynamicFieldsMixin, ModelSerializer):
     """ServicePlan which describes parameters required for a portfolio item"""
 
     id = serializers.IntegerField(
@@ -487,6 +501,10 @@ class ServicePlanSerializer(serializers.ModelSerializer):
             "portfolio_item",
             "extra_data",
         )
+        deferred_fields = {
+            "base_schema": ("schema", "extra_data"),
+            "modified_schema": ("schema", "modified"),
+        }
 
     @extend_schema_field(ServicePlanExtraSerializer(many=False))
     def get_extra_data(self, service_plan):
@@ -499,7 +517,7 @@ class ServicePlanSerializer(serializers.ModelSerializer):
         return None
 
 
-class ModifiedServicePlanInSerializer(serializers.Serializer):
+class ModifiedServicePlanInSerializer(Serializer):
     """Paramters to update a modified service plan"""
 
     modified = serializers.JSONField(
@@ -507,7 +525,7 @@ class ModifiedServicePlanInSerializer(serializers.Serializer):
     )
 
 
-class SharingRequestSerializer(serializers.Serializer):
+class SharingRequestSerializer(Serializer):
     """SharingRequest which defines groups and permissions
     that the object can be shared to"""
 
@@ -530,7 +548,7 @@ class SharingRequestSerializer(serializers.Serializer):
         return value
 
 
-class SharingPermissionSerializer(serializers.Serializer):
+class SharingPermissionSerializer(Serializer):
     """Sharing permissions which were applied to a group"""
 
     permissions = serializers.ListField(
@@ -545,7 +563,7 @@ class SharingPermissionSerializer(serializers.Serializer):
     group_name = serializers.CharField(help_text="Group Name")
 
 
-class NextNameInSerializer(serializers.Serializer):
+class NextNameInSerializer(Serializer):
     """Paramters to retrieve next available portfolio item name"""
 
     portfolio_item_id = serializers.IntegerField(
@@ -559,9 +577,78 @@ class NextNameInSerializer(serializers.Serializer):
     )
 
 
-class NextNameOutSerializer(serializers.Serializer):
+class NextNameOutSerializer(Serializer):
     """Next available portfolio item name"""
 
     next_name = serializers.CharField(
         max_length=64, help_text="Next available portfolio item name"
     )
+
+
+class BulkOrderItemInSerializer(Serializer):
+    """An order item of an order created in bulk"""
+
+    portfolio_item = serializers.IntegerField(
+        help_text="ID of the portfolio item to order"
+    )
+    service_parameters = serializers.JSONField(
+        required=False,
+        allow_null=True,
+        help_text="JSON object with provisioning parameters",
+    )
+    provider_control_parameters = serializers.JSONField(
+        required=False,
+        allow_null=True,
+        help_text=(
+            "The provider specific parameters needed to provision this"
+            " service. This might include namespaces, special keys."
+        ),
+    )
+
+
+class BulkOrderInSerializer(Serializer):
+    """An order created in bulk"""
+
+    order_items = BulkOrderItemInSerializer(
+        many=True, allow_empty=False, help_text="Order items of the order"
+    )
+
+
+class BulkOrdersInSerializer(Serializer):
+    """Orders to create and submit in bulk"""
+
+    MAX_ORDERS = 500
+
+    orders = BulkOrderInSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=MAX_ORDERS,
+        help_text="Orders to create and submit",
+    )
+
+
+class BulkOrderResultSerializer(Serializer):
+    """Result of an order created in bulk"""
+
+    index = serializers.IntegerField(
+        help_text="Position of the order in the request"
+    )
+    id = serializers.IntegerField(
+        allow_null=True,
+        help_text="ID of the created order, null if it failed validation",
+    )
+    error = serializers.CharField(
+        allow_null=True, help_text="Validation error of the order"
+    )
+
+
+class BulkOrdersOutSerializer(Serializer):
+    """Results of orders created in bulk"""
+
+    task_id = serializers.CharField(
+        allow_null=True,
+        help_text="Id of the task submitting the created orders",
+    )
+    results = BulkOrderResultSerializer(
+        many=True, help_text="Result of each order in the request"
+    )
@@ -1,12 +1,14 @@
 """Cancel an order request"""
 import logging
 
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from pinakes.main.approval.models import Action
 from pinakes.main.approval.services.create_action import (
     CreateAction,
 )
+from pinakes.main.catalog import events
 from pinakes.main.catalog.exceptions import (
     UncancelableException,
 )
@@ -45,8 +47,15 @@ class CancelOrder:
                 ).process()
 
             self.order.state = Order.State.CANCELED
+            self.order.completed_at = timezone.now()
             self.order.save()
             self.order.refresh_from_db()
+            events.publish_state(
+                self.order.id,
+                Order.__name__,
+                self.order.id,
+                self.order.state,
+            )
 
         except Exception as error:
             logger.error(
@@ -0,0 +1,157 @@
+"""Compact the progress messages of finished orders"""
+import logging
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils.translation import gettext_noop
+
+from pinakes.main.catalog.models import (
+    ArchivedProgressMessage,
+    Order,
+    OrderItem,
+    ProgressMessage,
+)
+
+logger = logging.getLogger("catalog")
+
+SUMMARY_MESSAGE = gettext_noop(
+    "Order %(order_id)d finished in state %(state)s, %(count)d progress"
+    " messages were archived"
+)
+ARCHIVED_FIELDS = (
+    "tenant_id",
+    "level",
+    "received_at",
+    "message",
+    "messageable_type",
+    "messageable_id",
+    "message_params",
+)
+
+
+class CompactProgressMessages:
+    """Collapse the progress messages of old finished orders.
+
+    The messages of an order finished before expire_time and of its order
+    items are moved to the archived progress messages, and replaced by one
+    summary message of the order. The summary is an error if any of the
+    replaced messages was an error. Orders canceled before they recorded
+    a completion time are matched by their last update. Orders are
+    compacted in batches, each batch in its own transaction.
+    """
+
+    def __init__(self, expire_time, batch_size=500):
+        self.expire_time = expire_time
+        self.batch_size = batch_size
+        self.compacted_orders = 0
+        self.archived_messages = 0
+
+    def process(self):
+        while True:
+            orders = self._expired_orders().values_list(
+                "id", "tenant_id", "state"
+            )
+            orders = list(orders[: self.batch_size])
+            if not orders:
+                break
+            with transaction.atomic():
+                self._compact(orders)
+
+        logger.info(
+            "Archived %d progress messages of %d orders",
+            self.archived_messages,
+            self.compacted_orders,
+        )
+        return self
+
+    def _expired_orders(self):
+        order_messages = ProgressMessage.objects.filter(
+            tenant_id=OuterRef("tenant_id"),
+            messageable_type=Order.__name__,
+            messageable_id=OuterRef("id"),
+        ).exclude(message=SUMMARY_MESSAGE)
+        item_messages = ProgressMessage.objects.filter(
+            tenant_id=OuterRef("order__tenant_id"),
+            messageable_type=OrderItem.__name__,
+            messageable_id=OuterRef("id"),
+        )
+        items_with_messages = OrderItem.objects.filter(
+            order_id=OuterRef("id")
+        ).filter(Exists(item_messages))
+
+        return (
+            Order.objects.filter(
+                Q(completed_at__lt=self.expire_time)
+                | Q(
+                    state=Order.State.CANCELED,
+                    completed_at=None,
+                    updated_at__lt=self.expire_time,
+                ),
+                state__in=Order.FINISHED_STATES,
+            )
+            .filter(Exists(order_messages) | Exists(items_with_messages))
+            .order_by("id")
+        )
+
+    def _compact(self, orders):
+        order_ids = [order_id for order_id, _tenant_id, _state in orders]
+        item_orders = dict(
+            OrderItem.objects.filter(order_id__in=order_ids).values_list(
+                "id", "order_id"
+            )
+        )
+        messages = ProgressMessage.objects.filter(
+            Q(messageable_type=Order.__name__, messageable_id__in=order_ids)
+            | Q(
+                messageable_type=OrderItem.__name__,
+                messageable_id__in=item_orders.keys(),
+            )
+        )
+
+        message_ids = []
+        archived = []
+        counts = defaultdict(int)
+        errors = set()
+        for row in messages.values("id", *ARCHIVED_FIELDS):
+            order_id = (
+                row["messageable_id"]
+                if row["messageable_type"] == Order.__name__
+                else item_orders[row["messageable_id"]]
+            )
+            message_ids.append(row.pop("id"))
+            archived.append(ArchivedProgressMessage(**row))
+            counts[order_id] += 1
+            if row["level"] == ProgressMessage.Level.ERROR:
+                errors.add(order_id)
+
+        ArchivedProgressMessage.objects.bulk_create(
+            archived, batch_size=self.batch_size
+        )
+        for start in range(0, len(message_ids), self.batch_size):
+            ProgressMessage.objects.filter(
+                id__in=message_ids[start : start + self.batch_size]
+            ).delete()
+
+        ProgressMessage.objects.bulk_create(
+            ProgressMessage(
+                tenant_id=tenant_id,
+                messageable_type=Order.__name__,
+                messageable_id=order_id,
+                level=(
+                    ProgressMessage.Level.ERROR
+                    if order_id in errors
+                    else ProgressMessage.Level.INFO
+                ),
+                message=SUMMARY_MESSAGE,
+                message_params={
+                    "order_id": order_id,
+                    "state": state,
+                    "count": counts[order_id],
+                },
+            )
+            for order_id, tenant_id, state in orders
+        )
+
+        self.compacted_orders += len(orders)
+        self.archived_messages += len(message_ids)
@@ -1,4 +1,5 @@
 """Compute service parameters in runtime"""
+from pinakes.main.catalog import survey
 from pinakes.main.catalog.models import (
     ServicePlan,
 )
@@ -7,8 +8,9 @@ from pinakes.main.catalog.models import (
 class ComputeRuntimeParameters:
     """Start to compute service parameters in runtime"""
 
-    def __init__(self, order_item):
+    def __init__(self, order_item, service_plan=None):
         self.order_item = order_item
+        self.service_plan = service_plan
         self.runtime_parameters = {}
         self.substituted = False
 
@@ -22,35 +24,24 @@ class ComputeRuntimeParameters:
             or {}
         )
 
-        field_names = [
-            field.get("name") for field in self._fields() if field.get("name")
-        ]
+        if self.service_plan is None:
+            # each portfolio_item must have one service plan
+            self.service_plan = ServicePlan.objects.get(
+                portfolio_item=self.order_item.portfolio_item
+            )
+        schema = survey.compile_schema(self.service_plan)
 
         self.runtime_parameters = {
-            key: self._compute_value(key, value)
+            key: self._compute_value(schema, key, value)
             for key, value in service_parameters_raw.items()
-            if key in field_names
+            if key in schema.parameter_names
         }
 
         return self
 
-    def _fields(self):
-        # each portfolio_item must have one service plan
-        service_plan = ServicePlan.objects.get(
-            portfolio_item=self.order_item.portfolio_item
-        )
-        if (
-            not service_plan.schema
-            or service_plan.schema.get("schemaType") == "emptySchema"
-        ):
-            return []
-
-        return service_plan.schema.get("schema", {}).get("fields", [])
-
-    def _compute_value(self, key, value):
-        for field in self._fields():
-            if field.get("name") == key and not field.get("isSubstitution"):
-                return value
+    def _compute_value(self, schema, key, value):
+        if key not in schema.substitutions:
+            return value
 
         return self._substitution(value)
 
@@ -7,6 +7,7 @@ from pinakes.main.catalog.models import (
     Portfolio,
     PortfolioItem,
 )
+from pinakes.main.models import Tenant
 from pinakes.main.catalog.services import (
     name,
 )
@@ -66,12 +67,12 @@ class CopyPortfolio:
                 raise
 
     def _new_portfolio_name(self):
-        portfolio_names = [
-            portfolio.name for portfolio in Portfolio.objects.all()
-        ]
+        # Serialize the copies in the tenant so they get different names
+        Tenant.objects.select_for_update().filter(
+            id=self.portfolio.tenant_id
+        ).first()
 
-        return (
-            name.create_copy_name(self.name, portfolio_names)
-            if self.name in portfolio_names
-            else self.name
+        return name.available_name(
+            Portfolio.objects.filter(tenant_id=self.portfolio.tenant_id),
+            self.name,
         )
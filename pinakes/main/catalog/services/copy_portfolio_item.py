@@ -97,19 +97,13 @@ class CopyPortfolioItem:
         return True
 
     def _new_portfolio_item_name(self):
-        portfolio_items = PortfolioItem.objects.filter(
-            portfolio=self.portfolio
-        )
-        portfolio_item_names = [
-            portfolio_item.name for portfolio_item in portfolio_items
-        ]
-
-        return (
-            name.create_copy_name(
-                self.name,
-                portfolio_item_names,
-                PortfolioItem.MAX_PORTFOLIO_ITEM_LENGTH,
-            )
-            if self.name in portfolio_item_names
-            else self.name
+        # Serialize the copies in the portfolio so they get different names
+        Portfolio.objects.select_for_update().filter(
+            id=self.portfolio.id
+        ).first()
+
+        return name.available_name(
+            PortfolioItem.objects.filter(portfolio=self.portfolio),
+            self.name,
+            PortfolioItem.MAX_PORTFOLIO_ITEM_LENGTH,
         )
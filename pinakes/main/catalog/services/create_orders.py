@@ -0,0 +1,144 @@
+"""Create many orders with their order items at once"""
+import logging
+from collections import defaultdict
+
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import APIException
+
+from pinakes.main.catalog.exceptions import BadParamsException
+from pinakes.main.catalog.models import (
+    Order,
+    OrderItem,
+    PortfolioItem,
+    ServicePlan,
+)
+from pinakes.main.catalog.services.validate_order_item import (
+    ValidateOrderItem,
+)
+
+logger = logging.getLogger("catalog")
+
+
+class CreateOrders:
+    """Validate and create many orders with their order items.
+
+    All portfolio items and service plans referenced by the orders are
+    loaded upfront, then each order is validated in memory. Orders that
+    fail validation are reported in the results and not created, the
+    others are created with bulk inserts, ready to be submitted by the
+    submit_orders task.
+    """
+
+    def __init__(self, orders_data, user, tenant):
+        self.orders_data = orders_data
+        self.user = user
+        self.tenant = tenant
+        self.orders = []
+        self.results = []
+
+    def process(self):
+        portfolio_items = self._load_portfolio_items()
+        service_plans = self._load_service_plans(portfolio_items)
+
+        valid_orders = []
+        for index, order_data in enumerate(self.orders_data):
+            try:
+                order_items = self._build_order_items(
+                    order_data["order_items"], portfolio_items, service_plans
+                )
+            except APIException as error:
+                self.results.append(
+                    {"index": index, "id": None, "error": str(error.detail)}
+                )
+                continue
+            valid_orders.append((index, order_items))
+
+        with transaction.atomic():
+            self.orders = Order.objects.bulk_create(
+                Order(
+                    tenant=self.tenant,
+                    user=self.user,
+                    state=Order.State.SUBMITTING,
+                )
+                for _index in valid_orders
+            )
+            order_items = []
+            for order, (index, items) in zip(self.orders, valid_orders):
+                for item in items:
+                    item.order = order
+                order_items.extend(items)
+                self.results.append(
+                    {"index": index, "id": order.id, "error": None}
+                )
+            OrderItem.objects.bulk_create(order_items)
+
+        self.results.sort(key=lambda result: result["index"])
+        logger.info(
+            "Created %d of %d orders", len(self.orders), len(self.orders_data)
+        )
+        return self
+
+    def _load_portfolio_items(self):
+        ids = {
+            item_data["portfolio_item"]
+            for order_data in self.orders_data
+            for item_data in order_data["order_items"]
+        }
+        return PortfolioItem.objects.filter(
+            id__in=ids, tenant=self.tenant
+        ).in_bulk()
+
+    def _load_service_plans(self, portfolio_items):
+        service_plans = defaultdict(list)
+        for plan in (
+            ServicePlan.objects.filter(
+                portfolio_item_id__in=portfolio_items.keys()
+            )
+            .select_related("portfolio_item__portfolio")
+            .order_by("id")
+        ):
+            service_plans[plan.portfolio_item_id].append(plan)
+        return service_plans
+
+    def _build_order_items(self, items_data, portfolio_items, service_plans):
+        order_items = []
+        ordered_portfolio_items = set()
+        for item_data in items_data:
+            portfolio_item = portfolio_items.get(item_data["portfolio_item"])
+            if portfolio_item is None:
+                raise BadParamsException(
+                    _("Portfolio item {} does not exist").format(
+                        item_data["portfolio_item"]
+                    )
+                )
+            if portfolio_item.id in ordered_portfolio_items:
+                raise BadParamsException(
+                    _("Portfolio item {} is ordered more than once").format(
+                        portfolio_item.id
+                    )
+                )
+            ordered_portfolio_items.add(portfolio_item.id)
+
+            if not portfolio_item.service_offering_ref:
+                raise BadParamsException(
+                    _(
+                        "Portfolio item {} does not have related service"
+                        " offering"
+                    ).format(portfolio_item.id)
+                )
+
+            plans = service_plans[portfolio_item.id]
+            fields = OrderItem.objects.prepare_fields(
+                plans[0] if plans else None,
+                {
+                    **item_data,
+                    "portfolio_item": portfolio_item,
+                    "tenant": self.tenant,
+                    "user": self.user,
+                },
+            )
+            order_item = OrderItem(**fields)
+            ValidateOrderItem(order_item, plans).process()
+            order_items.append(order_item)
+        return order_items
@@ -1,11 +1,14 @@
 """Finish an order with correct state and status"""
 
 import logging
+from django.db import transaction
+from django.utils import timezone
 from django.utils.translation import gettext_noop
 
 from pinakes.main.catalog.models import (
     ApprovalRequest,
     OrderItem,
+    ProgressMessage,
 )
 
 logger = logging.getLogger("catalog")
@@ -17,17 +20,16 @@ class FinishOrder:
     def __init__(self, order):
         self.order = order
 
+    @transaction.atomic
     def process(self, is_complete=True):
-        # clear sensitive data
-        for item in self.order.order_items:
-            item.service_parameters_raw = None
-            item.save()
+        order_items = list(self.order.order_items)
+        self._clear_sensitive_data()
 
         # All order items are done
         if is_complete:
-            if OrderItem.State.FAILED in [
-                item.state for item in self.order.order_items
-            ]:
+            if any(
+                item.state == OrderItem.State.FAILED for item in order_items
+            ):
                 message = gettext_noop("Order %(order_id)s has failed")
                 params = {"order_id": str(self.order.id)}
                 self.order.mark_failed(message, params)
@@ -40,20 +42,34 @@ class FinishOrder:
 
             return self
 
-        if self.order.approvalrequest.state == ApprovalRequest.State.CANCELED:
+        approval_state = self.order.approvalrequest.state
+        if approval_state == ApprovalRequest.State.CANCELED:
             self.order.mark_failed(gettext_noop("Order Canceled"))
         # For both ApprovalRequest.State.DENIED
         #   and ApprovalRequest.State.FAILED
         else:
             self.order.mark_failed(gettext_noop("Order Failed"))
 
-        for item in self.order.order_items:
-            if item.state not in OrderItem.FINISHED_STATES:
-                message = gettext_noop(
-                    "This order item has failed due to the entire \
+        message = gettext_noop(
+            "This order item has failed due to the entire \
 order %(state)s before it ran"
-                )
-                params = {"state": self.order.approvalrequest.state}
-                item.mark_failed(message, params)
+        )
+        OrderItem.bulk_mark(
+            [
+                item
+                for item in order_items
+                if item.state not in OrderItem.FINISHED_STATES
+            ],
+            message,
+            level=ProgressMessage.Level.ERROR,
+            params={"state": approval_state},
+            completed_at=timezone.now(),
+            state=OrderItem.State.FAILED,
+        )
 
         return self
+
+    def _clear_sensitive_data(self):
+        OrderItem.objects.filter(
+            order_id=self.order.id, service_parameters_raw__isnull=False
+        ).update(service_parameters_raw=None, updated_at=timezone.now())
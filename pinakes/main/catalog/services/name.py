@@ -2,34 +2,74 @@
 
 import re
 
+from django.db.models import BigIntegerField, Max, Value
+from django.db.models.functions import Cast, StrIndex, Substr
 
-NAME_PATTERN = (  # pattern of "Copy (2) of original_name"
-    "^Copy \\((\\d+)\\) of"
-)
+COPY_PREFIX = "Copy ("
 MAX_LENGTH = 64
+# Room left in a truncated copy name for "Copy (<index>) of "
+MAX_INDEX_DIGITS = 18
+_COPY_PREFIX_MAX_LENGTH = len("Copy () of ") + MAX_INDEX_DIGITS
 
 
-def create_copy_name(original_name, existing_names, max_length=MAX_LENGTH):
-    copied_name = copy(original_name, existing_names)
+def create_copy_name(
+    queryset, original_name, max_length=MAX_LENGTH, field="name"
+):
+    """Return the next unused copy name of original_name in the queryset.
 
-    return copied_name[:max_length] if max_length else copied_name
+    Only the names of the earlier copies of original_name are queried, the
+    highest copy index is computed by the database.
+    """
+    copied_name = _truncate(f"Copy of {original_name}", max_length)
+    if not queryset.filter(**{field: copied_name}).exists():
+        return copied_name
 
+    index = get_index(queryset, original_name, max_length, field)
+    return _truncate(f"Copy ({index + 1}) of {original_name}", max_length)
 
-def copy(original_name, names):
-    copied_name = f"Copy of {original_name}"
 
-    if copied_name in names:
-        i = get_index(names)
-        copied_name = f"Copy ({i+1}) of {original_name}"
+def available_name(
+    queryset, original_name, max_length=MAX_LENGTH, field="name"
+):
+    """Return original_name if unused in the queryset, or a copy name"""
+    if not queryset.filter(**{field: original_name}).exists():
+        return original_name
 
-    return copied_name
+    return create_copy_name(queryset, original_name, max_length, field)
 
 
-def get_index(names):
-    indexes = [
-        int(re.match(NAME_PATTERN, name).groups()[0])
-        for name in names
-        if re.match(NAME_PATTERN, name) is not None
-    ]
+def get_index(queryset, original_name, max_length=MAX_LENGTH, field="name"):
+    """Return the highest index of "Copy (index) of original_name" names"""
+    # A truncated copy name keeps at least this much of the original name
+    kept = original_name
+    if max_length:
+        kept = original_name[: max(max_length - _COPY_PREFIX_MAX_LENGTH, 0)]
+    pattern = f"^Copy \\([0-9]{{1,{MAX_INDEX_DIGITS}}}\\) of {re.escape(kept)}"
+    if kept == original_name:
+        pattern += "$"
 
-    return max(indexes) if len(indexes) > 0 else 0
+    digits_start = len(COPY_PREFIX) + 1
+    return (
+        queryset.filter(
+            **{
+                f"{field}__startswith": COPY_PREFIX,
+                f"{field}__regex": pattern,
+            }
+        )
+        .annotate(
+            copy_index=Cast(
+                Substr(
+                    field,
+                    digits_start,
+                    StrIndex(field, Value(")")) - digits_start,
+                ),
+                BigIntegerField(),
+            )
+        )
+        .aggregate(index=Max("copy_index"))["index"]
+        or 0
+    )
+
+
+def _truncate(name, max_length):
+    return name[:max_length] if max_length else name
@@ -0,0 +1,61 @@
+"""Request the approval of a submitted order"""
+import logging
+
+from django.utils.translation import gettext_noop
+
+from pinakes.main.catalog.models import (
+    ApprovalRequest,
+    Order,
+    ProgressMessage,
+)
+from pinakes.main.catalog.services.collect_tag_resources import (
+    CollectTagResources,
+)
+from pinakes.main.catalog.services.submit_approval_request import (
+    SubmitApprovalRequest,
+)
+
+logger = logging.getLogger("catalog")
+
+
+class RequestOrderApproval:
+    """Compute the tags of a submitted order and request its approval.
+
+    Safe to run again for the same order: orders that are no longer being
+    submitted or already have an approval request are skipped.
+    """
+
+    SUBMITTABLE_STATES = [Order.State.SUBMITTING, Order.State.PENDING]
+
+    def __init__(self, order, context=None):
+        self.order = order
+        self.context = context
+        self.skipped = False
+
+    def process(self):
+        if (
+            self.order.state not in self.SUBMITTABLE_STATES
+            or ApprovalRequest.objects.filter(order=self.order).exists()
+        ):
+            logger.info(
+                "Order %d in state %s is already submitted, skipping",
+                self.order.id,
+                self.order.state,
+            )
+            self.skipped = True
+            return self
+
+        tag_resources = CollectTagResources(self.order).process().tag_resources
+
+        message = gettext_noop(
+            "Computed tags for order %(order_id)d: %(tag_resources)s"
+        )
+        params = {"order_id": self.order.id, "tag_resources": tag_resources}
+        self.order.update_message(ProgressMessage.Level.INFO, message, params)
+
+        logger.info("Creating approval request for order id %d", self.order.id)
+        SubmitApprovalRequest(
+            tag_resources, self.order, self.context
+        ).process()
+
+        return self
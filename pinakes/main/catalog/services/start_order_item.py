@@ -2,7 +2,7 @@
 import logging
 from django.utils.translation import gettext_noop
 
-from pinakes.main.catalog.models import OrderItem, ProgressMessage, ServicePlan
+from pinakes.main.catalog.models import OrderItem, ProgressMessage
 from pinakes.main.catalog.services.compute_runtime_parameters import (
     ComputeRuntimeParameters,
 )
@@ -60,11 +60,10 @@ class StartOrderItem:
 
             svc = ComputeRuntimeParameters(item).process()
             if svc.substituted:
-                service_plan = ServicePlan.objects.get(
-                    inventory_service_plan_ref=item.inventory_service_plan_ref
-                )
                 item.service_parameters = (
-                    SanitizeParameters(service_plan, svc.runtime_parameters)
+                    SanitizeParameters(
+                        svc.service_plan, svc.runtime_parameters
+                    )
                     .process()
                     .sanitized_parameters
                 )
@@ -0,0 +1,155 @@
+"""Stream the progress of an order as server-sent events"""
+import json
+import time
+
+import django_rq
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+from django.utils import translation
+from django.utils.translation import gettext as _
+
+from pinakes.main.catalog import events
+from pinakes.main.catalog.models import Order, OrderItem, ProgressMessage
+from pinakes.main.catalog.serializers import ProgressMessageSerializer
+
+END = "end"
+
+
+class StreamOrderEvents:
+    """Stream state changes and progress messages of an order.
+
+    The stream starts with the current state of the order and its items,
+    followed by the progress messages newer than the cursor. Each message
+    event carries the message id as its event id, so a reconnecting client
+    resumes after the last message it received. The stream is closed with
+    an end event once the order is finished, or after the configured
+    timeout, after which the client is expected to reconnect.
+
+    The database connections of the stream are given back while it waits
+    for a change, an idle stream does not hold one of the pool.
+    """
+
+    KEEPALIVE_INTERVAL = 15
+
+    def __init__(self, order, cursor=None, timeout=None):
+        self.order = order
+        self.cursor = cursor or 0
+        self.timeout = (
+            settings.PINAKES_ORDER_EVENTS_TIMEOUT
+            if timeout is None
+            else timeout
+        )
+        self.language = translation.get_language()
+        self.stream = None
+
+    def process(self):
+        self.stream = self._stream()
+        return self
+
+    def _stream(self):
+        pubsub = django_rq.get_connection().pubsub(
+            ignore_subscribe_messages=True
+        )
+        try:
+            # Subscribe before reading the current state, so that no
+            # change committed in between is missed
+            pubsub.subscribe(events.get_channel(self.order.id))
+            with translation.override(self.language):
+                yield from self._events(pubsub)
+        finally:
+            pubsub.close()
+
+    def _events(self, pubsub):
+        self.order.refresh_from_db()
+        yield self._state_event(
+            Order.__name__, self.order.id, self.order.state
+        )
+        for item in OrderItem.objects.filter(order_id=self.order.id):
+            yield self._state_event(OrderItem.__name__, item.id, item.state)
+        yield from self._message_events()
+
+        if self.order.state in Order.FINISHED_STATES:
+            yield self._format(END, {"id": self.order.id})
+            return
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+
+            _release_connections()
+            message = pubsub.get_message(
+                timeout=min(self.KEEPALIVE_INTERVAL, remaining)
+            )
+            if message is None:
+                yield ": keepalive\n\n"
+                continue
+
+            event = json.loads(message["data"])
+            if event["event"] == events.MESSAGE:
+                yield from self._message_events()
+            elif event["event"] == events.STATE:
+                yield self._state_event(
+                    event["type"], event["id"], event["state"]
+                )
+                if (
+                    event["type"] == Order.__name__
+                    and event["state"] in Order.FINISHED_STATES
+                ):
+                    yield from self._message_events()
+                    yield self._format(END, {"id": self.order.id})
+                    return
+
+    def _message_events(self):
+        messages = ProgressMessage.objects.filter(
+            Q(
+                messageable_type=Order.__name__,
+                messageable_id=self.order.id,
+            )
+            | Q(
+                messageable_type=OrderItem.__name__,
+                messageable_id__in=OrderItem.objects.filter(
+                    order_id=self.order.id
+                ).values("id"),
+            ),
+            tenant=self.order.tenant,
+            id__gt=self.cursor,
+        ).order_by("id")
+
+        for message in messages:
+            self.cursor = message.id
+            yield self._format(
+                events.MESSAGE,
+                ProgressMessageSerializer(message).data,
+                event_id=message.id,
+            )
+
+    def _state_event(self, messageable_type, messageable_id, state):
+        return self._format(
+            events.STATE,
+            {
+                "messageable_type": _(messageable_type),
+                "messageable_id": messageable_id,
+                "state": _(state),
+            },
+        )
+
+    @staticmethod
+    def _format(event, data, event_id=None):
+        lines = []
+        if event_id is not None:
+            lines.append(f"id: {event_id}")
+        lines.append(f"event: {event}")
+        lines.append(f"data: {json.dumps(data, cls=DjangoJSONEncoder)}")
+        return "\n".join(lines) + "\n\n"
+
+
+def _release_connections():
+    # Closing a connection hands it back to the pool, the next query
+    # opens one again. A connection in a transaction is left alone.
+    for connection in connections.all():
+        if not connection.in_atomic_block:
+            connection.close()
@@ -4,6 +4,7 @@ import traceback
 
 from django.utils.translation import gettext_lazy as _
 
+from pinakes.main.approval.models import Request
 from pinakes.main.approval.services.create_request import (
     CreateRequest,
 )
@@ -35,12 +36,16 @@ class SubmitApprovalRequest:
 
     def _submit_approval_request(self):
         try:
-            request_body = self._create_approval_request_body()
-            svc = CreateRequest(request_body, self.context).process()
+            request = self._existing_request()
+            if request is None:
+                request_body = self._create_approval_request_body()
+                request = (
+                    CreateRequest(request_body, self.context).process().request
+                )
 
             ApprovalRequest.objects.create(
-                approval_request_ref=str(svc.request.id),
-                state=str(svc.request.decision),
+                approval_request_ref=str(request.id),
+                state=str(request.decision),
                 order=self.order,
                 tenant_id=self.order.tenant_id,
             )
@@ -66,6 +71,25 @@ class SubmitApprovalRequest:
                 )
             )
 
+    def _existing_request(self):
+        # A retried submission reuses the request created by the failed one
+        request = (
+            Request.objects.filter(
+                parent=None,
+                tenant_id=self.order.tenant_id,
+                request_context__content__order_id=str(self.order.id),
+            )
+            .order_by("id")
+            .first()
+        )
+        if request is not None:
+            logger.info(
+                "Reusing approval request %d for Order %d",
+                request.id,
+                self.order.id,
+            )
+        return request
+
     def _create_approval_request_body(self):
         return {
             "name": self.order_item.portfolio_item.name,
@@ -0,0 +1,90 @@
+"""Submit an order for approval"""
+import logging
+
+from django.utils.translation import gettext_lazy as _
+from django.utils.translation import gettext_noop
+
+from pinakes.common import queues
+from pinakes.main.catalog import tasks
+from pinakes.main.catalog.exceptions import BadParamsException
+from pinakes.main.catalog.models import Order
+from pinakes.main.catalog.services.validate_order_item import (
+    ValidateOrderItem,
+)
+
+logger = logging.getLogger("catalog")
+
+
+class SubmitOrder:
+    """Validate an order and hand its submission to a background task.
+
+    Only the checks that need a few queries run here, computing the tags
+    and creating the approval request is left to the submit_orders task.
+    Submitting an order which is already being submitted enqueues the
+    task again, in case the previous one was lost. The task skips orders
+    it has already submitted.
+    """
+
+    def __init__(self, order, context=None):
+        self.order = order
+        self.context = context
+        self.job = None
+
+    def process(self):
+        self._validate()
+
+        message = gettext_noop("Submitting order %(order_id)d for approval")
+        params = {"order_id": self.order.id}
+        if not self.order.mark_submitting(message, params):
+            if self.order.state == Order.State.SUBMITTING:
+                logger.info(
+                    "Order %d is already submitting, enqueuing it again",
+                    self.order.id,
+                )
+                self._enqueue()
+                return self
+
+            raise BadParamsException(
+                _(
+                    "Order {} cannot be submitted in its current state: {}"
+                ).format(self.order.id, self.order.state)
+            )
+
+        try:
+            self._enqueue()
+        except Exception:
+            # Let the client submit the order again
+            Order.objects.filter(
+                id=self.order.id, state=Order.State.SUBMITTING
+            ).update(state=Order.State.CREATED)
+            raise
+
+        return self
+
+    def _enqueue(self):
+        self.job = queues.enqueue(
+            tasks.submit_orders,
+            [self.order.id],
+            self.context,
+            owner=self.order,
+        )
+
+    def _validate(self):
+        order_item = self.order.product
+        if not order_item:
+            raise BadParamsException(
+                _("Order {} does not have related order items").format(
+                    self.order.id
+                )
+            )
+
+        ValidateOrderItem(order_item).process()
+
+        for item in self.order.order_items.select_related("portfolio_item"):
+            if not item.portfolio_item.service_offering_ref:
+                raise BadParamsException(
+                    _(
+                        "Portfolio item {} does not have related service"
+                        " offering"
+                    ).format(item.portfolio_item.id)
+                )
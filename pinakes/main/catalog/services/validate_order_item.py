@@ -11,13 +11,16 @@ from pinakes.main.catalog.models import ServicePlan
 class ValidateOrderItem:
     """Compare service plans"""
 
-    def __init__(self, order_item):
+    def __init__(self, order_item, service_plans=None):
         self.order_item = order_item
+        self.service_plans = service_plans
 
     def process(self):
-        service_plans = ServicePlan.objects.filter(
-            portfolio_item=self.order_item.portfolio_item
-        )
+        service_plans = self.service_plans
+        if service_plans is None:
+            service_plans = ServicePlan.objects.filter(
+                portfolio_item=self.order_item.portfolio_item
+            )
 
         changed_plans = [plan for plan in service_plans if plan.outdated]
 
@@ -0,0 +1,97 @@
+"""Compiled survey schemas of service plans.
+
+Sanitizing and computing the service parameters of an order item looks
+up the schema fields by name many times. The schema of a service plan is
+compiled once into indexes by field name and cached by the hash of the
+base and the modified schemas, so every order of the same service plan
+reuses it until the schema changes.
+"""
+import collections
+import hashlib
+import json
+import re
+import threading
+
+CACHE_SIZE = 256
+
+EMPTY_SCHEMA_TYPE = "emptySchema"
+FILTERED_PARAMS = ["password", "token", "secret"]
+
+_FILTERED_PARAMS_RE = re.compile("|".join(FILTERED_PARAMS))
+
+_cache = collections.OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class CompiledSchema:
+    """Fields of a survey schema indexed by name"""
+
+    def __init__(self, schema):
+        schema = schema or {}
+        self.empty = schema.get("schemaType") == EMPTY_SCHEMA_TYPE
+        self.fields = {
+            field["name"]: field
+            for field in schema.get("schema", {}).get("fields", [])
+            if field.get("name")
+        }
+        self.required = frozenset(
+            name
+            for name, field in self.fields.items()
+            if field.get("isRequired", False)
+        )
+        self.masked = frozenset(
+            name
+            for name, field in self.fields.items()
+            if self._need_mask(field)
+        )
+        self.substitutions = frozenset(
+            name
+            for name, field in self.fields.items()
+            if field.get("isSubstitution")
+        )
+
+    @property
+    def parameter_names(self):
+        """Names of the fields that take service parameters"""
+        return frozenset() if self.empty else self.fields.keys()
+
+    @staticmethod
+    def _need_mask(field):
+        return (
+            field.get("type") == "password"
+            or _FILTERED_PARAMS_RE.match(field.get("name") or "") is not None
+            or _FILTERED_PARAMS_RE.match(field.get("label") or "") is not None
+        )
+
+
+def compile_schema(service_plan) -> CompiledSchema:
+    """Return the compiled schema of a service plan"""
+    key = (
+        service_plan.base_sha256 or _digest(service_plan.base_schema),
+        _digest(service_plan.modified_schema),
+    )
+    with _cache_lock:
+        compiled = _cache.get(key)
+        if compiled is not None:
+            _cache.move_to_end(key)
+            return compiled
+
+    compiled = CompiledSchema(service_plan.schema)
+    with _cache_lock:
+        _cache[key] = compiled
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return compiled
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
+
+
+def _digest(schema):
+    if schema is None:
+        return ""
+    return hashlib.sha256(
+        json.dumps(schema, sort_keys=True).encode("utf-8")
+    ).hexdigest()
@@ -1,16 +1,30 @@
-"""Tasks to add/remove portfolio permissions"""
+"""Tasks to add/remove portfolio permissions and process orders"""
 import logging
+from datetime import timedelta
 
+from django.conf import settings
+from django.utils import timezone
+from django.utils.translation import gettext_noop
+from rest_framework.exceptions import APIException
+
+from pinakes.common import queues
 from pinakes.common.auth import keycloak_django
 from pinakes.main.common.tasks import (
     add_group_permissions,
     remove_group_permissions,
 )
-from pinakes.main.catalog.models import Portfolio
+from pinakes.main.catalog.models import Order, Portfolio
+from pinakes.main.catalog.services.compact_progress_messages import (
+    CompactProgressMessages,
+)
+from pinakes.main.catalog.services.request_order_approval import (
+    RequestOrderApproval,
+)
 
 logger = logging.getLogger("catalog")
 
 
+@queues.task_queue(queues.INTERACTIVE)
 def add_portfolio_permissions(portfolio_id, groups_ids, permissions):
     """Add group permissions for a portfolio and set share counter"""
     portfolio = Portfolio.objects.get(id=portfolio_id)
@@ -18,6 +32,7 @@ def add_portfolio_permissions(portfolio_id, groups_ids, permissions):
     _update_share_counter(portfolio.keycloak_id)
 
 
+@queues.task_queue(queues.INTERACTIVE)
 def remove_portfolio_permissions(portfolio_id, groups_ids, permissions):
     """Remove group permissions for a portfolio and set share counter"""
     portfolio = Portfolio.objects.get(id=portfolio_id)
@@ -25,9 +40,55 @@ def remove_portfolio_permissions(portfolio_id, groups_ids, permissions):
     _update_share_counter(portfolio.keycloak_id)
 
 
+@queues.task_queue(queues.INTERACTIVE)
+def submit_orders(order_ids, context=None):
+    """Request the approval of submitted orders, failing invalid orders"""
+    submitted = []
+    skipped = []
+    failed = []
+    for order in Order.objects.filter(id__in=order_ids).order_by("id"):
+        try:
+            svc = RequestOrderApproval(order, context).process()
+        except APIException as error:
+            logger.error("Failed to submit order %d: %s", order.id, error)
+            _fail_order(order, str(error.detail))
+            failed.append(order.id)
+        except Exception as error:
+            # An order left in submitting would never be submitted again
+            logger.exception("Failed to submit order %d", order.id)
+            _fail_order(order, str(error))
+            failed.append(order.id)
+        else:
+            (skipped if svc.skipped else submitted).append(order.id)
+
+    return {"submitted": submitted, "skipped": skipped, "failed": failed}
+
+
+@queues.task_queue(queues.SYNC)
+def compact_progress_messages():
+    """Compact the progress messages of orders finished before the TTL"""
+    expire_time = timezone.now() - timedelta(
+        days=settings.PINAKES_PROGRESS_MESSAGE_TTL_DAYS
+    )
+    svc = CompactProgressMessages(expire_time).process()
+    return {
+        "compacted_orders": svc.compacted_orders,
+        "archived_messages": svc.archived_messages,
+    }
+
+
+def _fail_order(order, error):
+    order.mark_failed(
+        gettext_noop("Failed to submit order %(order_id)d: %(error)s"),
+        {"order_id": order.id, "error": error},
+    )
+
+
 def _update_share_counter(keycloak_id):
     """Set the share count based on the permission sets
     in keycloak for this resource."""
     client = keycloak_django.get_uma_client()
     count = len(client.find_permissions_by_resource(keycloak_id))
-    Portfolio.objects.filter(keycloak_id=keycloak_id).update(share_count=count)
+    Portfolio.objects.filter(keycloak_id=keycloak_id).update(
+        share_count=count, updated_at=timezone.now()
+    )
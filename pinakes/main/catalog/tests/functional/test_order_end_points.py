@@ -1,7 +1,12 @@
 """Test order end points"""
+import asyncio
 import json
+import urllib.parse
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from pinakes.main.catalog.models import Order
 from pinakes.main.catalog.permissions import (
     OrderPermission,
     OrderItemPermission,
@@ -23,6 +28,7 @@ EXPECTED_USER_CAPABILITIES = {
     "destroy": True,
     "cancel": True,
     "submit": True,
+    "events": True,
 }
 
 
@@ -108,7 +114,7 @@ def test_order_retrieve_extra(api_request, mocker):
 @pytest.mark.django_db
 def test_order_submit(api_request, mocker):
     """Submit a single order by id"""
-    mocker.patch("django_rq.enqueue")
+    enqueue = mocker.patch("pinakes.common.queues.enqueue")
     check_object_permission = mocker.spy(
         OrderPermission, "perform_check_object_permission"
     )
@@ -126,11 +132,58 @@ def test_order_submit(api_request, mocker):
     response = api_request("post", "catalog:order-submit", order.id)
     order.refresh_from_db()
 
-    assert response.status_code == 200
+    assert response.status_code == 202
     content = json.loads(response.content)
-    assert content["state"] == "Approval Pending"
+    assert content["state"] == "Submitting"
     assert content["state"] == order.state
     check_object_permission.assert_called()
+    enqueue.assert_called_once()
+    assert enqueue.call_args.args[1] == [order.id]
+
+    # Retrying the submission enqueues the order again, in case the task
+    # was lost, without changing its state
+    response = api_request("post", "catalog:order-submit", order.id)
+
+    assert response.status_code == 202
+    assert json.loads(response.content)["state"] == "Submitting"
+    assert enqueue.call_count == 2
+    assert enqueue.call_args.args[1] == [order.id]
+
+
+@pytest.mark.django_db
+def test_order_submit_in_wrong_state(api_request, mocker):
+    """Submit an order which was already processed"""
+    enqueue = mocker.patch("pinakes.common.queues.enqueue")
+    portfolio_item = PortfolioItemFactory(service_offering_ref="1")
+    order = OrderFactory(state=Order.State.COMPLETED)
+    OrderItemFactory(order=order, portfolio_item=portfolio_item)
+
+    response = api_request("post", "catalog:order-submit", order.id)
+
+    assert response.status_code == 400
+    content = json.loads(response.content)
+    assert content["detail"] == (
+        f"Order {order.id} cannot be submitted in its current state:"
+        " Completed"
+    )
+    enqueue.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_order_submit_enqueue_failure(api_request, mocker):
+    """A submission which cannot be enqueued can be retried"""
+    mocker.patch(
+        "pinakes.common.queues.enqueue", side_effect=RuntimeError("down")
+    )
+    portfolio_item = PortfolioItemFactory(service_offering_ref="1")
+    order = OrderFactory()
+    OrderItemFactory(order=order, portfolio_item=portfolio_item)
+
+    response = api_request("post", "catalog:order-submit", order.id)
+
+    assert response.status_code == 500
+    order.refresh_from_db()
+    assert order.state == Order.State.CREATED
 
 
 @pytest.mark.django_db
@@ -179,7 +232,7 @@ def test_order_submit_without_order_item(api_request, mocker):
 @pytest.mark.django_db
 def test_order_cancel(api_request, mocker):
     """Cancels a single order by id"""
-    mocker.patch("django_rq.enqueue")
+    mocker.patch("pinakes.common.queues.enqueue")
     check_object_permission = mocker.spy(
         OrderPermission, "perform_check_object_permission"
     )
@@ -199,7 +252,7 @@ def test_order_cancel(api_request, mocker):
 @pytest.mark.django_db
 def test_order_cancel_with_uncancelable_states(api_request, mocker):
     """Cancels a single order by id"""
-    mocker.patch("django_rq.enqueue")
+    mocker.patch("pinakes.common.queues.enqueue")
     check_object_permission = mocker.spy(
         OrderPermission, "perform_check_object_permission"
     )
@@ -279,6 +332,61 @@ def test_order_order_items_get(api_request, mocker):
     scope_queryset.assert_called_once()
 
 
+@pytest.mark.django_db
+def test_order_order_items_get_heavy_fields(api_request):
+    """Large fields are left out of the list unless extra=true"""
+    order = OrderFactory()
+    OrderItemFactory(
+        order=order,
+        service_parameters={"a": 1},
+        artifacts={"b": 2},
+    )
+
+    with CaptureQueriesContext(connection) as captured:
+        response = api_request("get", "catalog:order-orderitem-list", order.id)
+
+    result = json.loads(response.content)["results"][0]
+    assert "service_parameters" not in result
+    assert "artifacts" not in result
+    assert "provider_control_parameters" not in result
+    selects = [
+        query["sql"]
+        for query in captured.captured_queries
+        if 'FROM "main_orderitem"' in query["sql"]
+    ]
+    assert selects
+    assert not any("artifacts" in sql for sql in selects)
+
+    response = api_request(
+        "get",
+        "catalog:order-orderitem-list",
+        order.id,
+        data={"extra": "true"},
+    )
+
+    result = json.loads(response.content)["results"][0]
+    assert result["service_parameters"] == {"a": 1}
+    assert result["artifacts"] == {"b": 2}
+
+
+@pytest.mark.django_db
+def test_order_order_items_get_fields(api_request):
+    """Select the returned fields of the order items"""
+    order = OrderFactory()
+    OrderItemFactory(order=order, artifacts={"b": 2})
+
+    response = api_request(
+        "get",
+        "catalog:order-orderitem-list",
+        order.id,
+        data={"fields": "id,name,artifacts"},
+    )
+
+    result = json.loads(response.content)["results"][0]
+    assert set(result) == {"id", "name", "artifacts"}
+    assert result["artifacts"] == {"b": 2}
+
+
 @pytest.mark.django_db
 def test_order_order_item_post(api_request, mocker):
     """Create a new order item from an order"""
@@ -306,3 +414,157 @@ def test_order_order_item_post(api_request, mocker):
     )
     # uniqueness
     assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_order_events_not_asgi(api_request, mocker):
+    """Only the ASGI application streams the progress of an order"""
+    get_connection = mocker.patch("django_rq.get_connection")
+    check_object_permission = mocker.spy(
+        OrderPermission, "perform_check_object_permission"
+    )
+    order = OrderFactory(state="Completed")
+
+    response = api_request("get", "catalog:order-events", order.id)
+
+    assert response.status_code == 204
+    assert not response.streaming
+    get_connection.assert_not_called()
+    check_object_permission.assert_called()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_order_events_asgi(asgi_request, mocker):
+    """Stream the progress of an order from the ASGI application"""
+    pubsub = mocker.patch(
+        "django_rq.get_connection"
+    ).return_value.pubsub.return_value
+    order = OrderFactory(state=Order.State.ORDERED)
+
+    def get_message(timeout):
+        # Waiting for a message must not block the event loop
+        with pytest.raises(RuntimeError):
+            asyncio.get_running_loop()
+        Order.objects.filter(id=order.id).update(state=Order.State.COMPLETED)
+        return {
+            "type": "message",
+            "data": json.dumps(
+                {
+                    "event": "state",
+                    "type": "Order",
+                    "id": order.id,
+                    "state": Order.State.COMPLETED,
+                }
+            ),
+        }
+
+    pubsub.get_message.side_effect = get_message
+
+    status, headers, body = asgi_request("catalog:order-events", order.id)
+
+    assert status == 200
+    assert headers[b"Content-Type"] == b"text/event-stream"
+    content = body.decode()
+    assert content.startswith("event: state\n")
+    assert '"state": "Completed"' in content
+    assert content.endswith(f'event: end\ndata: {{"id": {order.id}}}\n\n')
+    pubsub.close.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_order_events_bad_cursor(api_request):
+    """Reject a cursor which is not an integer"""
+    order = OrderFactory()
+
+    response = api_request(
+        "get", "catalog:order-events", order.id, data={"cursor": "abc"}
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_order_list_cursor_pagination(api_request):
+    """Page through orders with a cursor"""
+    orders = [OrderFactory() for _ in range(3)]
+
+    response = api_request(
+        "get",
+        "catalog:order-list",
+        data={"pagination": "cursor", "page_size": 2},
+    )
+
+    assert response.status_code == 200
+    content = json.loads(response.content)
+    assert "count" not in content
+    assert [item["id"] for item in content["results"]] == [
+        orders[2].id,
+        orders[1].id,
+    ]
+    assert content["previous"] is None
+
+    query = urllib.parse.urlparse(content["next"]).query
+    response = api_request(
+        "get",
+        "catalog:order-list",
+        data=dict(urllib.parse.parse_qsl(query)),
+    )
+
+    content = json.loads(response.content)
+    assert [item["id"] for item in content["results"]] == [orders[0].id]
+    assert content["next"] is None
+
+
+@pytest.mark.django_db
+def test_order_bulk(api_request, mocker):
+    """Create and submit many orders at once"""
+    enqueue = mocker.patch("pinakes.common.queues.enqueue")
+    enqueue.return_value.id = "abc"
+    portfolio_item = PortfolioItemFactory(service_offering_ref="1")
+    data = {
+        "orders": [
+            {"order_items": [{"portfolio_item": portfolio_item.id}]},
+            {"order_items": [{"portfolio_item": 0}]},
+        ]
+    }
+
+    response = api_request("post", "catalog:order-bulk", data=data)
+
+    assert response.status_code == 202
+    content = json.loads(response.content)
+    assert content["task_id"] == "abc"
+    assert content["results"][1] == {
+        "index": 1,
+        "id": None,
+        "error": "Portfolio item 0 does not exist",
+    }
+    order = Order.objects.get(id=content["results"][0]["id"])
+    assert order.state == Order.State.SUBMITTING
+    assert order.product.portfolio_item == portfolio_item
+    enqueue.assert_called_once()
+    assert enqueue.call_args.args[1] == [order.id]
+
+
+@pytest.mark.django_db
+def test_order_bulk_all_invalid(api_request, mocker):
+    """Nothing is submitted when no order is valid"""
+    enqueue = mocker.patch("pinakes.common.queues.enqueue")
+
+    response = api_request(
+        "post",
+        "catalog:order-bulk",
+        data={"orders": [{"order_items": [{"portfolio_item": 0}]}]},
+    )
+
+    assert response.status_code == 400
+    content = json.loads(response.content)
+    assert content["task_id"] is None
+    enqueue.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_order_bulk_empty(api_request):
+    """Reject a request without orders"""
+    response = api_request("post", "catalog:order-bulk", data={"orders": []})
+
+    assert response.status_code == 400
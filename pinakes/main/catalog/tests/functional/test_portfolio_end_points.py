@@ -15,6 +15,7 @@ from pinakes.main.catalog.models import (
     Portfolio,
     PortfolioItem,
 )
+from pinakes.main.catalog.serializers import PortfolioSerializer
 from pinakes.main.catalog.tests.factories import (
     ImageFactory,
     PortfolioFactory,
@@ -70,6 +71,32 @@ def test_portfolio_list(api_request, mocker):
     scope_queryset.assert_called_once()
 
 
+@pytest.mark.django_db
+def test_portfolio_list_user_capabilities_per_page(api_request, mocker):
+    """The user capabilities of a page are evaluated at once"""
+    capabilities = mocker.spy(
+        PortfolioPermission, "get_objects_user_capabilities"
+    )
+    check = mocker.spy(PortfolioPermission, "aperform_check_object_permission")
+
+    PortfolioFactory.create_batch(3)
+    response = api_request("get", "catalog:portfolio-list")
+
+    assert response.status_code == 200
+    results = json.loads(response.content)["results"]
+    assert len(results) == 3
+    for result in results:
+        assert (
+            result["metadata"]["user_capabilities"]
+            == EXPECTED_USER_CAPABILITIES
+        )
+
+    capabilities.assert_called_once()
+    assert len(capabilities.call_args.args[3]) == 3
+    # read, update and delete of each portfolio
+    assert check.call_count == 9
+
+
 @pytest.mark.django_db
 def test_portfolio_retrieve(api_request):
     """Retrieve a single portfolio by id"""
@@ -84,6 +111,75 @@ def test_portfolio_retrieve(api_request):
     )
 
 
+@pytest.mark.django_db
+def test_portfolio_retrieve_not_modified(api_request, mocker):
+    """A portfolio matching the ETag of the client is not serialized"""
+    portfolio = PortfolioFactory()
+    response = api_request("get", "catalog:portfolio-detail", portfolio.id)
+
+    assert response.status_code == 200
+    assert response["Last-Modified"]
+    assert "no-cache" in response["Cache-Control"]
+    etag = response["ETag"]
+
+    to_representation = mocker.spy(PortfolioSerializer, "to_representation")
+    response = api_request(
+        "get",
+        "catalog:portfolio-detail",
+        portfolio.id,
+        headers={"HTTP_IF_NONE_MATCH": etag},
+    )
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    assert not response.content
+    to_representation.assert_not_called()
+
+    PortfolioItemFactory(portfolio=portfolio)
+    response = api_request(
+        "get",
+        "catalog:portfolio-detail",
+        portfolio.id,
+        headers={"HTTP_IF_NONE_MATCH": etag},
+    )
+
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_portfolio_list_not_modified(api_request):
+    """A list matching the ETag of the client is not serialized"""
+    PortfolioFactory()
+    response = api_request("get", "catalog:portfolio-list")
+    etag = response["ETag"]
+
+    response = api_request(
+        "get",
+        "catalog:portfolio-list",
+        headers={"HTTP_IF_NONE_MATCH": etag},
+    )
+    assert response.status_code == 304
+
+    response = api_request(
+        "get",
+        "catalog:portfolio-list",
+        data={"page_size": 5},
+        headers={"HTTP_IF_NONE_MATCH": etag},
+    )
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+    PortfolioFactory()
+    response = api_request(
+        "get",
+        "catalog:portfolio-list",
+        headers={"HTTP_IF_NONE_MATCH": etag},
+    )
+    assert response.status_code == 200
+    assert json.loads(response.content)["count"] == 2
+
+
 @pytest.mark.django_db
 def test_portfolio_delete(api_request):
     """Delete a single portfolio by id"""
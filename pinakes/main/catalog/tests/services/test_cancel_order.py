@@ -33,6 +33,7 @@ def test_cancel_order():
     approval_request.refresh_from_db()
 
     assert order.state == Order.State.CANCELED
+    assert order.completed_at is not None
     assert approval_request.state == Request.State.CANCELED
     assert Action.objects.count() == 1
     assert Action.objects.first().operation == Action.Operation.CANCEL
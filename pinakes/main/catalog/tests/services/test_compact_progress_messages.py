@@ -0,0 +1,89 @@
+"""Test on CompactProgressMessages service"""
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from pinakes.main.catalog.models import (
+    ArchivedProgressMessage,
+    Order,
+    ProgressMessage,
+)
+from pinakes.main.catalog.services.compact_progress_messages import (
+    SUMMARY_MESSAGE,
+    CompactProgressMessages,
+)
+from pinakes.main.catalog.tests.factories import (
+    OrderFactory,
+    OrderItemFactory,
+    ProgressMessageFactory,
+)
+
+
+def _add_messages(messageable, count, level=ProgressMessage.Level.INFO):
+    for _ in range(count):
+        ProgressMessageFactory(
+            messageable_type=messageable.__class__.__name__,
+            messageable_id=messageable.id,
+            level=level,
+        )
+
+
+def _messages(order):
+    return ProgressMessage.objects.filter(
+        messageable_type="Order", messageable_id=order.id
+    )
+
+
+@pytest.mark.django_db
+def test_compact_progress_messages():
+    now = timezone.now()
+    old = now - timedelta(days=100)
+    completed = OrderFactory(state=Order.State.COMPLETED, completed_at=old)
+    _add_messages(completed, 3)
+    _add_messages(OrderItemFactory(order=completed), 2)
+    failed = OrderFactory(state=Order.State.FAILED, completed_at=old)
+    _add_messages(failed, 1)
+    failed_item = OrderItemFactory(order=failed)
+    _add_messages(failed_item, 1, ProgressMessage.Level.ERROR)
+    recent = OrderFactory(state=Order.State.COMPLETED, completed_at=now)
+    _add_messages(recent, 2)
+    ordered = OrderFactory(state=Order.State.ORDERED)
+    _add_messages(ordered, 2)
+    # Canceled before the cancellation recorded a completion time
+    canceled = OrderFactory(state=Order.State.CANCELED)
+    Order.objects.filter(id=canceled.id).update(updated_at=old)
+    _add_messages(canceled, 1)
+
+    svc = CompactProgressMessages(now - timedelta(days=90), 1).process()
+
+    assert svc.compacted_orders == 3
+    assert svc.archived_messages == 8
+    summary = _messages(completed).get()
+    assert summary.message == SUMMARY_MESSAGE
+    assert summary.level == ProgressMessage.Level.INFO
+    assert summary.message_params == {
+        "order_id": completed.id,
+        "state": "Completed",
+        "count": 5,
+    }
+    assert _messages(failed).get().level == ProgressMessage.Level.ERROR
+    assert not ProgressMessage.objects.filter(
+        messageable_type="OrderItem", messageable_id=failed_item.id
+    ).exists()
+    assert _messages(recent).count() == 2
+    assert _messages(ordered).count() == 2
+    assert _messages(canceled).get().message == SUMMARY_MESSAGE
+
+    archived = ArchivedProgressMessage.objects.filter(
+        messageable_type="OrderItem", messageable_id=failed_item.id
+    ).get()
+    assert archived.level == ProgressMessage.Level.ERROR
+    assert archived.tenant_id == failed.tenant_id
+    assert ArchivedProgressMessage.objects.count() == 8
+
+    # Compacted orders are not compacted again
+    svc = CompactProgressMessages(now - timedelta(days=90)).process()
+
+    assert svc.compacted_orders == 0
+    assert _messages(completed).get().id == summary.id
@@ -0,0 +1,112 @@
+"""Test on CreateOrders service"""
+import pytest
+
+from pinakes.main.catalog.models import Order, OrderItem
+from pinakes.main.catalog.services.create_orders import CreateOrders
+from pinakes.main.catalog.tests.factories import (
+    PortfolioItemFactory,
+    ServicePlanFactory,
+)
+from pinakes.main.tests.factories import UserFactory, default_tenant
+
+_SCHEMA = {
+    "schema": {
+        "fields": [
+            {
+                "name": "password",
+                "type": "password",
+                "label": "Password",
+                "isRequired": True,
+            },
+            {"name": "name", "label": "Name"},
+        ]
+    }
+}
+
+
+@pytest.mark.django_db
+def test_create_orders(django_assert_max_num_queries):
+    user = UserFactory()
+    portfolio_item = PortfolioItemFactory(service_offering_ref="1")
+    ServicePlanFactory(
+        portfolio_item=portfolio_item,
+        base_schema=_SCHEMA,
+        inventory_service_plan_ref="2",
+    )
+    other_item = PortfolioItemFactory(service_offering_ref="3")
+    orders_data = [
+        {
+            "order_items": [
+                {
+                    "portfolio_item": portfolio_item.id,
+                    "service_parameters": {
+                        "password": "secret",
+                        "name": "vm",
+                    },
+                }
+            ]
+        }
+        for _ in range(10)
+    ]
+    orders_data.append({"order_items": [{"portfolio_item": other_item.id}]})
+
+    with django_assert_max_num_queries(8):
+        svc = CreateOrders(orders_data, user, default_tenant()).process()
+
+    assert len(svc.orders) == 11
+    assert [result["index"] for result in svc.results] == list(range(11))
+    assert all(result["error"] is None for result in svc.results)
+    assert Order.objects.filter(user=user).count() == 11
+
+    item = OrderItem.objects.get(order=svc.orders[0])
+    assert item.name == portfolio_item.name
+    assert item.inventory_service_plan_ref == "2"
+    assert item.service_parameters == {"password": "$protected$", "name": "vm"}
+    assert item.service_parameters_raw == {"password": "secret", "name": "vm"}
+
+
+@pytest.mark.django_db
+def test_create_orders_with_invalid_orders():
+    user = UserFactory()
+    valid_item = PortfolioItemFactory(service_offering_ref="1")
+    outdated_item = PortfolioItemFactory(service_offering_ref="2")
+    ServicePlanFactory(portfolio_item=outdated_item, outdated=True)
+    no_offering_item = PortfolioItemFactory(service_offering_ref=None)
+    required_item = PortfolioItemFactory(service_offering_ref="3")
+    ServicePlanFactory(
+        portfolio_item=required_item,
+        base_schema=_SCHEMA,
+        inventory_service_plan_ref="4",
+    )
+    orders_data = [
+        {"order_items": [{"portfolio_item": valid_item.id}]},
+        {"order_items": [{"portfolio_item": outdated_item.id}]},
+        {"order_items": [{"portfolio_item": no_offering_item.id}]},
+        {"order_items": [{"portfolio_item": 0}]},
+        {
+            "order_items": [
+                {"portfolio_item": valid_item.id},
+                {"portfolio_item": valid_item.id},
+            ]
+        },
+        {
+            "order_items": [
+                {
+                    "portfolio_item": required_item.id,
+                    "service_parameters": {"name": "vm"},
+                }
+            ]
+        },
+    ]
+
+    svc = CreateOrders(orders_data, user, default_tenant()).process()
+
+    assert len(svc.orders) == 1
+    assert svc.results[0]["id"] == svc.orders[0].id
+    assert [result["id"] for result in svc.results[1:]] == [None] * 5
+    assert "The underlying survey" in svc.results[1]["error"]
+    assert "does not have related service offering" in svc.results[2]["error"]
+    assert svc.results[3]["error"] == "Portfolio item 0 does not exist"
+    assert "is ordered more than once" in svc.results[4]["error"]
+    assert "parameter password is required" in svc.results[5]["error"]
+    assert Order.objects.filter(user=user).count() == 1
@@ -9,6 +9,7 @@ from pinakes.main.approval.tests.factories import (
 from pinakes.main.catalog.models import (
     ApprovalRequest,
     Order,
+    OrderItem,
     ProgressMessage,
 )
 from pinakes.main.catalog.services.finish_order import (
@@ -47,3 +48,31 @@ def test_start_to_finish_order():
     )
     assert order.state == Order.State.FAILED
     assert order_item.service_parameters_raw is None
+
+
+@pytest.mark.django_db
+def test_finish_order_with_many_items(django_assert_max_num_queries):
+    order = OrderFactory()
+    items = [
+        OrderItemFactory(order=order, service_parameters_raw={"a": "b"})
+        for _ in range(10)
+    ]
+    completed_item = items[0]
+    completed_item.mark_completed()
+    ApprovalRequestFactory(state=ApprovalRequest.State.DENIED, order=order)
+
+    with django_assert_max_num_queries(10):
+        FinishOrder(order).process(is_complete=False)
+
+    assert order.state == Order.State.FAILED
+    for item in items:
+        item.refresh_from_db()
+        assert item.service_parameters_raw is None
+    assert completed_item.state == OrderItem.State.COMPLETED
+    assert all(item.state == OrderItem.State.FAILED for item in items[1:])
+    assert (
+        ProgressMessage.objects.filter(
+            messageable_type="OrderItem", level=ProgressMessage.Level.ERROR
+        ).count()
+        == 9
+    )
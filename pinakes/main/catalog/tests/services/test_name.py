@@ -1,38 +1,87 @@
 """Test copy name service"""
+import pytest
 
+from pinakes.main.catalog.models import Portfolio
 from pinakes.main.catalog.services import name
+from pinakes.main.catalog.tests.factories import PortfolioFactory
+from pinakes.main.tests.factories import TenantFactory
 
 
+def _portfolios(*names):
+    for portfolio_name in names:
+        PortfolioFactory(name=portfolio_name)
+    return Portfolio.objects.all()
+
+
+@pytest.mark.django_db
 def test_copy_name_with_empty_names():
-    names = []
-    copied_name = name.create_copy_name("My test", names)
+    copied_name = name.create_copy_name(_portfolios(), "My test")
 
     assert copied_name == "Copy of My test"
 
 
+@pytest.mark.django_db
 def test_copy_name_with_copied_names():
-    names = [
-        "Copy of My test",
-    ]
-    copied_name = name.create_copy_name("My test", names)
+    names = _portfolios("Copy of My test")
+    copied_name = name.create_copy_name(names, "My test")
 
     assert copied_name == "Copy (1) of My test"
 
 
+@pytest.mark.django_db
 def test_copy_name_with_multiple_copied_names():
-    names = [
+    names = _portfolios(
         "My test",
         "Copy of My test",
         "Copy (1) of My test",
         "Copy (100) of My test",
-    ]
-    copied_name = name.create_copy_name("My test", names)
+        "Copy (200) of My test 2",
+        "Copy (300) of Other",
+        "Copy (x) of My test",
+    )
+    copied_name = name.create_copy_name(names, "My test")
 
     assert copied_name == "Copy (101) of My test"
 
 
+@pytest.mark.django_db
+def test_copy_name_with_special_characters():
+    names = _portfolios("Copy of a.b (c)", "Copy (4) of a.b (c)")
+
+    assert name.create_copy_name(names, "a.b (c)") == "Copy (5) of a.b (c)"
+
+
+@pytest.mark.django_db
 def test_copy_name_with_truncate_copied_names():
-    names = []
-    copied_name = name.create_copy_name("My test", names, 12)
+    copied_name = name.create_copy_name(_portfolios(), "My test", 12)
 
     assert copied_name == "Copy of My t"
+
+
+@pytest.mark.django_db
+def test_copy_name_with_truncated_copied_names():
+    original_name = "x" * 80
+    names = _portfolios(
+        f"Copy of {original_name}"[:64], f"Copy (9) of {original_name}"[:64]
+    )
+
+    assert (
+        name.create_copy_name(names, original_name)
+        == f"Copy (10) of {original_name}"[:64]
+    )
+
+
+@pytest.mark.django_db
+def test_available_name(django_assert_num_queries):
+    names = _portfolios("My test", "Copy of My test")
+    PortfolioFactory(tenant=TenantFactory(), name="Other tenant")
+    same_tenant = names.filter(tenant=names.first().tenant)
+
+    with django_assert_num_queries(1):
+        assert name.available_name(same_tenant, "Other tenant") == (
+            "Other tenant"
+        )
+    with django_assert_num_queries(3):
+        assert name.available_name(same_tenant, "My test") == (
+            "Copy (1) of My test"
+        )
@@ -0,0 +1,79 @@
+"""Test on RequestOrderApproval service"""
+import pytest
+
+from pinakes.main.approval.models import Request
+from pinakes.main.catalog.exceptions import BadParamsException
+from pinakes.main.catalog.models import ApprovalRequest, Order
+from pinakes.main.catalog.services.request_order_approval import (
+    RequestOrderApproval,
+)
+from pinakes.main.catalog.tests.factories import (
+    ApprovalRequestFactory,
+    OrderFactory,
+    OrderItemFactory,
+    PortfolioItemFactory,
+)
+from pinakes.main.inventory.tests.factories import ServiceOfferingFactory
+
+
+def _portfolio_item():
+    service_offering = ServiceOfferingFactory()
+    return PortfolioItemFactory(service_offering_ref=str(service_offering.id))
+
+
+@pytest.mark.django_db
+def test_request_order_approval(mocker):
+    """Test requesting the approval of a submitting order"""
+    mocker.patch("pinakes.common.queues.enqueue")
+    order = OrderFactory(state=Order.State.SUBMITTING)
+    OrderItemFactory(order=order, portfolio_item=_portfolio_item())
+
+    svc = RequestOrderApproval(order).process()
+
+    assert not svc.skipped
+    order.refresh_from_db()
+    assert order.state == Order.State.PENDING
+    assert ApprovalRequest.objects.filter(order=order).count() == 1
+    assert Request.objects.count() == 1
+
+    # A retry of the task does not request the approval again
+    svc = RequestOrderApproval(order).process()
+
+    assert svc.skipped
+    assert ApprovalRequest.objects.filter(order=order).count() == 1
+    assert Request.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_request_order_approval_reuses_request(mocker):
+    """Test retrying after the approval request was created"""
+    mocker.patch("pinakes.common.queues.enqueue")
+    order = OrderFactory(state=Order.State.SUBMITTING)
+    OrderItemFactory(order=order, portfolio_item=_portfolio_item())
+    mocker.patch(
+        "pinakes.main.catalog.models.ApprovalRequest.objects.create",
+        side_effect=RuntimeError("lost connection"),
+    )
+
+    with pytest.raises(BadParamsException, match="lost connection"):
+        RequestOrderApproval(order).process()
+    mocker.stopall()
+    mocker.patch("pinakes.common.queues.enqueue")
+
+    RequestOrderApproval(order).process()
+
+    request = Request.objects.get()
+    approval_request = ApprovalRequest.objects.get(order=order)
+    assert approval_request.approval_request_ref == str(request.id)
+
+
+@pytest.mark.django_db
+def test_request_order_approval_skipped():
+    """Test skipping orders which are no longer submitting"""
+    canceled_order = OrderFactory(state=Order.State.CANCELED)
+    pending_order = OrderFactory(state=Order.State.PENDING)
+    ApprovalRequestFactory(order=pending_order)
+
+    assert RequestOrderApproval(canceled_order).process().skipped
+    assert RequestOrderApproval(pending_order).process().skipped
+    assert not Request.objects.exists()
@@ -86,13 +86,17 @@ def test_place_order_item_runtime_substitution(mocker):
         service_parameters=service_params,
         inventory_service_plan_ref="1",
     )
-    ServicePlanFactory(inventory_service_plan_ref="1", base_schema={})
+    service_plan = ServicePlanFactory(
+        inventory_service_plan_ref="1", base_schema={}
+    )
 
     mocker.patch.object(
         ComputeRuntimeParameters,
         "process",
         return_value=mock.Mock(
-            substituted=True, runtime_parameters=substituted_params
+            substituted=True,
+            runtime_parameters=substituted_params,
+            service_plan=service_plan,
         ),
     )
     mocker.patch.object(
@@ -119,13 +123,17 @@ def test_place_order_item_runtime_substitution_secret(mocker):
         service_parameters=service_params,
         inventory_service_plan_ref="1",
     )
-    ServicePlanFactory(inventory_service_plan_ref="1", base_schema={})
+    service_plan = ServicePlanFactory(
+        inventory_service_plan_ref="1", base_schema={}
+    )
 
     mocker.patch.object(
         ComputeRuntimeParameters,
         "process",
         return_value=mock.Mock(
-            substituted=True, runtime_parameters=substituted_params
+            substituted=True,
+            runtime_parameters=substituted_params,
+            service_plan=service_plan,
         ),
     )
     mocker.patch.object(
@@ -0,0 +1,157 @@
+"""Test on StreamOrderEvents service"""
+import json
+
+import pytest
+from django.db import connection
+
+from pinakes.main.catalog import events
+from pinakes.main.catalog.models import Order, OrderItem, ProgressMessage
+from pinakes.main.catalog.services.stream_order_events import (
+    StreamOrderEvents,
+)
+from pinakes.main.catalog.tests.factories import (
+    OrderFactory,
+    OrderItemFactory,
+)
+
+
+def _parse(stream):
+    """Parse server-sent events into (id, event, data) tuples"""
+    parsed = []
+    for chunk in stream:
+        if chunk.startswith(":"):
+            parsed.append((None, "keepalive", None))
+            continue
+        fields = dict(
+            line.split(": ", 1) for line in chunk.strip().splitlines()
+        )
+        parsed.append(
+            (fields.get("id"), fields["event"], json.loads(fields["data"]))
+        )
+    return parsed
+
+
+def _notification(event, **data):
+    return {"type": "message", "data": json.dumps({"event": event, **data})}
+
+
+@pytest.fixture
+def pubsub(mocker):
+    connection = mocker.patch("django_rq.get_connection").return_value
+    return connection.pubsub.return_value
+
+
+@pytest.mark.django_db
+def test_stream_finished_order(pubsub):
+    order = OrderFactory(state=Order.State.COMPLETED)
+    item = OrderItemFactory(order=order, state=OrderItem.State.COMPLETED)
+    order.update_message("Info", "order message")
+    item.update_message("Info", "item message")
+
+    svc = StreamOrderEvents(order).process()
+    parsed = _parse(svc.stream)
+
+    pubsub.subscribe.assert_called_once_with(events.get_channel(order.id))
+    pubsub.get_message.assert_not_called()
+    pubsub.close.assert_called_once()
+    assert [event for _, event, _ in parsed] == [
+        "state",
+        "state",
+        "message",
+        "message",
+        "end",
+    ]
+    assert parsed[0][2] == {
+        "messageable_type": "Order",
+        "messageable_id": order.id,
+        "state": "Completed",
+    }
+    assert parsed[1][2]["messageable_id"] == item.id
+    assert parsed[2][2]["message"] == "order message"
+    assert parsed[3][2]["message"] == "item message"
+    assert int(parsed[2][0]) < int(parsed[3][0])
+
+
+@pytest.mark.django_db
+def test_stream_resume_from_cursor(pubsub):
+    order = OrderFactory(state=Order.State.FAILED)
+    order.update_message("Info", "seen message")
+    order.update_message("Info", "new message")
+    seen = ProgressMessage.objects.get(message="seen message")
+
+    svc = StreamOrderEvents(order, cursor=seen.id).process()
+    parsed = _parse(svc.stream)
+
+    messages = [data for _, event, data in parsed if event == "message"]
+    assert [message["message"] for message in messages] == ["new message"]
+
+
+@pytest.mark.django_db
+def test_stream_live_events(pubsub):
+    order = OrderFactory(state=Order.State.ORDERED)
+
+    def get_message(timeout):
+        # Simulate the worker finishing the order while streaming
+        order.update_message("Info", "order completed")
+        Order.objects.filter(id=order.id).update(state=Order.State.COMPLETED)
+        pubsub.get_message.side_effect = [
+            _notification(events.MESSAGE, id=1),
+            _notification(
+                events.STATE,
+                type="Order",
+                id=order.id,
+                state=Order.State.COMPLETED,
+            ),
+        ]
+        return None
+
+    pubsub.get_message.side_effect = get_message
+
+    svc = StreamOrderEvents(order, timeout=60).process()
+    parsed = _parse(svc.stream)
+
+    assert [event for _, event, _ in parsed] == [
+        "state",
+        "keepalive",
+        "message",
+        "state",
+        "end",
+    ]
+    assert parsed[2][2]["message"] == "order completed"
+    assert parsed[3][2]["state"] == "Completed"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_stream_releases_connections(pubsub, mocker):
+    order = OrderFactory(state=Order.State.ORDERED)
+    close = mocker.spy(connection, "close")
+
+    def get_message(timeout):
+        # The connection is given back before waiting for a change
+        close.assert_called()
+        return _notification(
+            events.STATE,
+            type="Order",
+            id=order.id,
+            state=Order.State.COMPLETED,
+        )
+
+    pubsub.get_message.side_effect = get_message
+
+    svc = StreamOrderEvents(order, timeout=60).process()
+    parsed = _parse(svc.stream)
+
+    assert parsed[-1][1] == "end"
+    pubsub.get_message.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_stream_timeout(pubsub):
+    order = OrderFactory(state=Order.State.ORDERED)
+
+    svc = StreamOrderEvents(order, timeout=0).process()
+    parsed = _parse(svc.stream)
+
+    assert [event for _, event, _ in parsed] == ["state"]
+    pubsub.get_message.assert_not_called()
+    pubsub.close.assert_called_once()
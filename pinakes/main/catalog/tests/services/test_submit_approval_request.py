@@ -38,7 +38,7 @@ def test_submit_approval_request(mocker):
         }
     ]
 
-    mocker.patch("django_rq.enqueue")
+    mocker.patch("pinakes.common.queues.enqueue")
     svc = SubmitApprovalRequest(tag_resources, order)
     svc.process()
 
@@ -67,7 +67,7 @@ def test_submit_approval_request_without_service_offering(mocker):
         }
     ]
 
-    mocker.patch("django_rq.enqueue")
+    mocker.patch("pinakes.common.queues.enqueue")
     svc = SubmitApprovalRequest(tag_resources, order)
     svc.process()
 
@@ -0,0 +1,76 @@
+"""Test compiled survey schemas"""
+import pytest
+
+from pinakes.main.catalog import survey
+from pinakes.main.catalog.tests.factories import ServicePlanFactory
+
+_SCHEMA = {
+    "schema": {
+        "fields": [
+            {"name": "user_password", "label": "User", "type": "password"},
+            {"name": "tokens", "label": "Tokens"},
+            {"name": "notes", "label": "secret notes"},
+            {"name": "name", "label": "Name", "isRequired": True},
+            {
+                "name": "host",
+                "label": "Host",
+                "isSubstitution": True,
+            },
+            {"component": "plain-text", "label": "Unnamed"},
+        ]
+    }
+}
+
+
+@pytest.mark.django_db
+def test_compile_schema():
+    service_plan = ServicePlanFactory(base_schema=_SCHEMA)
+
+    schema = survey.compile_schema(service_plan)
+
+    assert list(schema.fields) == [
+        "user_password",
+        "tokens",
+        "notes",
+        "name",
+        "host",
+    ]
+    assert schema.masked == {"user_password", "tokens", "notes"}
+    assert schema.required == {"name"}
+    assert schema.substitutions == {"host"}
+    assert schema.parameter_names == schema.fields.keys()
+
+
+@pytest.mark.django_db
+def test_compile_empty_schema():
+    service_plan = ServicePlanFactory(
+        base_schema={"schemaType": "emptySchema", **_SCHEMA}
+    )
+
+    schema = survey.compile_schema(service_plan)
+
+    assert schema.empty
+    assert not schema.parameter_names
+
+
+@pytest.mark.django_db
+def test_compile_schema_cache():
+    survey.clear_cache()
+    service_plan = ServicePlanFactory(
+        base_schema=_SCHEMA, base_sha256="abc123"
+    )
+    other_plan = ServicePlanFactory(base_schema=_SCHEMA, base_sha256="abc123")
+
+    schema = survey.compile_schema(service_plan)
+
+    assert survey.compile_schema(other_plan) is schema
+
+    service_plan.modified_schema = {
+        "schema": {"fields": [{"name": "name", "label": "Name"}]}
+    }
+    modified = survey.compile_schema(service_plan)
+
+    assert modified is not schema
+    assert list(modified.fields) == ["name"]
+    assert not modified.required
+    assert survey.compile_schema(other_plan) is schema
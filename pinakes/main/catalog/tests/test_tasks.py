@@ -1,11 +1,16 @@
 """Test catalog tasks to add/remove permissions"""
+from datetime import timedelta
 from unittest import mock
 import pytest
+from django.utils import timezone
 from django.core.exceptions import ObjectDoesNotExist
+from pinakes.main.catalog.exceptions import BadParamsException
 from pinakes.main.catalog.models import (
+    Order,
     Portfolio,
 )
 from pinakes.main.catalog.tests.factories import (
+    OrderFactory,
     PortfolioFactory,
 )
 from pinakes.main.tests.factories import (
@@ -14,7 +19,9 @@ from pinakes.main.tests.factories import (
 )
 from pinakes.main.catalog.tasks import (
     add_portfolio_permissions,
+    compact_progress_messages,
     remove_portfolio_permissions,
+    submit_orders,
 )
 
 from pinakes.main.common.tests.factories import (
@@ -89,3 +96,83 @@ def test_remove_missing_portfolio_permissions(mocker):
     mocker.patch("pinakes.main.catalog.tasks.remove_group_permissions")
     with pytest.raises(ObjectDoesNotExist):
         remove_portfolio_permissions(999999, group_ids, ["read"])
+
+
+@pytest.mark.django_db
+def test_submit_orders(mocker):
+    """Test submitting orders created in bulk"""
+    submitted_order = OrderFactory(state=Order.State.SUBMITTING)
+    skipped_order = OrderFactory(state=Order.State.CANCELED)
+    failed_order = OrderFactory(state=Order.State.SUBMITTING)
+
+    def process(svc):
+        if svc.order == failed_order:
+            raise BadParamsException("Portfolio item 1 is not valid")
+        svc.skipped = svc.order == skipped_order
+        return svc
+
+    mocker.patch(
+        "pinakes.main.catalog.tasks.RequestOrderApproval.process",
+        autospec=True,
+        side_effect=process,
+    )
+
+    result = submit_orders(
+        [submitted_order.id, skipped_order.id, failed_order.id],
+        {"http_host": "localhost"},
+    )
+
+    assert result == {
+        "submitted": [submitted_order.id],
+        "skipped": [skipped_order.id],
+        "failed": [failed_order.id],
+    }
+    failed_order.refresh_from_db()
+    assert failed_order.state == Order.State.FAILED
+
+
+@pytest.mark.django_db
+def test_submit_orders_unexpected_error(mocker):
+    """Test an order failing with an unexpected error is not left
+    submitting"""
+    failed_order = OrderFactory(state=Order.State.SUBMITTING)
+    submitted_order = OrderFactory(state=Order.State.SUBMITTING)
+
+    def process(svc):
+        if svc.order == failed_order:
+            raise ConnectionError("Connection refused")
+        return svc
+
+    mocker.patch(
+        "pinakes.main.catalog.tasks.RequestOrderApproval.process",
+        autospec=True,
+        side_effect=process,
+    )
+
+    result = submit_orders([failed_order.id, submitted_order.id])
+
+    assert result == {
+        "submitted": [submitted_order.id],
+        "skipped": [],
+        "failed": [failed_order.id],
+    }
+    failed_order.refresh_from_db()
+    assert failed_order.state == Order.State.FAILED
+    assert failed_order.completed_at is not None
+
+
+@pytest.mark.django_db
+def test_compact_progress_messages(settings, mocker):
+    """Test compacting the messages of orders finished before the TTL"""
+    settings.PINAKES_PROGRESS_MESSAGE_TTL_DAYS = 10
+    svc = mocker.patch(
+        "pinakes.main.catalog.tasks.CompactProgressMessages", autospec=True
+    )
+    svc.return_value.process.return_value.compacted_orders = 1
+    svc.return_value.process.return_value.archived_messages = 4
+
+    result = compact_progress_messages()
+
+    assert result == {"compacted_orders": 1, "archived_messages": 4}
+    expire_time = svc.call_args.args[0]
+    assert expire_time < timezone.now() - timedelta(days=9)
@@ -76,3 +76,26 @@ def test_mark_canceled():
     assert ProgressMessage.objects.first().message == "canceled"
     assert ProgressMessage.objects.first().messageable_type == "Order"
     assert ProgressMessage.objects.first().messageable_id == order.id
+
+
+@pytest.mark.django_db
+def test_mark_completed_publishes_events(
+    mocker, django_capture_on_commit_callbacks
+):
+    """Test mark_completed publishes the message and the new state"""
+    connection = mocker.patch("django_rq.get_connection").return_value
+    order = OrderFactory()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        order.mark_completed("completed")
+
+    message = ProgressMessage.objects.get()
+    channel = f"pinakes:order:{order.id}"
+    assert connection.publish.call_args_list == [
+        mocker.call(channel, f'{{"event": "message", "id": {message.id}}}'),
+        mocker.call(
+            channel,
+            '{"event": "state", "type": "Order", '
+            f'"id": {order.id}, "state": "Completed"}}',
+        ),
+    ]
@@ -2,9 +2,8 @@
 
 import logging
 
-import django_rq
 from django.utils.translation import gettext_lazy as _
-from django.utils.translation import gettext_noop
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 
 from rest_framework import viewsets
@@ -19,6 +18,7 @@ from drf_spectacular.utils import (
     extend_schema_view,
     OpenApiParameter,
     OpenApiResponse,
+    OpenApiTypes,
 )
 
 from pinakes.common.auth import keycloak_django
@@ -28,10 +28,15 @@ from pinakes.common.auth.keycloak_django.utils import (
 from pinakes.common.auth.keycloak_django.views import (
     KeycloakPermissionMixin,
 )
-from pinakes.common.serializers import TaskSerializer
+from pinakes.common import queues
+from pinakes.common.asgi import ASGIRequest
+from pinakes.common.serializers import FIELDS_PARAMETER, TaskSerializer
 from pinakes.common.tag_mixin import TagMixin
+from pinakes.common.conditional_mixin import ConditionalGetMixin
 from pinakes.common.image_mixin import ImageMixin
 from pinakes.common.queryset_mixin import QuerySetMixin
+from pinakes.common.pagination import CatalogSwitchablePagination
+from pinakes.common.renderers import EventStreamRenderer
 
 from pinakes.main.models import Tenant
 from pinakes.main.common.models import Group
@@ -50,6 +55,8 @@ from pinakes.main.catalog.models import (
 from pinakes.main.catalog import permissions
 from pinakes.main.catalog.serializers import (
     ApprovalRequestSerializer,
+    BulkOrdersInSerializer,
+    BulkOrdersOutSerializer,
     ServicePlanSerializer,
     CopyPortfolioSerializer,
     CopyPortfolioItemSerializer,
@@ -71,9 +78,7 @@ from pinakes.main.catalog.serializers import (
 from pinakes.main.catalog.services.cancel_order import (
     CancelOrder,
 )
-from pinakes.main.catalog.services.collect_tag_resources import (
-    CollectTagResources,
-)
+from pinakes.main.catalog.services.create_orders import CreateOrders
 from pinakes.main.catalog.services.copy_portfolio import (
     CopyPortfolio,
 )
@@ -86,12 +91,10 @@ from pinakes.main.catalog.services import (
 from pinakes.main.catalog.services.refresh_service_plan import (
     RefreshServicePlan,
 )
-from pinakes.main.catalog.services.submit_approval_request import (
-    SubmitApprovalRequest,
-)
-from pinakes.main.catalog.services.validate_order_item import (
-    ValidateOrderItem,
+from pinakes.main.catalog.services.stream_order_events import (
+    StreamOrderEvents,
 )
+from pinakes.main.catalog.services.submit_order import SubmitOrder
 
 from pinakes.main.catalog import tasks
 
@@ -148,6 +151,7 @@ class TenantViewSet(viewsets.ReadOnlyModelViewSet):
 class PortfolioViewSet(
     ImageMixin,
     TagMixin,
+    ConditionalGetMixin,
     NestedViewSetMixin,
     KeycloakPermissionMixin,
     QuerySetMixin,
@@ -205,11 +209,13 @@ class PortfolioViewSet(
         data = self._parse_share_policy(request, portfolio)
         group_ids = [group.id for group in data["groups"]]
 
-        job = django_rq.enqueue(
+        job = queues.enqueue(
             tasks.add_portfolio_permissions,
             portfolio.id,
             group_ids,
             data["permissions"],
+            owner=portfolio,
+            user=request.user,
         )
         serializer = TaskSerializer(job)
         return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
@@ -233,11 +239,13 @@ class PortfolioViewSet(
             return Response(status=status.HTTP_200_OK)
 
         group_ids = [group.id for group in data["groups"]]
-        job = django_rq.enqueue(
+        job = queues.enqueue(
             tasks.remove_portfolio_permissions,
             portfolio.id,
             group_ids,
             data["permissions"],
+            owner=portfolio,
+            user=request.user,
         )
         serializer = TaskSerializer(job)
         return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
@@ -325,6 +333,7 @@ class PortfolioViewSet(
 class PortfolioItemViewSet(
     ImageMixin,
     TagMixin,
+    ConditionalGetMixin,
     NestedViewSetMixin,
     KeycloakPermissionMixin,
     QuerySetMixin,
@@ -440,12 +449,9 @@ class PortfolioItemViewSet(
             else Portfolio.objects.get(id=destination_portfolio_id)
         )
 
-        portfolio_item_names = [
-            item.name
-            for item in PortfolioItem.objects.filter(portfolio=portfolio)
-        ]
         available_name = name.create_copy_name(
-            portfolio_item.name, portfolio_item_names
+            PortfolioItem.objects.filter(portfolio=portfolio),
+            portfolio_item.name,
         )
 
         output_serializer = NextNameOutSerializer(
@@ -464,6 +470,7 @@ class PortfolioItemViewSet(
                 enum=["true", "false"],
                 description="Include extra data such as order items",
             ),
+            FIELDS_PARAMETER,
         ],
     ),
     list=extend_schema(
@@ -476,6 +483,7 @@ class PortfolioItemViewSet(
                 enum=["true", "false"],
                 description="Include extra data such as order items",
             ),
+            FIELDS_PARAMETER,
         ],
     ),
     create=extend_schema(
@@ -497,6 +505,7 @@ class OrderViewSet(
     http_method_names = ["get", "post", "patch", "head", "delete"]
     permission_classes = (IsAuthenticated,)
     keycloak_permission = permissions.OrderPermission
+    pagination_class = CatalogSwitchablePagination
     ordering = ("-id",)
     filterset_fields = (
         "state",
@@ -508,45 +517,68 @@ class OrderViewSet(
     search_fields = ("state",)
 
     @extend_schema(
-        description="Submit the given order",
+        description=(
+            "Submit the given order. The order is validated and moved to the"
+            " Submitting state, its approval is requested in a background"
+            " task which reports through the order progress messages."
+            " Submitting an order which is already submitting requests its"
+            " approval again if it was not requested yet."
+        ),
         request=None,
-        responses={200: OrderSerializer},
+        responses={202: OrderSerializer},
     )
     @action(methods=["post"], detail=True)
     def submit(self, request, pk):
         """Orders the specified pk order."""
         order = self.get_object()
-        if not order.product:
-            raise BadParamsException(
-                _("Order {} does not have related order items").format(
-                    order.id
-                )
-            )
+        SubmitOrder(order, self._approval_context(request)).process()
 
-        ValidateOrderItem(order.product).process()
+        serializer = self.get_serializer(order)
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
 
-        tag_resources = CollectTagResources(order).process().tag_resources
+    @extend_schema(
+        description=(
+            "Create many orders with their order items and submit them in a"
+            " background task. Orders failing validation are not created,"
+            " the result of each order is reported at its position in the"
+            " request."
+        ),
+        request=BulkOrdersInSerializer,
+        responses={202: BulkOrdersOutSerializer},
+    )
+    @action(methods=["post"], detail=False)
+    def bulk(self, request):
+        """Creates and submits many orders at once."""
+        serializer = BulkOrdersInSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
 
-        message = gettext_noop(
-            "Computed tags for order %(order_id)d: %(tag_resources)s"
-        )
-        params = {"order_id": order.id, "tag_resources": tag_resources}
-        order.update_message(ProgressMessage.Level.INFO, message, params)
-
-        logger.info("Creating approval request for order id %d", order.id)
-        if request and request.META:
-            http_host = (
-                request.META.get("HTTP_HOST")
-                or request.META.get("REMOTE_HOST")
-                or request.META.get("HTTP_ORIGIN")
+        svc = CreateOrders(
+            serializer.validated_data["orders"],
+            request.user,
+            Tenant.current(),
+        ).process()
+
+        task_id = None
+        if svc.orders:
+            job = queues.enqueue(
+                tasks.submit_orders,
+                [order.id for order in svc.orders],
+                self._approval_context(request),
+                user=request.user,
             )
-            context = {"http_host": http_host}
-        else:
-            context = {}
-        SubmitApprovalRequest(tag_resources, order, context).process()
+            task_id = job.id
 
-        serializer = self.get_serializer(order)
-        return Response(serializer.data)
+        output_serializer = BulkOrdersOutSerializer(
+            {"task_id": task_id, "results": svc.results}
+        )
+        return Response(
+            output_serializer.data,
+            status=(
+                status.HTTP_202_ACCEPTED
+                if svc.orders
+                else status.HTTP_400_BAD_REQUEST
+            ),
+        )
 
     @extend_schema(
         description="Cancel the given order",
@@ -563,6 +595,69 @@ class OrderViewSet(
 
         return Response(serializer.data, status=status.HTTP_204_NO_CONTENT)
 
+    @extend_schema(
+        description=(
+            "Stream the state changes and progress messages of the given"
+            " order as server-sent events. Message events carry the message"
+            " id as the event id, a reconnecting client resumes after the"
+            " last received message by sending it in the Last-Event-ID"
+            " header or the cursor parameter. Streams are only served by"
+            " the ASGI application, otherwise the response is a 204 No"
+            " Content and the client keeps polling the order."
+        ),
+        parameters=[
+            OpenApiParameter(
+                "cursor",
+                int,
+                required=False,
+                description="Stream progress messages after this id",
+            ),
+        ],
+        request=None,
+        responses={
+            (200, "text/event-stream"): OpenApiTypes.STR,
+            204: None,
+        },
+    )
+    @action(
+        methods=["get"], detail=True, renderer_classes=[EventStreamRenderer]
+    )
+    def events(self, request, pk):
+        """Streams the progress of the specified pk order."""
+        order = self.get_object()
+        cursor = request.headers.get(
+            "Last-Event-ID", request.query_params.get("cursor", 0)
+        )
+        try:
+            cursor = int(cursor)
+        except ValueError:
+            raise BadParamsException(_("Invalid cursor {}").format(cursor))
+
+        if not isinstance(request._request, ASGIRequest):
+            # A WSGI worker thread would be held for the whole stream. A
+            # 204 tells an EventSource not to reconnect.
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        svc = StreamOrderEvents(order, cursor).process()
+        response = StreamingHttpResponse(
+            svc.stream, content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    @staticmethod
+    def _approval_context(request):
+        if not request.META:
+            return {}
+
+        http_host = (
+            request.META.get("HTTP_HOST")
+            or request.META.get("REMOTE_HOST")
+            or request.META.get("HTTP_ORIGIN")
+        )
+        return {"http_host": http_host}
+
 
 @extend_schema_view(
     retrieve=extend_schema(
@@ -577,6 +672,7 @@ class OrderViewSet(
                     "Include extra data such as portfolio item details"
                 ),
             ),
+            FIELDS_PARAMETER,
         ],
     ),
     list=extend_schema(
@@ -591,9 +687,12 @@ class OrderViewSet(
                 required=False,
                 enum=["true", "false"],
                 description=(
-                    "Include extra data such as portfolio item details"
+                    "Include extra data such as portfolio item details, and"
+                    " the service parameters, provider control parameters"
+                    " and artifacts, left out of the list by default"
                 ),
             ),
+            FIELDS_PARAMETER,
         ],
         responses={
             200: OpenApiResponse(
@@ -626,6 +725,7 @@ class OrderItemViewSet(
     http_method_names = ["get", "post", "head", "delete"]
     permission_classes = (IsAuthenticated,)
     keycloak_permission = permissions.OrderItemPermission
+    pagination_class = CatalogSwitchablePagination
     ordering = ("-id",)
     filterset_fields = (
         "name",
@@ -666,6 +766,7 @@ class ApprovalRequestViewSet(
     serializer_class = ApprovalRequestSerializer
     http_method_names = ["get"]
     permission_classes = (IsAuthenticated,)
+    pagination_class = CatalogSwitchablePagination
     ordering = ("-id",)
     filterset_fields = (
         "order",
@@ -701,6 +802,7 @@ class _BaseProgressMessageViewSet(
     http_method_names = ["get"]
     permission_classes = (IsAuthenticated,)
     keycloak_permission = permissions.ProgressMessagePermission
+    pagination_class = CatalogSwitchablePagination
     ordering = ("-id",)
     filterset_fields = (
         "received_at",
@@ -741,6 +843,7 @@ class OrderItemProgressMessageViewSet(_BaseProgressMessageViewSet):
                 enum=["true", "false"],
                 description="Include extra data such as base_schema",
             ),
+            FIELDS_PARAMETER,
         ],
         request=None,
         responses={200: ServicePlanSerializer},
@@ -754,12 +857,14 @@ class OrderItemProgressMessageViewSet(_BaseProgressMessageViewSet):
                 enum=["true", "false"],
                 description="Include extra data such as base_schema",
             ),
+            FIELDS_PARAMETER,
         ],
         request=None,
         responses={200: ServicePlanSerializer},
     ),
 )
 class ServicePlanViewSet(
+    ConditionalGetMixin,
     NestedViewSetMixin,
     KeycloakPermissionMixin,
     QuerySetMixin,
@@ -1,5 +1,8 @@
+from django.contrib.auth import get_user_model
 from django.db import models
 
+from pinakes.main.models import Tenant
+
 
 class Role(models.Model):
     name = models.CharField(max_length=255)
@@ -15,3 +18,101 @@ class Group(models.Model):
         "self", related_name="subgroups", on_delete=models.CASCADE, null=True
     )
     roles = models.ManyToManyField(Role)
+
+
+class Task(models.Model):
+    """Index entry of a background task"""
+
+    class Status(models.TextChoices):
+        """Statuses of a background task, same as RQ job statuses"""
+
+        QUEUED = "queued"
+        DEFERRED = "deferred"
+        SCHEDULED = "scheduled"
+        STARTED = "started"
+        FINISHED = "finished"
+        FAILED = "failed"
+        STOPPED = "stopped"
+        CANCELED = "canceled"
+
+    FINAL_STATUSES = (
+        Status.FINISHED,
+        Status.FAILED,
+        Status.STOPPED,
+        Status.CANCELED,
+    )
+
+    id = models.CharField(
+        max_length=64,
+        primary_key=True,
+        help_text="Task id that can be used to track the progress",
+    )
+    func_name = models.CharField(
+        max_length=255, help_text="Name of the task function"
+    )
+    queue = models.CharField(
+        max_length=64, help_text="Name of the queue the task is routed to"
+    )
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.QUEUED,
+        help_text="Status of the task",
+    )
+    owner_type = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="Type of the object the task works on",
+    )
+    owner_id = models.BigIntegerField(
+        null=True, help_text="ID of the object the task works on"
+    )
+    result = models.JSONField(
+        null=True, help_text="Summary of the task result"
+    )
+    error = models.TextField(
+        blank=True, default="", help_text="Error of a failed task"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True, help_text="The time at which the task was created"
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="The time at which the task was last updated",
+    )
+    started_at = models.DateTimeField(
+        null=True, help_text="The time at which the task was started"
+    )
+    ended_at = models.DateTimeField(
+        null=True, help_text="The time at which the task was ended"
+    )
+    tenant = models.ForeignKey(
+        Tenant,
+        null=True,
+        on_delete=models.CASCADE,
+        help_text="ID of the tenant the task belongs to",
+    )
+    user = models.ForeignKey(
+        get_user_model(),
+        null=True,
+        on_delete=models.CASCADE,
+        help_text="ID of the user who started the task",
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["owner_type", "owner_id"]),
+            models.Index(fields=["status", "updated_at"]),
+        ]
+
+    def __str__(self):
+        return self.id
+
+    def get_status(self):
+        """Same as RQ Job.get_status, used by TaskSerializer"""
+        return self.status
+
+    @property
+    def is_final(self):
+        return self.status in self.FINAL_STATUSES
@@ -1,15 +1,37 @@
 from rest_framework import serializers
 
+from pinakes.common.serializers import ModelSerializer, Serializer
 from pinakes.main.common import models
 
 
-class GroupSerializer(serializers.ModelSerializer):
+class GroupSerializer(ModelSerializer):
     class Meta:
         model = models.Group
         fields = ("id", "name", "parent_id")
 
 
-class AboutSerializer(serializers.Serializer):
+class BackgroundTaskSerializer(ModelSerializer):
+    """Background task with its status and result summary"""
+
+    class Meta:
+        model = models.Task
+        fields = (
+            "id",
+            "status",
+            "func_name",
+            "queue",
+            "owner_type",
+            "owner_id",
+            "result",
+            "error",
+            "created_at",
+            "started_at",
+            "ended_at",
+        )
+        read_only_fields = fields
+
+
+class AboutSerializer(Serializer):
     """Product and version info"""
 
     product_name = serializers.CharField(
@@ -1,6 +1,7 @@
+import itertools
 import logging
-from collections import deque
-from typing import Sequence, Iterable
+from datetime import timedelta
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import rq
 from django.db import transaction
@@ -8,14 +9,19 @@ from django.conf import settings
 from django.utils import timezone as django_tz
 from django.contrib.sessions.management.commands import clearsessions
 
+from pinakes.common import queues
 from pinakes.common.auth import keycloak_django
 from pinakes.common.auth.keycloak import (
     models as keycloak_models,
 )
-from pinakes.main.common.models import Role, Group
+from pinakes.main.common.models import Role, Group, Task
 
 logger = logging.getLogger("approval")
 
+GROUP_SYNC_BATCH_SIZE = 100
+
+GroupItem = Tuple[Optional[str], keycloak_models.Group]
+
 
 def add_group_permissions(
     obj: keycloak_django.AbstractKeycloakResource,
@@ -45,49 +51,24 @@ def remove_group_permissions(
         )
 
 
-def iter_groups(groups: Iterable[keycloak_models.Group]):
-    queue = deque()
-    queue.append((None, groups))
-    while queue:
-        parent, items = queue.popleft()
-        for item in items:
-            yield parent, item
-            if item.sub_groups:
-                queue.append((item.id, item.sub_groups))
-
-
+@queues.task_queue(queues.SYNC)
 def sync_external_groups():
     job = rq.get_current_job()
     sync_time = django_tz.now()
 
     client = keycloak_django.get_admin_client()
-    all_groups = client.list_groups(brief_representation=False)
+    all_groups = client.iter_groups(
+        brief_representation=False, max_prefetch=GROUP_SYNC_BATCH_SIZE
+    )
 
     added_count = 0
     updated_count = 0
 
     with transaction.atomic():
-        for parent_id, group in iter_groups(all_groups):
-            obj, created = Group.objects.update_or_create(
-                id=group.id,
-                defaults={
-                    "name": group.name,
-                    "path": group.path,
-                    "last_sync_time": sync_time,
-                    "parent_id": parent_id,
-                },
-            )
-
-            if created:
-                added_count += 1
-            else:
-                updated_count += 1
-
-            roles = []
-            if group.client_roles:
-                roles = group.client_roles.get(settings.KEYCLOAK_CLIENT_ID, [])
-
-            _manage_roles(obj, set(roles))
+        for batch in _iter_batches(all_groups, GROUP_SYNC_BATCH_SIZE):
+            added, updated = _sync_groups_batch(batch, sync_time)
+            added_count += added
+            updated_count += updated
         deleted_count, _ = Group.objects.exclude(
             last_sync_time=sync_time
         ).delete()
@@ -106,6 +87,60 @@ def clear_sessions():
     clearsessions.Command().handle()
 
 
+def prune_task_index():
+    """Delete finished tasks older than the task index TTL"""
+    expire_time = django_tz.now() - timedelta(
+        days=settings.PINAKES_TASK_INDEX_TTL_DAYS
+    )
+    deleted_count, _ = Task.objects.filter(
+        status__in=Task.FINAL_STATUSES, updated_at__lt=expire_time
+    ).delete()
+    logger.info("Deleted %d expired tasks from the task index", deleted_count)
+
+
+def _iter_batches(
+    items: Iterable[GroupItem], size: int
+) -> Iterator[List[GroupItem]]:
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            break
+        yield batch
+
+
+def _sync_groups_batch(batch: Sequence[GroupItem], sync_time):
+    objs = {
+        group.id: Group(
+            id=group.id,
+            name=group.name,
+            path=group.path,
+            last_sync_time=sync_time,
+            parent_id=parent_id,
+        )
+        for parent_id, group in batch
+    }
+    existing_ids = set(
+        Group.objects.filter(id__in=objs.keys()).values_list("id", flat=True)
+    )
+    new_objs = [obj for obj in objs.values() if obj.id not in existing_ids]
+    old_objs = [obj for obj in objs.values() if obj.id in existing_ids]
+
+    Group.objects.bulk_create(new_objs)
+    Group.objects.bulk_update(
+        old_objs, fields=["name", "path", "last_sync_time", "parent"]
+    )
+
+    synced_objs = Group.objects.prefetch_related("roles").in_bulk(objs.keys())
+    for _, group in batch:
+        roles = []
+        if group.client_roles:
+            roles = group.client_roles.get(settings.KEYCLOAK_CLIENT_ID, [])
+        _manage_roles(synced_objs[group.id], set(roles))
+
+    return len(new_objs), len(old_objs)
+
+
 def _manage_roles(obj, group_roles):
     existing_role_names = {role.name for role in obj.roles.all()}
     new_role_names = group_roles - existing_role_names
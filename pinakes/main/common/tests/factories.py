@@ -4,7 +4,8 @@ import uuid
 import factory
 from django.utils import timezone as django_tz
 
-from pinakes.main.common.models import Role, Group
+from pinakes.main.common.models import Role, Group, Task
+from pinakes.main.tests.factories import default_tenant
 
 
 class GroupFactory(factory.django.DjangoModelFactory):
@@ -26,3 +27,15 @@ class RoleFactory(factory.django.DjangoModelFactory):
         model = Role
 
     name = factory.Sequence("role-{}".format)
+
+
+class TaskFactory(factory.django.DjangoModelFactory):
+    """Task Factory"""
+
+    class Meta:
+        model = Task
+
+    id = factory.LazyFunction(lambda: str(uuid.uuid4()))
+    func_name = "pinakes.main.common.tasks.sync_external_groups"
+    queue = "sync"
+    tenant = factory.LazyFunction(default_tenant)
@@ -1,17 +1,18 @@
 import uuid
 from unittest import mock
 
-import rq.job as rq_job
-
 import pytest
 
+from pinakes.main.common.models import Task
+from pinakes.main.common.tests import factories
+
 
 @pytest.mark.django_db
 def test_group_sync_start(api_request, mocker):
     job_id = str(uuid.uuid4())
     job_mock = mock.Mock(id=job_id)
     job_mock.get_status.return_value = "queued"
-    mocker.patch("django_rq.enqueue", return_value=job_mock)
+    mocker.patch("pinakes.common.queues.enqueue", return_value=job_mock)
 
     response = api_request("post", "common:group-sync-list")
     assert response.status_code == 202
@@ -22,31 +23,19 @@ def test_group_sync_start(api_request, mocker):
 
 
 @pytest.mark.django_db
-def test_group_sync_job_status(api_request, mocker):
-    mocker.patch("django_rq.get_connection")
-
-    job_id = str(uuid.uuid4())
-    job_mock = mock.Mock(id=job_id)
-    job_mock.get_status.return_value = "finished"
-    mocker.patch.object(rq_job.Job, "fetch", return_value=job_mock)
+def test_group_sync_job_status(api_request, admin):
+    task = factories.TaskFactory(status=Task.Status.FINISHED, user=admin)
 
-    response = api_request("get", "common:task-detail", job_id)
+    response = api_request("get", "common:task-detail", task.id)
 
     assert response.status_code == 200
-    assert response.data == {
-        "id": job_id,
-        "status": "finished",
-    }
+    assert response.data["id"] == task.id
+    assert response.data["status"] == "finished"
 
 
 @pytest.mark.django_db
-def test_group_sync_missing_job_status(api_request, mocker):
-    mocker.patch("django_rq.get_connection")
-
+def test_group_sync_missing_job_status(api_request):
     job_id = str(uuid.uuid4())
-    job_mock = mock.Mock(id=job_id)
-    job_mock.get_status.return_value = "finished"
-    mocker.patch.object(rq_job.Job, "fetch", side_effect=rq_job.NoSuchJobError)
 
     response = api_request("get", "common:task-detail", job_id)
 
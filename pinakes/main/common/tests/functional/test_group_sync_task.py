@@ -48,7 +48,9 @@ def test_group_sync_task_initial(mocker):
             sub_groups=[],
         ),
     ]
-    mock_client.list_groups.return_value = keycloak_groups
+    mock_client.iter_groups.return_value = iter(
+        (None, group) for group in keycloak_groups
+    )
 
     tasks.sync_external_groups()
 
@@ -68,3 +70,43 @@ def test_group_sync_task_initial(mocker):
     assert group.path == to_update.path + "-upd"
     assert group.last_sync_time != prev_sync_time
     assert len(group.roles.all()) == 0
+
+
+@pytest.mark.django_db
+def test_group_sync_task_subgroups(mocker):
+    mocker.patch("rq.get_current_job", return_value=mock.Mock(id="123"))
+    mocker.patch.object(tasks, "GROUP_SYNC_BATCH_SIZE", 2)
+    mock_client = mock.Mock()
+    mocker.patch(
+        "pinakes.common.auth.keycloak_django.get_admin_client",
+        return_value=mock_client,
+    )
+
+    existing = factories.GroupFactory(name="parent", path="/parent")
+    mock_client.iter_groups.return_value = iter(
+        [
+            (
+                None,
+                keycloak_models.Group(
+                    id=existing.id, name="parent", path="/parent"
+                ),
+            ),
+            (
+                None,
+                keycloak_models.Group(id="g2", name="other", path="/other"),
+            ),
+            (
+                existing.id,
+                keycloak_models.Group(
+                    id="g3", name="child", path="/parent/child"
+                ),
+            ),
+        ]
+    )
+
+    tasks.sync_external_groups()
+
+    assert models.Group.objects.count() == 3
+    child = models.Group.objects.get(id="g3")
+    assert child.parent_id == existing.id
+    assert models.Group.objects.get(id="g2").parent_id is None
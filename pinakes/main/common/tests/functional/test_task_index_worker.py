@@ -0,0 +1,127 @@
+from unittest import mock
+
+import pytest
+
+from pinakes.main.common import worker
+from pinakes.main.common.models import Task
+from pinakes.main.common.tests import factories
+
+
+def _job(job_id, result=None):
+    return mock.Mock(
+        id=job_id,
+        func_name="pinakes.main.inventory.tasks.refresh_task",
+        origin="sync",
+        result=result,
+    )
+
+
+@pytest.mark.django_db
+def test_record_task_status_started():
+    task = factories.TaskFactory(owner_type="Source", owner_id=1)
+
+    worker.record_task_status(_job(task.id), Task.Status.STARTED)
+
+    task.refresh_from_db()
+    assert task.status == Task.Status.STARTED
+    assert task.owner_type == "Source"
+
+
+@pytest.mark.django_db
+def test_record_task_status_not_indexed():
+    worker.record_task_status(_job("abc"), Task.Status.STARTED)
+
+    task = Task.objects.get(id="abc")
+    assert task.queue == "sync"
+    assert task.func_name == "pinakes.main.inventory.tasks.refresh_task"
+
+
+@pytest.mark.django_db
+def test_worker_job_success(mocker):
+    mocker.patch("rq.Worker.handle_job_success")
+    task = factories.TaskFactory()
+    index_worker = worker.TaskIndexWorker.__new__(worker.TaskIndexWorker)
+
+    index_worker.handle_job_success(
+        _job(task.id, result={"count": 1}), mock.Mock(), mock.Mock()
+    )
+
+    task.refresh_from_db()
+    assert task.status == Task.Status.FINISHED
+    assert task.result == {"count": 1}
+    assert task.ended_at is not None
+
+
+@pytest.mark.django_db
+def test_worker_job_failure(mocker):
+    mocker.patch("rq.Worker.handle_job_failure")
+    task = factories.TaskFactory()
+    index_worker = worker.TaskIndexWorker.__new__(worker.TaskIndexWorker)
+
+    index_worker.handle_job_failure(
+        _job(task.id),
+        queue=mock.Mock(),
+        exc_string="Traceback:\n  ...\nValueError: bad input\n",
+    )
+
+    task.refresh_from_db()
+    assert task.status == Task.Status.FAILED
+    assert task.error == "ValueError: bad input"
+
+
+def test_summarize_result():
+    assert worker.summarize_result(None) is None
+    assert worker.summarize_result({"a": 1}) == {"a": 1}
+    assert worker.summarize_result(object()).startswith("<object")
+    assert len(worker.summarize_result("x" * 5000)) == (
+        worker.RESULT_SUMMARY_LENGTH
+    )
+
+
+@pytest.mark.django_db
+def test_worker_profiles_sampled_job(mocker, settings):
+    settings.PINAKES_PROFILING_SAMPLE_RATE = 1.0
+
+    def perform_job(job, queue):
+        Task.objects.count()
+
+    mocker.patch("rq.Worker.perform_job", side_effect=perform_job)
+    log = mocker.patch("pinakes.common.profiling.Profile.log")
+    index_worker = worker.TaskIndexWorker.__new__(worker.TaskIndexWorker)
+    index_worker._is_horse = False
+
+    index_worker.perform_job(_job("abc"), mock.Mock())
+
+    log.assert_called_once()
+    assert log.call_args.kwargs["job_id"] == "abc"
+
+
+def test_worker_closes_connections_before_fork(mocker):
+    calls = []
+    mocker.patch(
+        "pinakes.main.common.worker.connections.close_all",
+        side_effect=lambda: calls.append("close_all"),
+    )
+    mocker.patch(
+        "rq.Worker.fork_work_horse",
+        side_effect=lambda job, queue: calls.append("fork"),
+    )
+    index_worker = worker.TaskIndexWorker.__new__(worker.TaskIndexWorker)
+
+    index_worker.fork_work_horse(_job("abc"), mock.Mock())
+
+    assert calls == ["close_all", "fork"]
+
+
+@pytest.mark.parametrize("is_horse", [True, False])
+def test_worker_horse_closes_connections(mocker, is_horse):
+    mocker.patch("rq.Worker.perform_job")
+    close_all = mocker.patch(
+        "pinakes.main.common.worker.connections.close_all"
+    )
+    index_worker = worker.TaskIndexWorker.__new__(worker.TaskIndexWorker)
+    index_worker._is_horse = is_horse
+
+    index_worker.perform_job(_job("abc"), mock.Mock())
+
+    assert close_all.called == is_horse
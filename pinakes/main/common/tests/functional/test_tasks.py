@@ -0,0 +1,125 @@
+import uuid
+
+import pytest
+
+from pinakes.main.common.models import Task
+from pinakes.main.common.tests import factories
+from pinakes.main.tests.factories import TenantFactory, UserFactory
+
+
+@pytest.mark.django_db
+def test_task_retrieve(api_request, admin):
+    task = factories.TaskFactory(
+        status=Task.Status.FINISHED, result={"updated": 3}, user=admin
+    )
+
+    response = api_request("get", "common:task-detail", task.id)
+
+    assert response.status_code == 200
+    assert response.data["id"] == task.id
+    assert response.data["status"] == "finished"
+    assert response.data["result"] == {"updated": 3}
+
+
+@pytest.mark.django_db
+def test_task_retrieve_wait_for_change(api_request, admin, mocker):
+    task = factories.TaskFactory(status=Task.Status.QUEUED, user=admin)
+    sleep = mocker.patch("time.sleep")
+
+    def _start(_interval):
+        Task.objects.filter(id=task.id).update(status=Task.Status.STARTED)
+
+    sleep.side_effect = _start
+
+    response = api_request(
+        "get", "common:task-detail", task.id, data={"wait": 10}
+    )
+
+    assert response.status_code == 200
+    assert response.data["status"] == "started"
+    assert sleep.call_count == 1
+
+
+@pytest.mark.django_db
+def test_task_retrieve_wait_timeout(api_request, admin, mocker, settings):
+    settings.PINAKES_TASK_POLL_MAX_WAIT = 1
+    task = factories.TaskFactory(status=Task.Status.STARTED, user=admin)
+    mocker.patch("time.sleep")
+    mocker.patch("time.monotonic", side_effect=[0, 0.5, 2])
+
+    response = api_request(
+        "get", "common:task-detail", task.id, data={"wait": 30}
+    )
+
+    assert response.status_code == 200
+    assert response.data["status"] == "started"
+
+
+@pytest.mark.django_db
+def test_task_retrieve_not_indexed(api_request):
+    response = api_request("get", "common:task-detail", str(uuid.uuid4()))
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_task_retrieve_of_other_user(api_request):
+    task = factories.TaskFactory(user=UserFactory())
+
+    response = api_request("get", "common:task-detail", task.id)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_task_list_of_user(api_request, admin):
+    task = factories.TaskFactory(user=admin)
+    factories.TaskFactory(user=UserFactory())
+    factories.TaskFactory(user=admin, tenant=TenantFactory())
+    factories.TaskFactory()
+
+    response = api_request("get", "common:task-list")
+
+    assert response.status_code == 200
+    assert response.data["count"] == 1
+    assert response.data["results"][0]["id"] == task.id
+
+
+@pytest.mark.django_db
+def test_task_list_unauthenticated(api_request):
+    factories.TaskFactory()
+
+    response = api_request("get", "common:task-list", authenticated=False)
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_task_list_by_ids(api_request, admin):
+    task1, task2, _ = factories.TaskFactory.create_batch(3, user=admin)
+
+    response = api_request(
+        "get", "common:task-list", data={"id": [task1.id, task2.id]}
+    )
+
+    assert response.status_code == 200
+    assert response.data["count"] == 2
+    ids = {item["id"] for item in response.data["results"]}
+    assert ids == {task1.id, task2.id}
+
+
+@pytest.mark.django_db
+def test_task_list_by_owner(api_request, admin):
+    task = factories.TaskFactory(owner_type="Source", owner_id=1, user=admin)
+    factories.TaskFactory(owner_type="Source", owner_id=2, user=admin)
+    factories.TaskFactory(owner_type="Portfolio", owner_id=1, user=admin)
+
+    response = api_request(
+        "get",
+        "common:task-list",
+        data={"owner_type": "Source", "owner_id": 1},
+    )
+
+    assert response.status_code == 200
+    assert response.data["count"] == 1
+    assert response.data["results"][0]["id"] == task.id
@@ -1,6 +1,8 @@
-import django_rq
+import time
+
 import yaml
 import importlib.resources
+from django.conf import settings
 from django.http import Http404
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.types import OpenApiTypes
@@ -14,18 +16,22 @@ from rest_framework import viewsets, status
 from rest_framework.filters import (
     BaseFilterBackend,
     OrderingFilter,
-    SearchFilter,
 )
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rq import job as rq_job
 
+from pinakes.common import queues
+from pinakes.common.queryset_mixin import QuerySetMixin
+from pinakes.common.search import TrigramSearchFilter
 from pinakes.common.serializers import TaskSerializer
 from pinakes.main.common import models
 from pinakes.main.common import serializers
 from pinakes.main.common import tasks
 
+TASK_POLL_INTERVAL = 0.5
+
 
 class GroupFilterBackend(BaseFilterBackend):
     """
@@ -67,7 +73,7 @@ class GroupViewSet(viewsets.ReadOnlyModelViewSet):
         GroupFilterBackend,
         DjangoFilterBackend,
         OrderingFilter,
-        SearchFilter,
+        TrigramSearchFilter,
     )
     ordering = ("name",)
     filterset_fields = ("name",)
@@ -83,15 +89,31 @@ class GroupViewSet(viewsets.ReadOnlyModelViewSet):
 )
 class GroupSyncViewSet(viewsets.ViewSet):
     def create(self, request: Request):
-        job = django_rq.enqueue(tasks.sync_external_groups)
+        job = queues.enqueue(tasks.sync_external_groups, user=request.user)
         serializer = TaskSerializer(job)
         return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
 
 
+class TaskFilterBackend(BaseFilterBackend):
+    """
+    Filter that selects tasks by multiple ids.
+    """
+
+    def filter_queryset(self, request, queryset, _view):
+        ids = request.GET.getlist("id")
+        if ids:
+            return queryset.filter(id__in=ids)
+        return queryset
+
+
 @extend_schema_view(
     retrieve=extend_schema(
-        description="Get the status of a background task",
-        responses={status.HTTP_200_OK: TaskSerializer},
+        description=(
+            "Get the status of a background task. With the wait parameter"
+            " the request is held until the task status changes or the"
+            " wait time expires."
+        ),
+        responses={status.HTTP_200_OK: serializers.BackgroundTaskSerializer},
         parameters=[
             OpenApiParameter(
                 "id",
@@ -100,16 +122,81 @@ class GroupSyncViewSet(viewsets.ViewSet):
                 location=OpenApiParameter.PATH,
                 description="background task UUID",
             ),
+            OpenApiParameter(
+                "wait",
+                required=False,
+                type=OpenApiTypes.INT,
+                description=(
+                    "Seconds to wait for a status change, capped by the"
+                    " server"
+                ),
+            ),
+        ],
+    ),
+    list=extend_schema(
+        description="List background tasks",
+        parameters=[
+            OpenApiParameter(
+                "id",
+                type={"type": "array", "items": {"type": "string"}},
+                description="Any background task ids to look up",
+                examples=[
+                    OpenApiExample(
+                        "Query by multiple ids",
+                        value="id=<uuid1>&id=<uuid2>",
+                    )
+                ],
+            ),
         ],
     ),
 )
-class TaskViewSet(viewsets.ViewSet):
+class TaskViewSet(QuerySetMixin, viewsets.ReadOnlyModelViewSet):
+    """Background tasks started by the user"""
+
+    serializer_class = serializers.BackgroundTaskSerializer
+    permission_classes = (IsAuthenticated,)
+    filter_backends = (
+        TaskFilterBackend,
+        DjangoFilterBackend,
+        OrderingFilter,
+    )
+    ordering = ("-created_at",)
+    filterset_fields = ("status", "owner_type", "owner_id", "func_name")
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if getattr(self, "swagger_fake_view", False):
+            return queryset
+        return queryset.filter(user=self.request.user)
+
     def retrieve(self, request: Request, pk: str):
-        try:
-            job = rq_job.Job.fetch(pk, connection=django_rq.get_connection())
-        except rq_job.NoSuchJobError:
+        task = self._wait_for_task(pk, self._get_wait_time(request))
+        if task is None:
             raise Http404
-        return Response(TaskSerializer(job).data, status=status.HTTP_200_OK)
+        return Response(
+            self.get_serializer(task).data, status=status.HTTP_200_OK
+        )
+
+    def _get_wait_time(self, request: Request) -> float:
+        try:
+            wait = float(request.query_params.get("wait", 0))
+        except ValueError:
+            wait = 0
+        return min(max(wait, 0), settings.PINAKES_TASK_POLL_MAX_WAIT)
+
+    def _wait_for_task(self, pk: str, wait: float):
+        queryset = self.get_queryset().filter(pk=pk)
+        task = queryset.first()
+        if task is None or task.is_final:
+            return task
+
+        deadline = time.monotonic() + wait
+        while time.monotonic() < deadline:
+            time.sleep(TASK_POLL_INTERVAL)
+            current = queryset.first()
+            if current is None or current.status != task.status:
+                return current
+        return task
 
 
 @extend_schema_view(
@@ -0,0 +1,100 @@
+"""RQ worker that keeps the background task index up to date"""
+import json
+import logging
+
+from django.db import DatabaseError, connections
+from django.utils import timezone as django_tz
+from rq import Worker
+
+from pinakes.common import profiling
+from pinakes.main.common.models import Task
+
+logger = logging.getLogger("pinakes")
+
+RESULT_SUMMARY_LENGTH = 1024
+ERROR_LENGTH = 1024
+
+
+def summarize_result(result):
+    """Return a compact JSON serializable summary of a task result"""
+    try:
+        encoded = json.dumps(result)
+    except (TypeError, ValueError):
+        encoded = None
+
+    if encoded is not None and len(encoded) <= RESULT_SUMMARY_LENGTH:
+        return result
+    return repr(result)[:RESULT_SUMMARY_LENGTH]
+
+
+def record_task_status(job, status, **fields):
+    """Create or update the index entry of a RQ job"""
+    try:
+        Task.objects.update_or_create(
+            id=job.id,
+            defaults={
+                "func_name": job.func_name,
+                "queue": job.origin,
+                "status": status,
+                **fields,
+            },
+        )
+    except DatabaseError:
+        logger.exception("Failed to update the index of task %s", job.id)
+
+
+class TaskIndexWorker(Worker):
+    """Worker recording the status of every job it performs.
+
+    The database connections of the worker are closed before forking a
+    work horse, so the horse never shares them with its parent, and the
+    horse closes its own connections when the job is done.
+    """
+
+    def fork_work_horse(self, job, queue):
+        connections.close_all()
+        super().fork_work_horse(job, queue)
+
+    def perform_job(self, job, queue):
+        try:
+            return self._perform_job(job, queue)
+        finally:
+            if self.is_horse:
+                connections.close_all()
+
+    def _perform_job(self, job, queue):
+        if not profiling.is_sampled():
+            return super().perform_job(job, queue)
+
+        with profiling.profile() as job_profile:
+            result = super().perform_job(job, queue)
+        job_profile.log(
+            job_id=job.id, func_name=job.func_name, queue=queue.name
+        )
+        return result
+
+    def prepare_job_execution(self, job, *args, **kwargs):
+        super().prepare_job_execution(job, *args, **kwargs)
+        record_task_status(
+            job, Task.Status.STARTED, started_at=django_tz.now()
+        )
+
+    def handle_job_success(self, job, *args, **kwargs):
+        super().handle_job_success(job, *args, **kwargs)
+        record_task_status(
+            job,
+            Task.Status.FINISHED,
+            ended_at=django_tz.now(),
+            result=summarize_result(job.result),
+        )
+
+    def handle_job_failure(self, job, *args, **kwargs):
+        super().handle_job_failure(job, *args, **kwargs)
+        exc_string = kwargs.get("exc_string") or ""
+        lines = exc_string.strip().splitlines()
+        record_task_status(
+            job,
+            Task.Status.FAILED,
+            ended_at=django_tz.now(),
+            error=lines[-1][:ERROR_LENGTH] if lines else "",
+        )
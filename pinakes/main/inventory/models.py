@@ -12,7 +12,8 @@ from django.db import models
 from taggit.managers import TaggableManager
 
 from django.db.models.functions import Length
-from pinakes.main.models import SourceOwnedModel
+from pinakes.common.models.indexes import trigram_index
+from pinakes.main.models import SourceOwnedModel, TaggedObject
 
 models.CharField.register_lookup(Length)
 
@@ -26,6 +27,31 @@ class TowerModel(SourceOwnedModel):
 
     class Meta:
         abstract = True
+        constraints = [
+            models.UniqueConstraint(
+                name="%(app_label)s_%(class)s_source_ref_unique",
+                fields=["source_ref", "source"],
+            )
+        ]
+
+
+class TaggedServiceInventory(TaggedObject):
+    """Tag of a service inventory"""
+
+    content_object = models.ForeignKey(
+        "ServiceInventory",
+        on_delete=models.CASCADE,
+        db_index=False,
+        help_text="ID of the tagged service inventory",
+    )
+
+    class Meta(TaggedObject.Meta):
+        indexes = [
+            models.Index(
+                name="main_taggedserviceinv_tag",
+                fields=["tag", "content_object"],
+            )
+        ]
 
 
 class ServiceInventory(TowerModel):
@@ -35,7 +61,7 @@ class ServiceInventory(TowerModel):
     description = models.TextField(blank=True, default="")
     extra = models.JSONField()
 
-    tags = TaggableManager()
+    tags = TaggableManager(through=TaggedServiceInventory)
 
     def __str__(self):
         return self.name
@@ -64,6 +90,12 @@ class ServiceOffering(TowerModel):
     )
     extra = models.JSONField()
 
+    class Meta(TowerModel.Meta):
+        indexes = [
+            trigram_index("name", "main_serviceoffering_name_trgm"),
+            trigram_index("description", "main_serviceoffering_desc_trgm"),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -122,5 +154,8 @@ class ServiceInstance(TowerModel):
         ServiceInventory, on_delete=models.SET_NULL, blank=True, null=True
     )
 
+    class Meta:
+        indexes = [models.Index(fields=["source_ref", "source"])]
+
     def __str__(self):
         return self.name
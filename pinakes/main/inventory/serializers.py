@@ -1,9 +1,16 @@
 """Serializers for Inventory Model."""
 from django.utils.translation import gettext_lazy as _
-from django.utils.translation import gettext_noop
+from django.utils.translation import get_language, gettext_noop
 from rest_framework import serializers
 
+from pinakes.common import translation
+from pinakes.common.serializers import (
+    DynamicFieldsMixin,
+    ModelSerializer,
+)
+
 from pinakes.main.models import Source
+from pinakes.main.inventory.utils import refresh_summary
 from pinakes.main.inventory.models import (
     InventoryServicePlan,
     ServiceInstance,
@@ -13,7 +20,7 @@ from pinakes.main.inventory.models import (
 )
 
 
-class SourceSerializer(serializers.ModelSerializer):
+class SourceSerializer(DynamicFieldsMixin, ModelSerializer):
     """Serializer for Source"""
 
     refresh_state = serializers.SerializerMethodField()
@@ -40,6 +47,7 @@ class SourceSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         )
+        deferred_fields = {"last_refresh_stats": ("last_refresh_message",)}
         read_only_fields = ("created_at", "updated_at")
 
     def get_refresh_state(self, obj):
@@ -47,61 +55,20 @@ class SourceSerializer(serializers.ModelSerializer):
 
     def get_last_refresh_message(self, obj):
         if obj.availability_status == "unavailable":
-            return _("%(name)s is unavailable, refresh skipped") % {
-                "name": obj.name
-            }
+            return translation.render(
+                gettext_noop("%(name)s is unavailable, refresh skipped"),
+                {"name": obj.name},
+            )
 
         if obj.refresh_state == Source.State.FAILED:
-            return _("Refresh failed: %(error)s") % {
-                "error": obj.last_refresh_message
-            }
-
-        gettext_noop("adds")
-        gettext_noop("deletes")
-        gettext_noop("updates")
-        sii_stats = obj.last_refresh_stats.get("service_inventory", {})
-        soi_stats = obj.last_refresh_stats.get("service_offering", {})
-        son_stats = obj.last_refresh_stats.get("service_offering_node", {})
-        sp_stats = obj.last_refresh_stats.get("service_plan", {})
-
-        filtered_sii_stats = {
-            _(key): value for key, value in sii_stats.items() if value > 0
-        }
-        filtered_soi_stats = {
-            _(key): value for key, value in soi_stats.items() if value > 0
-        }
-        filtered_son_stats = {
-            _(key): value for key, value in son_stats.items() if value > 0
-        }
-
-        filtered_sp_stats = {
-            _(key): value for key, value in sp_stats.items() if value > 0
-        }
-        obj.last_refresh_message = ""
-        if bool(filtered_sii_stats):
-            obj.last_refresh_message = _(
-                "Service Inventories: %(stats)s;\n"
-            ) % {"stats": filtered_sii_stats}
-
-        if bool(filtered_soi_stats):
-            obj.last_refresh_message += _(
-                "Job Templates & Workflows: %(soi_stats)s;\n"
-            ) % {"soi_stats": filtered_soi_stats}
-
-        if bool(filtered_son_stats):
-            obj.last_refresh_message += _(
-                "Workflow Template Nodes: %(son_stats)s;\n"
-            ) % {"son_stats": filtered_son_stats}
-
-        if bool(filtered_sp_stats):
-            obj.last_refresh_message += _("Service Plan: %(sp_stats)s;\n") % {
-                "sp_stats": filtered_sp_stats
-            }
-
-        if not obj.last_refresh_message:
-            obj.last_refresh_message = _("Nothing to update")
+            return translation.render(
+                gettext_noop("Refresh failed: %(error)s"),
+                {"error": obj.last_refresh_message},
+            )
 
-        return _(obj.last_refresh_message)
+        return obj.last_refresh_messages.get(
+            get_language()
+        ) or refresh_summary(obj.last_refresh_stats)
 
     def get_availability_status(self, obj):
         return _(obj.availability_status)
@@ -131,7 +98,7 @@ url %(url)s with uuid %(install_uuid)s"
         return _("Error: %(error)s") % {"error": obj.availability_message}
 
 
-class ServiceInventorySerializer(serializers.ModelSerializer):
+class ServiceInventorySerializer(ModelSerializer):
     """Serializer for ServiceInventory."""
 
     class Meta:
@@ -147,7 +114,7 @@ class ServiceInventorySerializer(serializers.ModelSerializer):
         read_only_fields = ("created_at", "updated_at")
 
 
-class ServiceOfferingSerializer(serializers.ModelSerializer):
+class ServiceOfferingSerializer(ModelSerializer):
     """Serializer for ServiceOffering."""
 
     class Meta:
@@ -164,7 +131,15 @@ class ServiceOfferingSerializer(serializers.ModelSerializer):
         read_only_fields = ("created_at", "updated_at")
 
 
-class ServiceOfferingNodeSerializer(serializers.ModelSerializer):
+class ServiceOfferingTypeaheadSerializer(ModelSerializer):
+    """Service offering name suggested while typing"""
+
+    class Meta:
+        model = ServiceOffering
+        fields = ("id", "name")
+
+
+class ServiceOfferingNodeSerializer(ModelSerializer):
     """Serializer for ServiceOfferingNode."""
 
     class Meta:
@@ -178,7 +153,7 @@ class ServiceOfferingNodeSerializer(serializers.ModelSerializer):
         read_only_fields = ("created_at", "updated_at")
 
 
-class InventoryServicePlanSerializer(serializers.ModelSerializer):
+class InventoryServicePlanSerializer(DynamicFieldsMixin, ModelSerializer):
     """Serializer for InventoryServicePlan."""
 
     class Meta:
@@ -191,10 +166,16 @@ class InventoryServicePlanSerializer(serializers.ModelSerializer):
             "schema_sha256",
             "service_offering",
         )
+        heavy_fields = ("create_json_schema", "update_json_schema")
+        deferred_fields = {
+            "extra": (),
+            "create_json_schema": ("create_json_schema",),
+            "update_json_schema": ("update_json_schema",),
+        }
         read_only_fields = ("created_at", "updated_at")
 
 
-class ServiceInstanceSerializer(serializers.ModelSerializer):
+class ServiceInstanceSerializer(DynamicFieldsMixin, ModelSerializer):
     """Serializer for ServiceInstance."""
 
     class Meta:
@@ -207,3 +188,5 @@ class ServiceInstanceSerializer(serializers.ModelSerializer):
             "service_offering",
             "service_plan",
         )
+        heavy_fields = ("extra",)
+        deferred_fields = {"extra": ("extra",)}
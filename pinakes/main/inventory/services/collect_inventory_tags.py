@@ -64,5 +64,4 @@ class CollectInventoryTags:
 
         inventory_ids.add(obj.id)
 
-        for tag in obj.tags.all():
-            self.inventory_tags.append(tag.name)
+        self.inventory_tags.extend(obj.tags.values_list("name", flat=True))
@@ -1,5 +1,5 @@
 """Module to start a Tower Job using Django_rq"""
-import django_rq
+from pinakes.common import queues
 from pinakes.main.inventory.models import (
     ServiceOffering,
     OfferingKind,
@@ -31,7 +31,7 @@ class StartTowerJob:
                 f"{self.service_offering.source_ref}/launch/"
             )
 
-        self.job = django_rq.enqueue(launch_tower_task, slug, self.params)
+        self.job = queues.enqueue(launch_tower_task, slug, self.params)
         return self
 
     def job_id(self):
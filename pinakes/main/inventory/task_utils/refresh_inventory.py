@@ -5,6 +5,7 @@ from django.db import transaction
 from django.utils import timezone
 
 from pinakes.main.models import Source
+from pinakes.main.inventory.utils import refresh_summaries
 from pinakes.main.inventory.task_utils.service_inventory_import import (
     ServiceInventoryImport,
 )
@@ -86,9 +87,13 @@ class RefreshInventory:
 
             self.source.last_successful_refresh_at = timezone.now()
             self.source.refresh_state = Source.State.DONE
+            self.source.last_refresh_messages = refresh_summaries(
+                self.source.last_refresh_stats
+            )
         except Exception as error:
             self.source.refresh_state = Source.State.FAILED
             self.source.last_refresh_message = str(error)
+            self.source.last_refresh_messages = {}
             logger.error("Refresh failed: %s", str(error))
             logger.error(traceback.format_exc())
         finally:
@@ -8,6 +8,8 @@ from distutils.util import strtobool
 from django.conf import settings
 import requests
 
+from pinakes.common import profiling
+
 requests.packages.urllib3.disable_warnings()
 
 
@@ -44,11 +46,12 @@ class TowerAPI:
         next_url = obj_url
         try:
             while next_url:
-                response = requests.get(
-                    f"{self.url}{next_url}",
-                    headers=self.headers,
-                    verify=self.verify_ssl,
-                )
+                with profiling.measure(profiling.CONTROLLER):
+                    response = requests.get(
+                        f"{self.url}{next_url}",
+                        headers=self.headers,
+                        verify=self.verify_ssl,
+                    )
                 if response.status_code in self.VALID_GET_CODES:
                     data = response.json()
                     next_url = data.get("next", None)
@@ -71,12 +74,13 @@ class TowerAPI:
         sent up as json
         """
         try:
-            response = requests.post(
-                f"{self.url}{slug}",
-                headers=self.headers,
-                verify=self.verify_ssl,
-                json=payload,
-            )
+            with profiling.measure(profiling.CONTROLLER):
+                response = requests.post(
+                    f"{self.url}{slug}",
+                    headers=self.headers,
+                    verify=self.verify_ssl,
+                    json=payload,
+                )
             if response.status_code in self.VALID_POST_CODES:
                 data = response.json()
                 return self._filtered(data, attrs)
@@ -2,6 +2,7 @@
 import logging
 from rq import get_current_job
 
+from pinakes.common import queues
 from pinakes.main.inventory.task_utils.check_source_availability import (
     CheckSourceAvailability,
 )
@@ -22,6 +23,7 @@ from pinakes.main.models import Source
 logger = logging.getLogger("inventory")
 
 
+@queues.task_queue(queues.SYNC)
 def refresh_all_sources():
     """Task to refresh all sources, used by cron jobs"""
     for source in Source.objects.all():
@@ -29,6 +31,7 @@ def refresh_all_sources():
         refresh_task(source.tenant_id, source.id)
 
 
+@queues.task_queue(queues.SYNC)
 def refresh_task(tenant_id, source_id):
     """Run the Refresh task"""
     logger.info("First checking its availability")
@@ -52,6 +55,7 @@ def refresh_task(tenant_id, source_id):
         )
 
 
+@queues.task_queue(queues.PROVISIONING)
 def launch_tower_task(slug, body):
     """Launch a job on the tower"""
     job = get_current_job()
@@ -106,3 +106,59 @@ def test_service_offering_service_plan_list(api_request):
     content = json.loads(response.content)
 
     assert content["count"] == 2
+
+
+@pytest.mark.django_db
+def test_service_offering_search(api_request):
+    """Test to search ServiceOfferings, best matches first on PostgreSQL"""
+    ServiceOfferingFactory(name="Deploy database", description="")
+    ServiceOfferingFactory(name="Backup", description="Backup the database")
+    ServiceOfferingFactory(name="Restart web server", description="")
+
+    response = api_request(
+        "get", "inventory:serviceoffering-list", data={"search": "database"}
+    )
+
+    names = [item["name"] for item in json.loads(response.content)["results"]]
+    assert sorted(names) == ["Backup", "Deploy database"]
+
+
+@pytest.mark.django_db
+def test_service_offering_typeahead(api_request):
+    """Test to complete the names of ServiceOfferings"""
+    ServiceOfferingFactory(name="deploy web")
+    ServiceOfferingFactory(name="Deploy database")
+    ServiceOfferingFactory(name="Redeploy")
+
+    response = api_request(
+        "get", "inventory:serviceoffering-typeahead", data={"prefix": "dep"}
+    )
+
+    assert response.status_code == 200
+    content = json.loads(response.content)
+    assert [item["name"] for item in content] == [
+        "Deploy database",
+        "deploy web",
+    ]
+    assert set(content[0]) == {"id", "name"}
+
+    response = api_request(
+        "get",
+        "inventory:serviceoffering-typeahead",
+        data={"prefix": "dep", "limit": 1},
+    )
+
+    assert len(json.loads(response.content)) == 1
+
+
+@pytest.mark.parametrize(
+    "params", [{}, {"prefix": " "}, {"prefix": "dep", "limit": "x"}]
+)
+@pytest.mark.django_db
+def test_service_offering_typeahead_bad_params(api_request, params):
+    """Test the typeahead parameters are validated"""
+    response = api_request(
+        "get", "inventory:serviceoffering-typeahead", data=params
+    )
+
+    assert response.status_code == 400
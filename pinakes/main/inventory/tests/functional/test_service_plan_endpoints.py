@@ -19,6 +19,26 @@ def test_service_plan_list(api_request):
     assert content["count"] == 1
 
 
+@pytest.mark.django_db
+def test_service_plan_list_schemas(api_request):
+    """Test the JSON schemas are listed only with extra=true"""
+
+    InventoryServicePlanFactory()
+    response = api_request("get", "inventory:inventoryserviceplan-list")
+
+    result = json.loads(response.content)["results"][0]
+    assert "create_json_schema" not in result
+    assert "update_json_schema" not in result
+
+    response = api_request(
+        "get", "inventory:inventoryserviceplan-list", data={"extra": "true"}
+    )
+
+    result = json.loads(response.content)["results"][0]
+    assert "create_json_schema" in result
+    assert "update_json_schema" in result
+
+
 @pytest.mark.django_db
 def test_service_plan_retrieve(api_request):
     """Test to retrieve ServicePlan endpoint"""
@@ -31,6 +51,25 @@ def test_service_plan_retrieve(api_request):
     assert response.status_code == 200
     content = json.loads(response.content)
     assert content["id"] == service_plan.id
+    assert content["create_json_schema"] == service_plan.create_json_schema
+
+
+@pytest.mark.django_db
+def test_service_plan_retrieve_fields(api_request):
+    """Test to retrieve the selected fields of a ServicePlan"""
+
+    service_plan = InventoryServicePlanFactory()
+    response = api_request(
+        "get",
+        "inventory:inventoryserviceplan-detail",
+        service_plan.id,
+        data={"fields": "id, name"},
+    )
+
+    assert json.loads(response.content) == {
+        "id": service_plan.id,
+        "name": service_plan.name,
+    }
 
 
 @pytest.mark.django_db
@@ -2,6 +2,7 @@
 from unittest.mock import Mock
 import json
 import pytest
+from django.utils import translation
 from pinakes.main.inventory.tests.factories import (
     InventoryServicePlanFactory,
     SourceFactory,
@@ -65,6 +66,30 @@ def test_source_nothing_to_update(api_request):
     assert content["last_refresh_message"] == "Nothing to update"
 
 
+@pytest.mark.django_db
+def test_source_stored_refresh_message(api_request):
+    """Test to retrieve the refresh message rendered by the refresh"""
+    source = SourceFactory(
+        availability_status="available",
+        last_refresh_stats={"service_plan": {"adds": 2}},
+        last_refresh_messages={"en": "Stored summary"},
+    )
+    with translation.override("en"):
+        response = api_request("get", "inventory:source-detail", source.id)
+
+    assert response.status_code == 200
+    content = json.loads(response.content)
+    assert content["last_refresh_message"] == "Stored summary"
+
+    source.last_refresh_messages = {}
+    source.save()
+    with translation.override("en"):
+        response = api_request("get", "inventory:source-detail", source.id)
+
+    content = json.loads(response.content)
+    assert content["last_refresh_message"] == ("Service Plan: {'adds': 2};\n")
+
+
 @pytest.mark.django_db
 def test_source_failed_state(api_request):
     """Test to retrieve Source endpoint in a failed state"""
@@ -108,7 +133,7 @@ def test_source_refresh(mocker, api_request):
     job_id = "uuid1"
     job_mock = Mock(id=job_id)
     job_mock.get_status.return_value = "queued"
-    mocker.patch("django_rq.enqueue", return_value=job_mock)
+    mocker.patch("pinakes.common.queues.enqueue", return_value=job_mock)
 
     source = SourceFactory()
     response = api_request("patch", "inventory:source-refresh", source.id)
@@ -11,7 +11,7 @@ from pinakes.main.inventory.services.start_tower_job import (
 
 
 @patch(
-    "pinakes.main.inventory.services.start_tower_job.django_rq.enqueue",
+    "pinakes.common.queues.enqueue",
     autoSpec=True,
 )
 @pytest.mark.django_db
@@ -36,7 +36,7 @@ def test_starting_a_workflow(mock):
 
 
 @patch(
-    "pinakes.main.inventory.services.start_tower_job.django_rq.enqueue",
+    "pinakes.common.queues.enqueue",
     autoSpec=True,
 )
 @pytest.mark.django_db
@@ -49,6 +49,10 @@ class TestRefreshInventory:
         assert source_instance.last_successful_refresh_at is not None
         assert source_instance.last_refresh_message is not None
         assert source_instance.refresh_state == source_instance.State.DONE
+        assert (
+            source_instance.last_refresh_messages["en"] == "Nothing to update"
+        )
+        assert "fr" in source_instance.last_refresh_messages
 
     @patch(
         "pinakes.main.inventory.task_utils.refresh_inventory."
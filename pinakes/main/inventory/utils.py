@@ -0,0 +1,57 @@
+"""Render the summary of a source refresh"""
+from django.utils import translation
+from django.utils.translation import gettext_noop
+
+from pinakes.common.translation import language_codes, render
+
+gettext_noop("adds")
+gettext_noop("deletes")
+gettext_noop("updates")
+
+# Stats of each object type with the message and parameter reporting them
+REFRESH_SUMMARY_SECTIONS = (
+    (
+        "service_inventory",
+        gettext_noop("Service Inventories: %(stats)s;\n"),
+        "stats",
+    ),
+    (
+        "service_offering",
+        gettext_noop("Job Templates & Workflows: %(soi_stats)s;\n"),
+        "soi_stats",
+    ),
+    (
+        "service_offering_node",
+        gettext_noop("Workflow Template Nodes: %(son_stats)s;\n"),
+        "son_stats",
+    ),
+    (
+        "service_plan",
+        gettext_noop("Service Plan: %(sp_stats)s;\n"),
+        "sp_stats",
+    ),
+)
+
+
+def refresh_summary(stats: dict) -> str:
+    """Summarize the refresh stats of a source in the active language"""
+    summary = ""
+    for object_type, message, param in REFRESH_SUMMARY_SECTIONS:
+        filtered_stats = {
+            render(key): value
+            for key, value in stats.get(object_type, {}).items()
+            if value > 0
+        }
+        if filtered_stats:
+            summary += render(message, {param: filtered_stats})
+
+    return summary or render(gettext_noop("Nothing to update"))
+
+
+def refresh_summaries(stats: dict) -> dict:
+    """Summarize the refresh stats of a source in every language"""
+    summaries = {}
+    for code in language_codes():
+        with translation.override(code):
+            summaries[code] = refresh_summary(stats)
+    return summaries
@@ -6,15 +6,18 @@ from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.decorators import action
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 
 from rest_framework_extensions.mixins import NestedViewSetMixin
 import rq.job as rq_job
 import django_rq
 
+from pinakes.common import queues
 from pinakes.common.tag_mixin import TagMixin
+from pinakes.common.conditional_mixin import ConditionalGetMixin
 from pinakes.common.queryset_mixin import QuerySetMixin
-from pinakes.common.serializers import TaskSerializer
+from pinakes.common.serializers import FIELDS_PARAMETER, TaskSerializer
 from pinakes.main.models import Source
 from pinakes.main.inventory.exceptions import (
     RefreshAlreadyRegisteredException,
@@ -24,30 +27,40 @@ from pinakes.main.inventory.serializers import (
     ServiceInstanceSerializer,
     ServiceInventorySerializer,
     ServiceOfferingSerializer,
+    ServiceOfferingTypeaheadSerializer,
     SourceSerializer,
 )
 from pinakes.main.inventory.tasks import refresh_task
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
+    OpenApiParameter,
 )
 
 # Create your views here.
 logger = logging.getLogger("inventory")
 
+TYPEAHEAD_LIMIT = 10
+MAX_TYPEAHEAD_LIMIT = 100
+
 
 @extend_schema_view(
     retrieve=extend_schema(
         description="Get an existing source",
+        parameters=[FIELDS_PARAMETER],
     ),
     list=extend_schema(
         description="List all sources",
+        parameters=[FIELDS_PARAMETER],
     ),
     partial_update=extend_schema(
         description="Edit an existing source",
     ),
 )
-class SourceViewSet(NestedViewSetMixin, QuerySetMixin, ModelViewSet):
+class SourceViewSet(
+    ConditionalGetMixin, NestedViewSetMixin, QuerySetMixin, ModelViewSet
+):
     """API endpoint for listing and updating sources."""
 
     serializer_class = SourceSerializer
@@ -100,7 +113,13 @@ class SourceViewSet(NestedViewSetMixin, QuerySetMixin, ModelViewSet):
                     source.last_refresh_task_ref,
                 )
 
-        result = django_rq.enqueue(refresh_task, source.tenant_id, source.id)
+        result = queues.enqueue(
+            refresh_task,
+            source.tenant_id,
+            source.id,
+            owner=source,
+            user=request.user,
+        )
         logger.info("Refresh job id is %s", result.id)
 
         source.last_refresh_task_ref = result.id
@@ -113,9 +132,22 @@ class SourceViewSet(NestedViewSetMixin, QuerySetMixin, ModelViewSet):
 @extend_schema_view(
     retrieve=extend_schema(
         description="Get an existing inventory service plan",
+        parameters=[FIELDS_PARAMETER],
     ),
     list=extend_schema(
         description="List all inventory service plans",
+        parameters=[
+            OpenApiParameter(
+                "extra",
+                required=False,
+                enum=["true", "false"],
+                description=(
+                    "Include the create and update JSON schemas, left out"
+                    " of the list by default"
+                ),
+            ),
+            FIELDS_PARAMETER,
+        ],
     ),
 )
 class InventoryServicePlanViewSet(
@@ -162,6 +194,51 @@ class ServiceOfferingViewSet(NestedViewSetMixin, QuerySetMixin, ModelViewSet):
     parent_field_names = ("source",)
     http_method_names = ["get", "head"]
 
+    @extend_schema(
+        description=(
+            "List the service offerings whose name starts with the given"
+            " prefix, for completion while typing"
+        ),
+        parameters=[
+            OpenApiParameter(
+                "prefix",
+                required=True,
+                description="Beginning of the name, case-insensitive",
+            ),
+            OpenApiParameter(
+                "limit",
+                OpenApiTypes.INT,
+                required=False,
+                description=(
+                    "Maximum number of service offerings, defaults to"
+                    f" {TYPEAHEAD_LIMIT}"
+                ),
+            ),
+        ],
+        responses={200: ServiceOfferingTypeaheadSerializer(many=True)},
+    )
+    @action(methods=["get"], detail=False, pagination_class=None)
+    def typeahead(self, request, *args, **kwargs):
+        prefix = request.GET.get("prefix", "").strip()
+        if not prefix:
+            raise ValidationError({"prefix": _("This field is required.")})
+        try:
+            limit = int(request.GET.get("limit", TYPEAHEAD_LIMIT))
+        except ValueError:
+            raise ValidationError({"limit": _("A valid integer is required.")})
+        limit = max(1, min(limit, MAX_TYPEAHEAD_LIMIT))
+
+        service_offerings = (
+            self.filter_queryset(self.get_queryset())
+            .filter(name__istartswith=prefix)
+            .only("id", "name")
+            .order_by("name", "id")[:limit]
+        )
+        serializer = ServiceOfferingTypeaheadSerializer(
+            service_offerings, many=True
+        )
+        return Response(serializer.data)
+
 
 @extend_schema_view(
     retrieve=extend_schema(
@@ -201,9 +278,22 @@ class ServiceInventoryViewSet(
 @extend_schema_view(
     retrieve=extend_schema(
         description="Get an existing service instance",
+        parameters=[FIELDS_PARAMETER],
     ),
     list=extend_schema(
         description="List all service instances",
+        parameters=[
+            OpenApiParameter(
+                "extra",
+                required=False,
+                enum=["true", "false"],
+                description=(
+                    "Include the extra data of the instances, left out of"
+                    " the list by default"
+                ),
+            ),
+            FIELDS_PARAMETER,
+        ],
     ),
 )
 class ServiceInstanceViewSet(QuerySetMixin, ModelViewSet):
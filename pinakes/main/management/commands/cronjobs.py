@@ -5,6 +5,8 @@ from django.conf import settings
 import django_rq
 from django_rq.management.commands import rqscheduler
 
+from pinakes.common import queues
+
 scheduler = django_rq.get_scheduler()
 logger = logging.getLogger("rq.worker")
 
@@ -29,6 +31,7 @@ class Command(rqscheduler.Command):
             scheduler.enqueue_at(
                 datetime.utcnow(),
                 job,
+                queue_name=queues.get_queue_name(job),
             )
 
         logger.info("Start to schedule cron jobs defined in settings:")
@@ -36,10 +39,13 @@ class Command(rqscheduler.Command):
         for cronjob in settings.RQ_CRONJOBS:
             if type(cronjob) is dict:  # with params
                 args = []
-                options = cronjob
+                options = {
+                    "queue_name": queues.get_queue_name(cronjob["func"]),
+                    **cronjob,
+                }
             else:
                 args = cronjob
-                options = {}
+                options = {"queue_name": queues.get_queue_name(cronjob[1])}
 
             job = scheduler.cron(*args, **options)
             logger.info("Job {} is scheduled".format(job))
@@ -0,0 +1,104 @@
+import io
+import time
+
+from django.core.management import BaseCommand
+from django.test import RequestFactory
+from rest_framework import parsers, renderers
+
+from pinakes.common.fields import MetadataField
+from pinakes.common.parsers import ORJSONParser
+from pinakes.common.renderers import ORJSONRenderer
+from pinakes.main.catalog.models import Order, ServicePlan
+from pinakes.main.catalog.serializers import (
+    OrderSerializer,
+    ServicePlanSerializer,
+)
+from pinakes.main.inventory.models import InventoryServicePlan
+from pinakes.main.inventory.serializers import InventoryServicePlanSerializer
+
+
+class _OrderSerializer(OrderSerializer):
+    # The user capabilities need Keycloak, which is not what is measured
+    metadata = MetadataField(user_capabilities_field=None)
+
+
+DATASETS = (
+    ("orders", _OrderSerializer, Order.objects.all),
+    ("service_plans", ServicePlanSerializer, ServicePlan.objects.all),
+    (
+        "inventory_plans",
+        InventoryServicePlanSerializer,
+        InventoryServicePlan.objects.all,
+    ),
+)
+
+
+def _best(func, arg, repeat):
+    """Best time of the calls of func(arg) in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(arg)
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def _parse(parser):
+    return lambda content: parser.parse(io.BytesIO(content))
+
+
+class Command(BaseCommand):
+    """Compare the JSON renderers and parsers on the API output"""
+
+    help = (
+        "Render and parse the serialized orders (with extra=true), service"
+        " plans and inventory service plans of the database with the DRF"
+        " and the orjson based JSON renderers and parsers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=100,
+            help="Number of objects serialized per dataset",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Number of timed runs, the best one is reported",
+        )
+
+    def handle(self, *args, **options):
+        request = RequestFactory().get("/", {"extra": "true"})
+        renderer, fast_renderer = renderers.JSONRenderer(), ORJSONRenderer()
+        parser, fast_parser = parsers.JSONParser(), ORJSONParser()
+        repeat = options["repeat"]
+
+        self.stdout.write(
+            f"{'DATASET':<16}{'OBJECTS':>8}{'BYTES':>10}"
+            f"{'RENDER(ms)':>12}{'ORJSON(ms)':>12}"
+            f"{'PARSE(ms)':>12}{'ORJSON(ms)':>12}"
+        )
+        for name, serializer_class, queryset in DATASETS:
+            serializer = serializer_class(
+                queryset()[: options["limit"]],
+                many=True,
+                context={"request": request},
+            )
+            data = serializer.data
+            content = renderer.render(data)
+            if fast_renderer.render(data) != content:
+                self.stderr.write(f"{name}: the renderers output differs")
+
+            timings = (
+                _best(renderer.render, data, repeat),
+                _best(fast_renderer.render, data, repeat),
+                _best(_parse(parser), content, repeat),
+                _best(_parse(fast_parser), content, repeat),
+            )
+            self.stdout.write(
+                f"{name:<16}{len(data):>8}{len(content):>10}"
+                + "".join(f"{timing:>12.2f}" for timing in timings)
+            )
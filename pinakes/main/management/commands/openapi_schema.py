@@ -0,0 +1,34 @@
+import os
+
+from django.core.management import BaseCommand
+
+from pinakes.common import openapi
+
+
+class Command(BaseCommand):
+    """Generate the OpenAPI schema of the version of the code"""
+
+    help = (
+        "Write the OpenAPI schema of the version in about.yml to"
+        " PINAKES_OPENAPI_SCHEMA_ROOT, where the API serves it from, unless"
+        " the schema of this version exists already."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            dest="force",
+            default=False,
+            help="Generate the schema even if it exists",
+        )
+
+    def handle(self, *args, **options):
+        version = openapi.get_code_version()
+        path = openapi.get_schema_path(version)
+        if os.path.exists(path) and not options["force"]:
+            self.stdout.write(f"The schema of version {version} exists")
+            return
+
+        openapi.write_schema(version)
+        self.stdout.write(f"Wrote the schema of version {version} to {path}")
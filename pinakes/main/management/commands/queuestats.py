@@ -0,0 +1,37 @@
+import json
+
+from django.core.management import BaseCommand
+
+from pinakes.common import queues
+
+
+class Command(BaseCommand):
+    """Show depth and latency of the RQ queues"""
+
+    help = "Show depth and latency of every RQ queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            dest="json",
+            default=False,
+            help="Output the statistics as JSON",
+        )
+
+    def handle(self, *args, **options):
+        stats = queues.get_queue_stats()
+        if options["json"]:
+            self.stdout.write(json.dumps(stats))
+            return
+
+        self.stdout.write(
+            f"{'QUEUE':<16}{'QUEUED':>8}{'STARTED':>9}{'FAILED':>8}"
+            f"{'LATENCY(s)':>12}"
+        )
+        for item in stats:
+            self.stdout.write(
+                f"{item['name']:<16}{item['queued']:>8}"
+                f"{item['started']:>9}{item['failed']:>8}"
+                f"{item['latency']:>12.1f}"
+            )
@@ -0,0 +1,27 @@
+from django.conf import settings
+from django_rq.management.commands import rqworker
+
+
+class Command(rqworker.Command):
+    """Run an RQ worker for a lane of queues defined in settings"""
+
+    help = (
+        "Run an RQ worker on the given queues or on the queues of a lane "
+        "defined in RQ_WORKER_LANES, in priority order."
+    )
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--lane",
+            action="store",
+            dest="lane",
+            default="all",
+            choices=sorted(settings.RQ_WORKER_LANES),
+            help="Lane of queues to work on",
+        )
+
+    def handle(self, *args, **options):
+        lane = options.pop("lane")
+        queue_names = args or settings.RQ_WORKER_LANES[lane]
+        super().handle(*queue_names, **options)
@@ -0,0 +1,134 @@
+# Generated by Django 4.0.10 on 2026-10-19 11:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0052_alter_workflow_options_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Task",
+            fields=[
+                (
+                    "id",
+                    models.CharField(
+                        help_text=(
+                            "Task id that can be used to track the progress"
+                        ),
+                        max_length=64,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "func_name",
+                    models.CharField(
+                        help_text="Name of the task function", max_length=255
+                    ),
+                ),
+                (
+                    "queue",
+                    models.CharField(
+                        help_text="Name of the queue the task is routed to",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "Queued"),
+                            ("deferred", "Deferred"),
+                            ("scheduled", "Scheduled"),
+                            ("started", "Started"),
+                            ("finished", "Finished"),
+                            ("failed", "Failed"),
+                            ("stopped", "Stopped"),
+                            ("canceled", "Canceled"),
+                        ],
+                        default="queued",
+                        help_text="Status of the task",
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "owner_type",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="Type of the object the task works on",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "owner_id",
+                    models.BigIntegerField(
+                        help_text="ID of the object the task works on",
+                        null=True,
+                    ),
+                ),
+                (
+                    "result",
+                    models.JSONField(
+                        help_text="Summary of the task result", null=True
+                    ),
+                ),
+                (
+                    "error",
+                    models.TextField(
+                        blank=True,
+                        default="",
+                        help_text="Error of a failed task",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="The time at which the task was created",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        help_text=(
+                            "The time at which the task was last updated"
+                        ),
+                    ),
+                ),
+                (
+                    "started_at",
+                    models.DateTimeField(
+                        help_text="The time at which the task was started",
+                        null=True,
+                    ),
+                ),
+                (
+                    "ended_at",
+                    models.DateTimeField(
+                        help_text="The time at which the task was ended",
+                        null=True,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["owner_type", "owner_id"],
+                name="main_task_owner_t_740e8e_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["status", "updated_at"],
+                name="main_task_status_f43548_idx",
+            ),
+        ),
+    ]
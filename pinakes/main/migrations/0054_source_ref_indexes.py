@@ -0,0 +1,127 @@
+# Generated by Django 4.0.10 on 2026-10-19 11:24
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+from pinakes.common.migration_operations import (
+    AddIndexConcurrently,
+    AddUniqueConstraintConcurrently,
+)
+
+# Models made unique on (source_ref, source), with the fields of other
+# models referencing their ids as strings
+UNIQUE_SOURCE_REF_MODELS = {
+    "inventoryserviceplan": (
+        ("serviceplan", "inventory_service_plan_ref"),
+        ("orderitem", "inventory_service_plan_ref"),
+    ),
+    "serviceinventory": (),
+    "serviceoffering": (
+        ("portfolioitem", "service_offering_ref"),
+        ("serviceplan", "service_offering_ref"),
+    ),
+    "serviceofferingnode": (),
+}
+
+
+def remove_duplicate_source_refs(apps, schema_editor):
+    """Keep the last imported object of each source reference.
+
+    The references to the removed objects are moved to the kept one.
+    """
+    for model_name, string_refs in UNIQUE_SOURCE_REF_MODELS.items():
+        model = apps.get_model("main", model_name)
+        duplicates = list(
+            model.objects.values("source_id", "source_ref")
+            .annotate(kept_id=Max("id"), count=Count("id"))
+            .filter(count__gt=1)
+            .order_by()
+        )
+        for duplicate in duplicates:
+            kept_id = duplicate["kept_id"]
+            removed_ids = list(
+                model.objects.filter(
+                    source_id=duplicate["source_id"],
+                    source_ref=duplicate["source_ref"],
+                )
+                .exclude(id=kept_id)
+                .values_list("id", flat=True)
+            )
+            for relation in model._meta.related_objects:
+                if not relation.one_to_many:
+                    continue
+                field = relation.field
+                relation.related_model.objects.filter(
+                    **{f"{field.attname}__in": removed_ids}
+                ).update(**{field.attname: kept_id})
+            for ref_model_name, ref_field in string_refs:
+                apps.get_model("main", ref_model_name).objects.filter(
+                    **{f"{ref_field}__in": [str(id) for id in removed_ids]}
+                ).update(**{ref_field: str(kept_id)})
+            model.objects.filter(id__in=removed_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("main", "0053_task"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="approvalrequest",
+            index=models.Index(
+                fields=["approval_request_ref"],
+                name="main_approv_approva_5dca37_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="serviceinstance",
+            index=models.Index(
+                fields=["source_ref", "source"],
+                name="main_servic_source__2dbdcc_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="serviceplan",
+            index=models.Index(
+                fields=["inventory_service_plan_ref"],
+                name="main_servic_invento_253823_idx",
+            ),
+        ),
+        migrations.RunPython(
+            remove_duplicate_source_refs,
+            migrations.RunPython.noop,
+            atomic=True,
+        ),
+        AddUniqueConstraintConcurrently(
+            model_name="inventoryserviceplan",
+            constraint=models.UniqueConstraint(
+                fields=("source_ref", "source"),
+                name="main_inventoryserviceplan_source_ref_unique",
+            ),
+        ),
+        AddUniqueConstraintConcurrently(
+            model_name="serviceinventory",
+            constraint=models.UniqueConstraint(
+                fields=("source_ref", "source"),
+                name="main_serviceinventory_source_ref_unique",
+            ),
+        ),
+        AddUniqueConstraintConcurrently(
+            model_name="serviceoffering",
+            constraint=models.UniqueConstraint(
+                fields=("source_ref", "source"),
+                name="main_serviceoffering_source_ref_unique",
+            ),
+        ),
+        AddUniqueConstraintConcurrently(
+            model_name="serviceofferingnode",
+            constraint=models.UniqueConstraint(
+                fields=("source_ref", "source"),
+                name="main_serviceofferingnode_source_ref_unique",
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.0.10 on 2026-10-19 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0054_source_ref_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="order",
+            name="state",
+            field=models.CharField(
+                choices=[
+                    ("Approval Pending", "Pending"),
+                    ("Approved", "Approved"),
+                    ("Canceled", "Canceled"),
+                    ("Completed", "Completed"),
+                    ("Created", "Created"),
+                    ("Denied", "Denied"),
+                    ("Failed", "Failed"),
+                    ("Ordered", "Ordered"),
+                    ("Submitting", "Submitting"),
+                ],
+                default="Created",
+                editable=False,
+                help_text="Current state of the order",
+                max_length=20,
+            ),
+        ),
+    ]
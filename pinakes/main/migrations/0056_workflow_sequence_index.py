@@ -0,0 +1,20 @@
+# Generated by Django 4.0.10 on 2026-10-19 11:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0055_order_submitting_state"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="workflow",
+            index=models.Index(
+                fields=["tenant", "internal_sequence"],
+                name="main_workfl_tenant__7747b6_idx",
+            ),
+        ),
+    ]
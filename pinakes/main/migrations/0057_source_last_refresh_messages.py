@@ -0,0 +1,23 @@
+# Generated by Django 4.0.10 on 2026-10-19 11:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0056_workflow_sequence_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="source",
+            name="last_refresh_messages",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                help_text="The summary of the last source refresh by language",
+            ),
+        ),
+    ]
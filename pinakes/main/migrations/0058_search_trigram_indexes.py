@@ -0,0 +1,119 @@
+# Generated by Django 4.0.10 on 2026-10-19 12:34
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+from django.db.models.functions import Cast, Upper
+
+from pinakes.common.migration_operations import AddPostgresIndexConcurrently
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("main", "0057_source_last_refresh_messages"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddPostgresIndexConcurrently(
+            model_name="portfolio",
+            index=GinIndex(
+                OpClass(
+                    Upper(Cast("name", output_field=models.TextField())),
+                    name="gin_trgm_ops",
+                ),
+                name="main_portfolio_name_trgm",
+            ),
+        ),
+        AddPostgresIndexConcurrently(
+            model_name="portfolio",
+            index=GinIndex(
+                OpClass(
+                    Upper(
+                        Cast("description", output_field=models.TextField())
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="main_portfolio_desc_trgm",
+            ),
+        ),
+        AddPostgresIndexConcurrently(
+            model_name="portfolioitem",
+            index=GinIndex(
+                OpClass(
+                    Upper(Cast("name", output_field=models.TextField())),
+                    name="gin_trgm_ops",
+                ),
+                name="main_portfolioitem_name_trgm",
+            ),
+        ),
+        AddPostgresIndexConcurrently(
+            model_name="portfolioitem",
+            index=GinIndex(
+                OpClass(
+                    Upper(
+                        Cast("description", output_field=models.TextField())
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="main_portfolioitem_desc_trgm",
+            ),
+        ),
+        AddPostgresIndexConcurrently(
+            model_name="request",
+            index=GinIndex(
+                OpClass(
+                    Upper(Cast("name", output_field=models.TextField())),
+                    name="gin_trgm_ops",
+                ),
+                name="main_request_name_trgm",
+            ),
+        ),
+        AddPostgresIndexConcurrently(
+            model_name="request",
+            index=GinIndex(
+                OpClass(
+                    Upper(
+                        Cast("description", output_field=models.TextField())
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="main_request_desc_trgm",
+            ),
+        ),
+        AddPostgresIndexConcurrently(
+            model_name="request",
+            index=GinIndex(
+                OpClass(
+                    Upper(Cast("reason", output_field=models.TextField())),
+                    name="gin_trgm_ops",
+                ),
+                name="main_request_reason_trgm",
+            ),
+        ),
+        AddPostgresIndexConcurrently(
+            model_name="serviceoffering",
+            index=GinIndex(
+                OpClass(
+                    Upper(Cast("name", output_field=models.TextField())),
+                    name="gin_trgm_ops",
+                ),
+                name="main_serviceoffering_name_trgm",
+            ),
+        ),
+        AddPostgresIndexConcurrently(
+            model_name="serviceoffering",
+            index=GinIndex(
+                OpClass(
+                    Upper(
+                        Cast("description", output_field=models.TextField())
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="main_serviceoffering_desc_trgm",
+            ),
+        ),
+    ]
@@ -0,0 +1,202 @@
+# Generated by Django 4.0.10 on 2026-10-19 12:48
+
+from django.db import migrations, models
+import django.db.models.deletion
+import taggit.managers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("taggit", "0005_auto_20220424_2025"),
+        ("main", "0058_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaggedPortfolio",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="TaggedPortfolioItem",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="TaggedServiceInventory",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.AlterField(
+            model_name="portfolio",
+            name="tags",
+            field=taggit.managers.TaggableManager(
+                help_text="A comma-separated list of tags.",
+                through="main.TaggedPortfolio",
+                to="taggit.Tag",
+                verbose_name="Tags",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="portfolioitem",
+            name="tags",
+            field=taggit.managers.TaggableManager(
+                help_text="A comma-separated list of tags.",
+                through="main.TaggedPortfolioItem",
+                to="taggit.Tag",
+                verbose_name="Tags",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="serviceinventory",
+            name="tags",
+            field=taggit.managers.TaggableManager(
+                help_text="A comma-separated list of tags.",
+                through="main.TaggedServiceInventory",
+                to="taggit.Tag",
+                verbose_name="Tags",
+            ),
+        ),
+        migrations.AddField(
+            model_name="taggedserviceinventory",
+            name="content_object",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="ID of the tagged service inventory",
+                on_delete=django.db.models.deletion.CASCADE,
+                to="main.serviceinventory",
+            ),
+        ),
+        migrations.AddField(
+            model_name="taggedserviceinventory",
+            name="tag",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="ID of the tag",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="%(app_label)s_%(class)s_items",
+                to="taggit.tag",
+            ),
+        ),
+        migrations.AddField(
+            model_name="taggedportfolioitem",
+            name="content_object",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="ID of the tagged portfolio item",
+                on_delete=django.db.models.deletion.CASCADE,
+                to="main.portfolioitem",
+            ),
+        ),
+        migrations.AddField(
+            model_name="taggedportfolioitem",
+            name="tag",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="ID of the tag",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="%(app_label)s_%(class)s_items",
+                to="taggit.tag",
+            ),
+        ),
+        migrations.AddField(
+            model_name="taggedportfolio",
+            name="content_object",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="ID of the tagged portfolio",
+                on_delete=django.db.models.deletion.CASCADE,
+                to="main.portfolio",
+            ),
+        ),
+        migrations.AddField(
+            model_name="taggedportfolio",
+            name="tag",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="ID of the tag",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="%(app_label)s_%(class)s_items",
+                to="taggit.tag",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="taggedserviceinventory",
+            index=models.Index(
+                fields=["tag", "content_object"],
+                name="main_taggedserviceinv_tag",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="taggedserviceinventory",
+            constraint=models.UniqueConstraint(
+                fields=("content_object", "tag"),
+                name="main_taggedserviceinventory_unique",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="taggedportfolioitem",
+            index=models.Index(
+                fields=["tag", "content_object"],
+                name="main_taggedportfolioitem_tag",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="taggedportfolioitem",
+            constraint=models.UniqueConstraint(
+                fields=("content_object", "tag"),
+                name="main_taggedportfolioitem_unique",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="taggedportfolio",
+            index=models.Index(
+                fields=["tag", "content_object"],
+                name="main_taggedportfolio_tag",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="taggedportfolio",
+            constraint=models.UniqueConstraint(
+                fields=("content_object", "tag"),
+                name="main_taggedportfolio_unique",
+            ),
+        ),
+    ]
@@ -0,0 +1,83 @@
+from django.db import migrations
+
+TAGGED_MODELS = (
+    ("portfolio", "TaggedPortfolio"),
+    ("portfolioitem", "TaggedPortfolioItem"),
+    ("serviceinventory", "TaggedServiceInventory"),
+)
+BATCH_SIZE = 1000
+
+
+def move_tagged_items(apps, schema_editor):
+    """Move the tags from the generic table to the tables of the models"""
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    TaggedItem = apps.get_model("taggit", "TaggedItem")
+    db_alias = schema_editor.connection.alias
+
+    for model_name, through_name in TAGGED_MODELS:
+        content_type = (
+            ContentType.objects.using(db_alias)
+            .filter(app_label="main", model=model_name)
+            .first()
+        )
+        if content_type is None:
+            continue
+
+        model = apps.get_model("main", model_name)
+        through = apps.get_model("main", through_name)
+        items = TaggedItem.objects.using(db_alias).filter(
+            content_type=content_type
+        )
+        # The generic table may keep the tags of deleted objects
+        object_ids = set(
+            model.objects.using(db_alias)
+            .filter(id__in=items.values("object_id"))
+            .values_list("id", flat=True)
+        )
+        through.objects.using(db_alias).bulk_create(
+            (
+                through(content_object_id=item.object_id, tag_id=item.tag_id)
+                for item in items.iterator()
+                if item.object_id in object_ids
+            ),
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        items.delete()
+
+
+def restore_tagged_items(apps, schema_editor):
+    """Move the tags back to the generic table"""
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    TaggedItem = apps.get_model("taggit", "TaggedItem")
+    db_alias = schema_editor.connection.alias
+
+    for model_name, through_name in TAGGED_MODELS:
+        content_type, _ = ContentType.objects.using(db_alias).get_or_create(
+            app_label="main", model=model_name
+        )
+        through = apps.get_model("main", through_name)
+        TaggedItem.objects.using(db_alias).bulk_create(
+            (
+                TaggedItem(
+                    content_type=content_type,
+                    object_id=item.content_object_id,
+                    tag_id=item.tag_id,
+                )
+                for item in through.objects.using(db_alias).iterator()
+            ),
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("main", "0059_tag_tables"),
+    ]
+
+    operations = [
+        migrations.RunPython(move_tagged_items, restore_tagged_items),
+    ]
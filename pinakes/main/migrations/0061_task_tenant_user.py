@@ -0,0 +1,36 @@
+# Generated by Django 4.0.10 on 2026-10-19 13:03
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("main", "0060_move_tagged_items"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="tenant",
+            field=models.ForeignKey(
+                help_text="ID of the tenant the task belongs to",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="main.tenant",
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="user",
+            field=models.ForeignKey(
+                help_text="ID of the user who started the task",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
@@ -0,0 +1,112 @@
+# Generated by Django 4.0.10 on 2026-10-19 13:17
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0061_task_tenant_user"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedProgressMessage",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="The time at which the object was created",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        help_text=(
+                            "The time at which " "the object was last updated"
+                        ),
+                    ),
+                ),
+                (
+                    "level",
+                    models.CharField(
+                        choices=[
+                            ("Info", "Info"),
+                            ("Error", "Error"),
+                            ("Warning", "Warning"),
+                            ("Debug", "Debug"),
+                        ],
+                        editable=False,
+                        help_text="One of the predefined levels",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "received_at",
+                    models.DateTimeField(
+                        editable=False, help_text="Message received at"
+                    ),
+                ),
+                (
+                    "message",
+                    models.TextField(
+                        blank=True, default="", help_text="The message content"
+                    ),
+                ),
+                (
+                    "messageable_type",
+                    models.CharField(
+                        editable=False,
+                        help_text=(
+                            "Identify order or order item "
+                            "that this message belongs to"
+                        ),
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "messageable_id",
+                    models.IntegerField(
+                        editable=False,
+                        help_text="ID of the order or order item",
+                    ),
+                ),
+                (
+                    "message_params",
+                    models.JSONField(
+                        help_text=(
+                            "Stores message parameters " "used by localization"
+                        ),
+                        null=True,
+                    ),
+                ),
+                (
+                    "tenant",
+                    models.ForeignKey(
+                        help_text="ID of the tenant the object belongs to",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="main.tenant",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="archivedprogressmessage",
+            index=models.Index(
+                fields=["tenant", "messageable_id", "messageable_type"],
+                name="main_archiv_tenant__2ad1d0_idx",
+            ),
+        ),
+    ]
@@ -5,6 +5,7 @@ from django.db.models.functions import Length
 from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_noop
 from drf_spectacular.utils import extend_schema_field, OpenApiTypes
+from taggit.models import Tag, TaggedItemBase
 
 models.CharField.register_lookup(Length)
 
@@ -122,6 +123,12 @@ class Source(models.Model):
         default=dict,
         help_text="The result stats for the last source refresh",
     )
+    last_refresh_messages = models.JSONField(
+        blank=True,
+        default=dict,
+        editable=False,
+        help_text="The summary of the last source refresh by language",
+    )
     availability_status = models.TextField(
         blank=True,
         default="unavailable",
@@ -222,3 +229,29 @@ class ImageableModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class TaggedObject(TaggedItemBase):
+    """Tag of an object, kept in a table of the model of the object.
+
+    Subclasses define content_object, the foreign key of the tagged
+    object, and an index on (tag, content_object) for the lookups of the
+    objects by tag.
+    """
+
+    tag = models.ForeignKey(
+        Tag,
+        related_name="%(app_label)s_%(class)s_items",
+        on_delete=models.CASCADE,
+        db_index=False,
+        help_text="ID of the tag",
+    )
+
+    class Meta:
+        abstract = True
+        constraints = [
+            models.UniqueConstraint(
+                name="%(app_label)s_%(class)s_unique",
+                fields=["content_object", "tag"],
+            )
+        ]
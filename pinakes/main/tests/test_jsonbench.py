@@ -0,0 +1,39 @@
+import io
+
+import pytest
+from django.core.management import call_command
+
+from pinakes.main.catalog.tests.factories import (
+    OrderItemFactory,
+    ServicePlanFactory,
+)
+from pinakes.main.inventory.tests.factories import (
+    InventoryServicePlanFactory,
+)
+
+SCHEMA = {
+    "schemaType": "default",
+    "fields": [
+        {"name": f"field_{i}", "label": "Field ü", "component": "text-field"}
+        for i in range(20)
+    ],
+}
+
+
+@pytest.mark.django_db
+def test_jsonbench():
+    OrderItemFactory.create_batch(3)
+    ServicePlanFactory.create_batch(2, base_schema=SCHEMA)
+    InventoryServicePlanFactory(create_json_schema=SCHEMA)
+    out, err = io.StringIO(), io.StringIO()
+
+    call_command("jsonbench", "--repeat=2", stdout=out, stderr=err)
+
+    lines = out.getvalue().splitlines()
+    assert lines[0].split()[0] == "DATASET"
+    assert [line.split()[:2] for line in lines[1:]] == [
+        ["orders", "3"],
+        ["service_plans", "2"],
+        ["inventory_plans", "1"],
+    ]
+    assert err.getvalue() == ""
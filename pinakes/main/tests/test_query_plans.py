@@ -0,0 +1,145 @@
+"""Query plan regression tests for the hot source reference lookups"""
+import re
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from pinakes.main.catalog.models import ApprovalRequest, Order, ServicePlan
+from pinakes.main.catalog.tests.factories import PortfolioItemFactory
+from pinakes.main.inventory.models import (
+    InventoryServicePlan,
+    ServiceInstance,
+    ServiceInventory,
+    ServiceOffering,
+    ServiceOfferingNode,
+)
+from pinakes.main.inventory.tests.factories import SourceFactory
+from pinakes.main.tests.factories import default_tenant
+
+FIXTURE_SIZE = 500
+
+
+def get_index_columns(table, index):
+    """Return the columns of an index, in order"""
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            constraints = connection.introspection.get_constraints(
+                cursor, table
+            )
+            return constraints[index]["columns"]
+        cursor.execute(
+            f"PRAGMA index_info({connection.ops.quote_name(index)})"
+        )
+        return [name for _seqno, _cid, name in sorted(cursor.fetchall())]
+
+
+def assert_index_scan(queryset, *columns):
+    """Fail unless the query plan reads the table through an index on
+    the columns, and not e.g. through the index of a foreign key"""
+    plan = queryset.explain()
+    table = queryset.model._meta.db_table
+    if connection.vendor == "postgresql":
+        match = re.search(r"Index (?:Only )?Scan (?:using|on) (\w+)", plan)
+    else:
+        match = re.search(
+            rf"SEARCH {table} USING (?:COVERING )?INDEX (\w+)", plan
+        )
+    assert match, plan
+    assert get_index_columns(table, match.group(1)) == list(columns), plan
+
+
+@pytest.fixture
+def tower_objects():
+    tenant = default_tenant()
+    source = SourceFactory()
+    now = timezone.now()
+    common = {
+        "tenant": tenant,
+        "source": source,
+        "source_created_at": now,
+        "source_updated_at": now,
+    }
+    for model, fields in (
+        (ServiceInventory, {"name": "inventory", "extra": {}}),
+        (ServiceOffering, {"name": "offering", "extra": {}}),
+        (ServiceOfferingNode, {"extra": {}}),
+        (
+            InventoryServicePlan,
+            {"name": "plan", "extra": {}, "create_json_schema": {}},
+        ),
+        (ServiceInstance, {"name": "instance", "extra": {}}),
+    ):
+        model.objects.bulk_create(
+            model(source_ref=str(i), **common, **fields)
+            for i in range(FIXTURE_SIZE)
+        )
+
+    portfolio_item = PortfolioItemFactory()
+    ServicePlan.objects.bulk_create(
+        ServicePlan(
+            tenant=tenant,
+            portfolio_item=portfolio_item,
+            inventory_service_plan_ref=str(i),
+        )
+        for i in range(FIXTURE_SIZE)
+    )
+    orders = Order.objects.bulk_create(
+        Order(tenant=tenant) for _ in range(FIXTURE_SIZE)
+    )
+    ApprovalRequest.objects.bulk_create(
+        ApprovalRequest(
+            tenant=tenant, order=order, approval_request_ref=str(i)
+        )
+        for i, order in enumerate(orders)
+    )
+
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    return source
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "model",
+    [
+        ServiceInventory,
+        ServiceOffering,
+        ServiceOfferingNode,
+        InventoryServicePlan,
+        ServiceInstance,
+    ],
+)
+def test_source_ref_lookup(tower_objects, model):
+    assert_index_scan(
+        model.objects.filter(source_ref="1234", source=tower_objects),
+        "source_ref",
+        "source_id",
+    )
+
+
+@pytest.mark.django_db
+def test_service_offering_launch_lookup(tower_objects):
+    assert_index_scan(
+        ServiceOffering.objects.filter(source_ref="1234"),
+        "source_ref",
+        "source_id",
+    )
+
+
+@pytest.mark.django_db
+def test_service_plan_ref_lookup(tower_objects):
+    assert_index_scan(
+        ServicePlan.objects.filter(inventory_service_plan_ref="1234"),
+        "inventory_service_plan_ref",
+    )
+
+
+@pytest.mark.django_db
+def test_approval_request_ref_lookup(tower_objects):
+    assert_index_scan(
+        ApprovalRequest.objects.filter(approval_request_ref="1234"),
+        "approval_request_ref",
+    )
@@ -69,6 +69,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "pinakes.common.profiling.ProfilingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.security.SecurityMiddleware",
@@ -78,6 +79,7 @@ MIDDLEWARE = [
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "pinakes.common.auth.middleware.KeycloakAuthMiddleware",
+    "pinakes.common.db.router.ReplicaMiddleware",
 ]
 
 ROOT_URLCONF = "pinakes.urls"
@@ -108,12 +110,23 @@ WSGI_APPLICATION = "pinakes.wsgi.application"
 
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": "pinakes.common.db.postgresql",
         "NAME": env.str("PINAKES_DATABASE_NAME", default="catalog"),
         "USER": env.str("PINAKES_POSTGRES_USER", default="catalog"),
         "PASSWORD": env.str("PINAKES_POSTGRES_PASSWORD", default="password"),
         "HOST": env.str("PINAKES_POSTGRES_HOST", default="localhost"),
         "PORT": env.str("PINAKES_POSTGRES_PORT", default="5432"),
+        # Seconds a connection is kept open for the next requests,
+        # 0 closes it at the end of every request
+        "CONN_MAX_AGE": env.int("PINAKES_POSTGRES_CONN_MAX_AGE", default=60),
+        # Check a reused connection before its first use in a request
+        "CONN_HEALTH_CHECKS": env.bool(
+            "PINAKES_POSTGRES_CONN_HEALTH_CHECKS", default=True
+        ),
+        # Connections shared by the threads of a process, 0 disables the
+        # pool. Use it with CONN_MAX_AGE 0 for threaded or async workers.
+        "POOL_SIZE": env.int("PINAKES_POSTGRES_POOL_SIZE", default=0),
+        "POOL_TIMEOUT": env.float("PINAKES_POSTGRES_POOL_TIMEOUT", default=10),
         "OPTIONS": {
             "sslmode": env.str("PINAKES_POSTGRES_SSL_MODE", default="require"),
             "sslcert": env.str("PINAKES_POSTGRES_SSL_CERT", default=""),
@@ -125,12 +138,48 @@ DATABASES = {
     }
 }
 
+# Optional read replica of the default database, see
+# pinakes.common.db.router for the reads it serves
+if env.str("PINAKES_REPLICA_POSTGRES_HOST", default=""):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": env.str("PINAKES_REPLICA_POSTGRES_HOST"),
+        "PORT": env.str(
+            "PINAKES_REPLICA_POSTGRES_PORT",
+            default=DATABASES["default"]["PORT"],
+        ),
+        "OPTIONS": dict(DATABASES["default"]["OPTIONS"]),
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["pinakes.common.db.router.ReplicaRouter"]
+
+# Seconds the replica may lag behind before reads go to the primary
+PINAKES_REPLICA_MAX_LAG = env.float("PINAKES_REPLICA_MAX_LAG", default=5)
+# Seconds between two checks of the replica lag
+PINAKES_REPLICA_LAG_CHECK_INTERVAL = env.float(
+    "PINAKES_REPLICA_LAG_CHECK_INTERVAL", default=5
+)
+# Seconds a client reads from the primary after changing something
+PINAKES_REPLICA_PIN_SECONDS = env.int(
+    "PINAKES_REPLICA_PIN_SECONDS", default=10
+)
+
 # REST Framework configuration
 REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": (
         "pinakes.common.pagination.CatalogPageNumberPagination"
     ),
     "PAGE_SIZE": 25,
+    "DEFAULT_RENDERER_CLASSES": (
+        "pinakes.common.profiling.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "pinakes.common.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "pinakes.common.auth.keycloak_django.authentication.KeycloakSessionAuthentication",  # noqa
         "pinakes.common.auth.keycloak_django.authentication.KeycloakBearerOfflineAuthentication",  # noqa
@@ -139,7 +188,7 @@ REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": (
         "django_filters.rest_framework.DjangoFilterBackend",
         "rest_framework.filters.OrderingFilter",
-        "rest_framework.filters.SearchFilter",
+        "pinakes.common.search.TrigramSearchFilter",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "EXCEPTION_HANDLER": (
@@ -320,23 +369,94 @@ LOGGING = {
 
 LOGIN_URL = "/login/keycloak/"
 
+# Fraction of API requests and background jobs to profile, between 0 and 1
+PINAKES_PROFILING_SAMPLE_RATE = env.float(
+    "PINAKES_PROFILING_SAMPLE_RATE", default=0.0
+)
+
 # Django Redis Queue Information
 if "PINAKES_REDIS_UNIX_SOCKET_PATH" in env:
-    RQ_QUEUES = {
-        "default": {
-            "UNIX_SOCKET_PATH": env.str("PINAKES_REDIS_UNIX_SOCKET_PATH"),
-        },
+    RQ_CONNECTION = {
+        "UNIX_SOCKET_PATH": env.str("PINAKES_REDIS_UNIX_SOCKET_PATH"),
     }
 else:
-    RQ_QUEUES = {
-        "default": {
-            "HOST": env.str("PINAKES_REDIS_HOST", default="localhost"),
-            "PORT": env.int("PINAKES_REDIS_PORT", default=6379),
-        },
+    RQ_CONNECTION = {
+        "HOST": env.str("PINAKES_REDIS_HOST", default="localhost"),
+        "PORT": env.int("PINAKES_REDIS_PORT", default=6379),
     }
 
-RQ_QUEUES["default"]["DB"] = env.int("PINAKES_REDIS_DB", default=0)
-RQ_QUEUES["default"]["DEFAULT_TIMEOUT"] = 360
+RQ_CONNECTION["DB"] = env.int("PINAKES_REDIS_DB", default=0)
+RQ_CONNECTION["DEFAULT_TIMEOUT"] = 360
+
+# The cache and the sessions use the Redis server of the queues
+if "UNIX_SOCKET_PATH" in RQ_CONNECTION:
+    REDIS_URL = "unix://{}?db={}".format(
+        RQ_CONNECTION["UNIX_SOCKET_PATH"], RQ_CONNECTION["DB"]
+    )
+else:
+    REDIS_URL = "redis://{}:{}/{}".format(
+        RQ_CONNECTION["HOST"], RQ_CONNECTION["PORT"], RQ_CONNECTION["DB"]
+    )
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+        "KEY_PREFIX": "pinakes",
+    }
+}
+
+SESSION_ENGINE = env.str(
+    "PINAKES_SESSION_ENGINE", default="django.contrib.sessions.backends.cache"
+)
+
+# Seconds a request waits for another request of the same user to refresh
+# its keycloak access token
+PINAKES_KEYCLOAK_REFRESH_LOCK_TIMEOUT = env.int(
+    "PINAKES_KEYCLOAK_REFRESH_LOCK_TIMEOUT", default=10
+)
+
+# Named queues, tasks are routed to them with pinakes.common.queues.
+# All queues share a single Redis connection.
+RQ_QUEUE_NAMES = (
+    "interactive",
+    "provisioning",
+    "default",
+    "sync",
+    "analytics",
+)
+RQ_QUEUES = {name: dict(RQ_CONNECTION) for name in RQ_QUEUE_NAMES}
+
+# Worker lanes, each lane is a list of queues in priority order.
+# Start a worker for a lane with `python manage.py worker --lane <lane>`.
+RQ_WORKER_LANES = {
+    "all": list(RQ_QUEUE_NAMES),
+    "interactive": ["interactive", "provisioning", "default"],
+    "background": ["sync", "analytics", "default"],
+}
+
+RQ = {
+    "WORKER_CLASS": "pinakes.main.common.worker.TaskIndexWorker",
+}
+
+# Maximum seconds a task status request may wait for a status change.
+# The waiting request holds a server thread, keep it short.
+PINAKES_TASK_POLL_MAX_WAIT = env.int("PINAKES_TASK_POLL_MAX_WAIT", default=2)
+# Days finished background tasks are kept in the task index
+PINAKES_TASK_INDEX_TTL_DAYS = env.int(
+    "PINAKES_TASK_INDEX_TTL_DAYS", default=30
+)
+
+# Days after an order finished before its progress messages are moved to
+# the archive and replaced by one summary message
+PINAKES_PROGRESS_MESSAGE_TTL_DAYS = env.int(
+    "PINAKES_PROGRESS_MESSAGE_TTL_DAYS", default=90
+)
+
+# Seconds an order event stream is kept open before the client reconnects
+PINAKES_ORDER_EVENTS_TIMEOUT = env.int(
+    "PINAKES_ORDER_EVENTS_TIMEOUT", default=60
+)
 
 # RQ Cron Jobs setting
 STARTUP_RQ_JOBS = [
@@ -357,6 +477,14 @@ RQ_CRONJOBS = [
         "* 0 * * *",
         "pinakes.main.common.tasks.clear_sessions",
     ),
+    (
+        "30 0 * * *",
+        "pinakes.main.common.tasks.prune_task_index",
+    ),
+    (
+        "45 0 * * *",
+        "pinakes.main.catalog.tasks.compact_progress_messages",
+    ),
 ]
 
 # Auto generation of openapi spec using Spectacular
@@ -398,6 +526,12 @@ SPECTACULAR_SETTINGS = {
     "SCHEMA_PATH_PREFIX": "/{}/v1".format(CATALOG_API_PATH_PREFIX.strip("/")),
 }
 
+# Serve the OpenAPI schema generated for the version in about.yml
+OPENAPI_SCHEMA_CACHE = env.bool("PINAKES_OPENAPI_SCHEMA_CACHE", not DEBUG)
+OPENAPI_SCHEMA_ROOT = env.str(
+    "PINAKES_OPENAPI_SCHEMA_ROOT", default=BASE_DIR / "schema"
+)
+
 SOCIAL_AUTH_JSONFIELD_ENABLED = True
 
 KEYCLOAK_URL = env.str(
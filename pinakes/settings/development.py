@@ -21,7 +21,8 @@ except ImportError:
     traceback.print_exc()
     sys.exit(1)
 
-# Use SQLite for unit tests instead of PostgreSQL
+# Use SQLite and a local memory cache for unit tests instead of PostgreSQL
+# and Redis
 if "pytest" in sys.modules:
     DATABASES = {
         "default": {
@@ -29,6 +30,11 @@ if "pytest" in sys.modules:
             "NAME": BASE_DIR / "catalog_test.db",
         },
     }
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    }
 
 ALLOWED_HOSTS = ["*"]
 CONTROLLER_VERIFY_SSL = "False"
@@ -19,11 +19,11 @@ from django.conf import settings
 from django.conf.urls.static import static
 from social_django import urls as social_urls
 from drf_spectacular.views import (
-    SpectacularJSONAPIView,
     SpectacularRedocView,
     SpectacularSwaggerView,
 )
 
+from pinakes.common.openapi import CachedSpectacularJSONAPIView
 from pinakes.main.auth import urls as auth_urls
 from pinakes.main.common import urls as common_urls
 from pinakes.main.catalog.urls import (
@@ -72,7 +72,7 @@ site_auth_urls = [
 urlpatterns = [
     path(
         f"{api_prefix}schema/openapi.json",
-        SpectacularJSONAPIView.as_view(),
+        CachedSpectacularJSONAPIView.as_view(),
         name="schema",
     ),
     path(
@@ -12,4 +12,4 @@ while true; do
 done
 
 echo -e "\e[34m >>> Starting worker \e[97m"
-python manage.py rqworker default
+python manage.py worker
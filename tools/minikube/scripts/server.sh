@@ -54,5 +54,18 @@ rm -rf "$PINAKES_STATIC_ROOT"
 echo -e "\e[34m >>> Collect static files \e[97m"
 python manage.py collectstatic
 
+echo -e "\e[34m >>> Generate the OpenAPI schema \e[97m"
+python manage.py openapi_schema
+
 echo -e "\e[34m >>> Start gunicorn server \e[97m"
-gunicorn --workers=${PINAKES_NUM_PROCS:-3} --bind 0.0.0.0:8000 pinakes.wsgi --log-level=debug
+if [[ "${PINAKES_SERVER_MODE:-wsgi}" == "asgi" ]]
+then
+    # Views run in threads of the event loop, which share pooled
+    # database connections
+    export ASGI_THREADS=${ASGI_THREADS:-${PINAKES_NUM_THREADS:-32}}
+    export PINAKES_POSTGRES_CONN_MAX_AGE=${PINAKES_POSTGRES_CONN_MAX_AGE:-0}
+    export PINAKES_POSTGRES_POOL_SIZE=${PINAKES_POSTGRES_POOL_SIZE:-${ASGI_THREADS}}
+    gunicorn --workers=${PINAKES_NUM_PROCS:-3} --worker-class=uvicorn.workers.UvicornWorker --bind 0.0.0.0:8000 pinakes.asgi:application --log-level=debug
+else
+    gunicorn --workers=${PINAKES_NUM_PROCS:-3} --threads=${PINAKES_NUM_THREADS:-8} --bind 0.0.0.0:8000 pinakes.wsgi --log-level=debug
+fi